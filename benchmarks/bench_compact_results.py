@@ -0,0 +1,101 @@
+"""
+Verbose vs compact hybrid mapping results: memory and serialization.
+
+Builds synthetic ensemble column matches (N columns x top_k candidates with
+four scores each) and compares in-memory size (tracemalloc), JSON dump time
+and size, and the npz size of the compact form.
+
+Run:
+  python benchmarks/bench_compact_results.py --columns 50000 --k 5 --compact-k 3
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from schema_matching_toolkit.hybrid_ensemble_matcher.compact import (
+    build_compact_result,
+    compact_to_dict,
+    compact_to_verbose,
+    save_compact_npz,
+)
+
+
+def make_column_matches(n_columns: int, k: int, n_tables: int = 500, seed: int = 7):
+    rng = random.Random(seed)
+    matches = []
+
+    for i in range(n_columns):
+        cands = []
+        for _ in range(k):
+            cands.append(
+                {
+                    "candidate": f"target_table_{rng.randrange(n_tables)}.target_column_{rng.randrange(40)}",
+                    "bm25_score": round(rng.random(), 4),
+                    "minilm_score": round(rng.random(), 4),
+                    "mpnet_score": round(rng.random(), 4),
+                    "final_score": round(rng.random(), 4),
+                }
+            )
+        cands.sort(key=lambda c: c["final_score"], reverse=True)
+
+        matches.append(
+            {
+                "source": f"source_table_{i // 20}.source_column_{i % 20}",
+                "best_match": cands[0]["candidate"],
+                "confidence": cands[0]["final_score"],
+                "match_source": "ensemble",
+                "candidates": cands,
+            }
+        )
+
+    return matches
+
+
+def _measure(label, fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = fn()
+    seconds = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {seconds:7.3f}s  peak={peak / 1e6:8.1f} MB")
+    return value
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--columns", type=int, default=50000)
+    ap.add_argument("--k", type=int, default=5)
+    ap.add_argument("--compact-k", type=int, default=3)
+    args = ap.parse_args()
+
+    verbose_matches = _measure("build verbose", lambda: make_column_matches(args.columns, args.k))
+    verbose = {"column_match_count": len(verbose_matches), "column_matches": verbose_matches}
+
+    compact = _measure(
+        "build compact",
+        lambda: build_compact_result(
+            verbose_matches, top_k=args.compact_k, meta={"include_table_matches": False}
+        ),
+    )
+    print(f"compact arrays: {compact.nbytes / 1e6:.1f} MB, {len(compact.ids)} interned ids")
+
+    verbose_json = _measure("json.dumps verbose", lambda: json.dumps(verbose))
+    compact_json = _measure("json.dumps compact", lambda: json.dumps(compact_to_dict(compact), separators=(",", ":")))
+
+    print(f"json size verbose: {len(verbose_json) / 1e6:.1f} MB  compact: {len(compact_json) / 1e6:.1f} MB")
+
+    path = os.path.join(tempfile.mkdtemp(), "result.npz")
+    _measure("save npz", lambda: save_compact_npz(compact, path))
+    print(f"npz size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+    _measure("compact -> verbose", lambda: compact_to_verbose(compact))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+HNSW recall / latency sweep on a Qdrant server.
+
+Synthetic clustered 384-d vectors (many near-duplicate column names, like
+created_at / tenant_id across tables) are indexed once per (m, ef_construct)
+grid point and searched with every hnsw_ef; recall@k vs exact NumPy top-k.
+
+Run (Qdrant on localhost:6333):
+  python benchmarks/bench_hnsw_sweep.py --points 200000 --queries 500 --k 10
+"""
+
+import argparse
+
+import numpy as np
+
+from schema_matching_toolkit import HnswConfig, QdrantConfig
+from schema_matching_toolkit.qdrant_tuning import pick_hnsw_params, sweep_hnsw_vectors
+
+
+def make_vectors(n: int, dim: int, n_clusters: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, n_clusters, size=n)
+    return centers[labels] + 0.35 * rng.standard_normal((n, dim)).astype(np.float32)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--points", type=int, default=200_000)
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--dim", type=int, default=384)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--host", default="localhost")
+    ap.add_argument("--port", type=int, default=6333)
+    ap.add_argument("--min-recall", type=float, default=0.95)
+    args = ap.parse_args()
+
+    vectors = make_vectors(args.points + args.queries, args.dim, n_clusters=max(1, args.points // 50))
+    targets, queries = vectors[: args.points], vectors[args.points :]
+
+    sweep = sweep_hnsw_vectors(
+        targets,
+        queries,
+        QdrantConfig(host=args.host, port=args.port, collection_name="bench_hnsw_sweep"),
+        hnsw_grid=[HnswConfig(m=m, ef_construct=ef) for m in (8, 16, 32) for ef in (64, 200)],
+        hnsw_ef_values=(16, 32, 64, 128, 256),
+        top_k=args.k,
+    )
+
+    exact = sweep["exact"]
+    print(f"{sweep['points']} points, {sweep['queries']} queries, recall@{sweep['top_k']}")
+    print(f"exact        p50 {exact['p50_ms']:>8.3f} ms   p99 {exact['p99_ms']:>8.3f} ms")
+    print(f"{'m':>4} {'ef_c':>5} {'ef':>5} {'recall':>7} {'p50 ms':>9} {'p99 ms':>9} {'index s':>8}")
+
+    for r in sweep["results"]:
+        print(
+            f"{r['m']:>4} {r['ef_construct']:>5} {r['hnsw_ef']:>5} {r['recall_at_k']:>7.4f} "
+            f"{r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f} {r['index_seconds']:>8.2f}"
+        )
+
+    best = pick_hnsw_params(sweep, min_recall=args.min_recall)
+    if best is None:
+        print(f"No grid point reaches recall {args.min_recall}")
+    else:
+        print(f"✅ Fastest with recall >= {args.min_recall}: {best['hnsw_config']} hnsw_ef={best['hnsw_ef']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Load test for the mapping service (python -m schema_matching_toolkit.service).
+
+Submits --jobs jobs from --concurrency client threads, long-polls each job
+until it finishes and reports throughput, end-to-end latency percentiles
+and admission-control rejections (HTTP 429, retried after Retry-After).
+
+Run:
+  python -m schema_matching_toolkit.service --port 8765 --workers 4 &
+  python benchmarks/load_test_service.py --kind extract \
+      --params '{"db": {"db_type": "sqlite", "sqlite_path": "./demo.db"}}' \
+      --jobs 200 --concurrency 16
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float = 120.0):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+def _connect(args) -> http.client.HTTPConnection:
+    if args.unix_socket:
+        return UnixHTTPConnection(args.unix_socket)
+    url = urlparse(args.url)
+    return http.client.HTTPConnection(url.hostname, url.port or 80, timeout=120.0)
+
+
+def _request(conn, method: str, path: str, body=None):
+    payload = json.dumps(body).encode("utf-8") if body is not None else None
+    headers = {"Content-Type": "application/json"} if payload is not None else {}
+    conn.request(method, path, body=payload, headers=headers)
+    resp = conn.getresponse()
+    data = json.loads(resp.read() or b"{}")
+    return resp.status, dict(resp.getheaders()), data
+
+
+def _percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100.0 * (len(values) - 1))))]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", default="http://127.0.0.1:8765")
+    ap.add_argument("--unix-socket", default=None)
+    ap.add_argument("--kind", default="extract")
+    ap.add_argument("--params", default="{}", help="job params as JSON (or @file.json)")
+    ap.add_argument("--jobs", type=int, default=100)
+    ap.add_argument("--concurrency", type=int, default=8)
+    args = ap.parse_args()
+
+    if args.params.startswith("@"):
+        with open(args.params[1:], "r", encoding="utf-8") as f:
+            params = json.load(f)
+    else:
+        params = json.loads(args.params)
+
+    latencies, failures = [], []
+    counters = {"rejected": 0}
+    lock = threading.Lock()
+    remaining = iter(range(args.jobs))
+
+    def client():
+        conn = _connect(args)
+
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+
+            t0 = time.perf_counter()
+
+            # submit (back off on 429 = queue full)
+            while True:
+                status, headers, data = _request(conn, "POST", "/jobs", {"kind": args.kind, "params": params})
+                if status != 429:
+                    break
+                with lock:
+                    counters["rejected"] += 1
+                time.sleep(float(headers.get("Retry-After", 1)))
+
+            if status != 202:
+                with lock:
+                    failures.append(data.get("error", status))
+                continue
+
+            job_id = data["job_id"]
+            while True:
+                _, _, job = _request(conn, "GET", f"/jobs/{job_id}?wait=30")
+                if job["status"] in {"done", "failed", "cancelled"}:
+                    break
+
+            elapsed = time.perf_counter() - t0
+            with lock:
+                if job["status"] == "done":
+                    latencies.append(elapsed)
+                else:
+                    failures.append(job.get("error") or job["status"])
+
+        conn.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    conn = _connect(args)
+    _, _, stats = _request(conn, "GET", "/stats")
+    conn.close()
+
+    print(f"{args.jobs} '{args.kind}' jobs, concurrency {args.concurrency}, {wall:.2f}s wall")
+    print(f"✅ Throughput: {len(latencies) / wall:.2f} jobs/s ({len(latencies)} ok, {len(failures)} failed)")
+    print(
+        "Latency (s): "
+        f"p50 {_percentile(latencies, 50):.3f} | p95 {_percentile(latencies, 95):.3f} | "
+        f"p99 {_percentile(latencies, 99):.3f} | max {max(latencies, default=0.0):.3f}"
+    )
+    print(f"Rejected (429, retried): {counters['rejected']}")
+    print("Service stats:", {k: stats.get(k) for k in ("workers", "max_queue", "done", "failed", "rejected")})
+    if failures:
+        print("First failure:", failures[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,146 @@
-from .common.db_config import DBConfig, QdrantConfig, GroqConfig
+from .common.db_config import (
+    DBConfig,
+    QdrantConfig,
+    GroqConfig,
+    EncodingConfig,
+    EmbeddingServiceConfig,
+    RerankConfig,
+    HnswConfig,
+    ServiceConfig,
+    TelemetryConfig,
+)
 
-from .schema_extractor.extractor import extract_schema
+from .utils.lazy_import import lazy_exports
 
-from .minilm_dense_matcher.indexer import index_target_schema_to_qdrant
-from .minilm_dense_matcher.matcher import match_source_to_target_dense
+# public API -> defining module, imported on first access so that e.g.
+# `from schema_matching_toolkit import extract_schema` does not load
+# sentence_transformers / torch, qdrant_client, groq or rank_bm25
+_EXPORTS = {
+    "configure_embedding_service": ".common.embedding_service",
 
-from .sparse_bm25 import bm25_match
+    "extract_schema": ".schema_extractor.extractor",
+    "extract_schema_async": ".schema_extractor.extractor",
+    "profile_schema": ".profiling.profiler",
+    "profile_schema_async": ".profiling.profiler",
 
-from .mpnet_embedding_matcher import mpnet_dense_match, index_target_columns_mpnet
+    "describe_schema_with_groq": ".llm_description.groq_describer",
+    "describe_schema_with_groq_async": ".llm_description.groq_describer",
+    "index_target_schema_to_qdrant": ".minilm_dense_matcher.indexer",
+    "index_target_schema_to_qdrant_async": ".minilm_dense_matcher.indexer",
+    "match_source_to_target_dense": ".minilm_dense_matcher.matcher",
+    "match_source_to_target_dense_async": ".minilm_dense_matcher.matcher",
 
-from .llm_description.groq_describer import describe_schema_with_groq 
+    "bm25_match": ".sparse_bm25.bm25_matcher",
+    "exact_name_match": ".exact_name_matcher.matcher",
 
-from .schema_metadata_generator import generate_schema_metadata
+    "mpnet_dense_match": ".mpnet_embedding_matcher.matcher",
+    "mpnet_dense_match_async": ".mpnet_embedding_matcher.matcher",
+    "index_target_columns_mpnet": ".mpnet_embedding_matcher.indexer",
+    "index_target_columns_mpnet_async": ".mpnet_embedding_matcher.indexer",
+    "multivector_dense_match": ".multivector_matcher.matcher",
+    "index_target_columns_multivector": ".multivector_matcher.indexer",
+    "static_dense_match": ".static_embedding_matcher.matcher",
+    "distill_static_table": ".static_embedding_matcher.table",
+    "load_static_table": ".static_embedding_matcher.table",
+    "generate_schema_metadata": ".schema_metadata_generator.generator",
+
+    "export_target_snapshot": ".target_snapshot.snapshot",
+    "restore_target_snapshot": ".target_snapshot.snapshot",
+    "gc_unreferenced_versions": ".common.collection_versions",
+
+    "prepare_target": ".target_bundle.bundle",
+    "load_target_bundle": ".target_bundle.bundle",
+    "import_bundle_to_qdrant": ".target_bundle.backends",
+
+    "run_hybrid_mapping_async": ".hybrid_ensemble_matcher.runner",
+    "compact_to_verbose": ".hybrid_ensemble_matcher.compact",
+    "load_compact_npz": ".hybrid_ensemble_matcher.compact",
+
+    "rerank_column_matches": ".reranker.cross_encoder_reranker",
+
+    "MappingMemory": ".mapping_memory.store",
+
+    "index_catalog_schemas": ".catalog_matcher.indexer",
+    "catalog_search": ".catalog_matcher.search",
+
+    "RunCheckpoint": ".checkpoint.store",
+
+    "serve_mapping_service": ".service.server",
+
+    "run_mapping_batch": ".batch.runner",
+
+    "configure_telemetry": ".telemetry.tracer",
+    "telemetry_snapshot": ".telemetry.tracer",
+
+    "sweep_hnsw_params": ".qdrant_tuning.sweep",
+    "pick_hnsw_params": ".qdrant_tuning.sweep",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DBConfig",
     "QdrantConfig",
     "GroqConfig",
+    "EncodingConfig",
+    "EmbeddingServiceConfig",
+    "RerankConfig",
+    "HnswConfig",
+    "ServiceConfig",
+    "TelemetryConfig",
+    "configure_embedding_service",
 
     "extract_schema",
+    "extract_schema_async",
+    "profile_schema",
+    "profile_schema_async",
 
     "describe_schema_with_groq",  
+    "describe_schema_with_groq_async",
     "index_target_schema_to_qdrant",
+    "index_target_schema_to_qdrant_async",
     "match_source_to_target_dense",
+    "match_source_to_target_dense_async",
 
     "bm25_match",
+    "exact_name_match",
 
     "mpnet_dense_match",
+    "mpnet_dense_match_async",
     "index_target_columns_mpnet",
-    "generate_schema_metadata"
+    "index_target_columns_mpnet_async",
+    "multivector_dense_match",
+    "index_target_columns_multivector",
+    "static_dense_match",
+    "distill_static_table",
+    "load_static_table",
+    "generate_schema_metadata",
+
+    "export_target_snapshot",
+    "restore_target_snapshot",
+    "gc_unreferenced_versions",
+
+    "prepare_target",
+    "load_target_bundle",
+    "import_bundle_to_qdrant",
+
+    "run_hybrid_mapping_async",
+    "compact_to_verbose",
+    "load_compact_npz",
+
+    "rerank_column_matches",
+
+    "index_catalog_schemas",
+    "catalog_search",
+
+    "MappingMemory",
+    "RunCheckpoint",
+    "serve_mapping_service",
+    "run_mapping_batch",
+
+    "configure_telemetry",
+    "telemetry_snapshot",
+
+    "sweep_hnsw_params",
+    "pick_hnsw_params",
 ]
@@ -0,0 +1,3 @@
+from .runner import load_batch_manifest, run_mapping_batch
+
+__all__ = ["load_batch_manifest", "run_mapping_batch"]
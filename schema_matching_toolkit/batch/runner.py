@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from schema_matching_toolkit.checkpoint.store import content_hash
+from schema_matching_toolkit.common.db_config import DBConfig, GroqConfig
+from schema_matching_toolkit.telemetry import counter, span, traced
+
+
+SUMMARY_FILE = "batch_summary.json"
+
+# run_hybrid_mapping options that decide which target collections a pair uses
+_INDEX_OPTIONS = (
+    "index_mode",
+    "text_mode",
+    "versioned_collections",
+    "target_alias",
+    "snapshot_dir",
+    "target_bundle_path",
+    "qdrant_host",
+    "qdrant_port",
+    "qdrant_location",
+    "qdrant_path",
+)
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+# -------------------------
+# Manifest
+# -------------------------
+def load_batch_manifest(manifest: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reads + validates a batch manifest (path to JSON, or an already loaded dict).
+
+    {
+      "output_dir": "./weekend_run",
+      "groq": {"api_key": "...", "model": "llama-3.1-8b-instant"},
+      "defaults": {"output_format": "csv", "type_filter": true, ...},
+      "databases": {
+        "crm": {"db_type": "postgres", "host": "...", "database": "crm", ...},
+        "gpc": {...}
+      },
+      "pairs": [
+        {"id": "crm_to_gpc", "source": "crm", "target": "gpc",
+         "options": {"min_confidence": 0.6}},
+        {"source": {...inline DBConfig...}, "target": "gpc"}
+      ]
+    }
+
+    options / defaults = any run_hybrid_mapping() keyword (JSON values).
+    """
+    if isinstance(manifest, str):
+        with open(manifest, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    databases = manifest.get("databases") or {}
+    pairs = manifest.get("pairs") or []
+    if not pairs:
+        raise ValueError("Batch manifest has no pairs")
+
+    # every pair needs Groq descriptions -> fail here, not once per pair after retries
+    groq = manifest.get("groq")
+    if not isinstance(groq, dict) or not groq.get("api_key"):
+        raise ValueError("Batch manifest needs a 'groq' block with an api_key")
+
+    def _db(ref: Any, where: str) -> Dict[str, Any]:
+        if isinstance(ref, str):
+            if ref not in databases:
+                raise ValueError(f"{where}: unknown database '{ref}'")
+            return databases[ref]
+        if isinstance(ref, dict):
+            return ref
+        raise ValueError(f"{where}: expected a database name or DBConfig fields")
+
+    resolved = []
+    seen = set()
+    for i, p in enumerate(pairs):
+        pair_id = str(p.get("id") or f"pair_{i:04d}")
+        if pair_id in seen:
+            raise ValueError(f"Duplicate pair id '{pair_id}'")
+        seen.add(pair_id)
+
+        resolved.append(
+            {
+                "id": pair_id,
+                "source": _db(p.get("source"), pair_id),
+                "target": _db(p.get("target"), pair_id),
+                "options": {**(manifest.get("defaults") or {}), **(p.get("options") or {})},
+            }
+        )
+
+    return {
+        "output_dir": manifest.get("output_dir") or "batch_output",
+        "groq": groq,
+        "pairs": resolved,
+    }
+
+
+# -------------------------
+# Shared schema / description cache
+# -------------------------
+class _Once:
+    """
+    key -> value computed by exactly one thread; concurrent callers wait.
+    Failures are not cached (a retry recomputes).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self.computed = 0
+
+    def get(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._futures.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._futures[key] = fut
+
+        if not owner:
+            return fut.result()
+
+        try:
+            value = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._futures[key]
+            fut.set_exception(e)
+            raise
+
+        with self._lock:
+            self.computed += 1
+        fut.set_result(value)
+        return value
+
+
+def _fetch_schema(db_cfg: DBConfig, groq_cfg: GroqConfig) -> Dict[str, Any]:
+    from schema_matching_toolkit.llm_description import describe_schema_with_groq
+    from schema_matching_toolkit.schema_extractor import extract_schema
+
+    schema = extract_schema(db_cfg)
+    return {"schema": schema, "desc": describe_schema_with_groq(schema, groq_cfg)}
+
+
+# -------------------------
+# Batch runner
+# -------------------------
+@traced()
+def run_mapping_batch(
+    manifest: Union[str, Dict[str, Any]],
+    max_workers: int = 4,
+    max_retries: int = 2,
+    retry_backoff_seconds: float = 5.0,
+    run_fn: Optional[Callable[..., Dict[str, Any]]] = None,
+    fetch_fn: Optional[Callable[[DBConfig, GroqConfig], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every (source, target) pair of a manifest in ONE process.
+
+      - each distinct database is extracted + described once, whether it is
+        used as source or target by one pair or by hundreds
+      - pairs sharing a target index (same target + index options) are
+        chained behind a lead pair: the lead builds the versioned
+        collections, the others start after it and find them "shared"
+      - pairs run on max_workers threads sharing models, engines and
+        Qdrant clients (use max_workers=1 with an embedded Qdrant)
+      - a failing pair is retried max_retries times (linear backoff) and
+        never stops the batch
+
+    run_fn / fetch_fn: hooks replacing run_hybrid_mapping / extract+describe.
+
+    Output (also written to <output_dir>/batch_summary.json):
+      {
+        "pairs": [{"id", "status": "done"|"failed", "attempts", "seconds",
+                   "saved_file", "column_match_count", "index_source", "error"}, ...],
+        "done": N, "failed": M, "distinct_databases": D, ...
+      }
+    """
+    if run_fn is None:
+        from schema_matching_toolkit.hybrid_ensemble_matcher.runner import run_hybrid_mapping as run_fn
+    from schema_matching_toolkit.hybrid_ensemble_matcher.runner import mapping_options_from_json
+
+    fetch_fn = fetch_fn or _fetch_schema
+
+    batch = load_batch_manifest(manifest)
+    output_dir = batch["output_dir"]
+    os.makedirs(output_dir, exist_ok=True)
+
+    groq_cfg = GroqConfig(**batch["groq"])
+    schemas = _Once()
+    started = time.perf_counter()
+
+    # -------------------------
+    # Group pairs by target index
+    # -------------------------
+    groups: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+    for pair in batch["pairs"]:
+        index_key = content_hash(
+            {
+                "target": pair["target"],
+                "options": {k: pair["options"].get(k) for k in _INDEX_OPTIONS},
+            }
+        )
+        groups.setdefault(index_key, []).append(pair)
+
+    def _prefetch(db: Dict[str, Any]) -> Dict[str, Any]:
+        return schemas.get(content_hash(db), lambda: fetch_fn(DBConfig(**db), groq_cfg))
+
+    def _run_pair(pair: Dict[str, Any]) -> Dict[str, Any]:
+        options = mapping_options_from_json(pair["options"])
+        fmt = options.setdefault("output_format", "csv")
+        options.setdefault("output_file", os.path.join(output_dir, f"{pair['id']}.{fmt}"))
+
+        row: Dict[str, Any] = {"id": pair["id"], "status": "failed", "attempts": 0, "error": None}
+        t0 = time.perf_counter()
+
+        for attempt in range(max_retries + 1):
+            row["attempts"] = attempt + 1
+            try:
+                src = _prefetch(pair["source"])
+                prefetched = {"source_schema": src["schema"], "source_desc": src["desc"]}
+
+                if not options.get("target_bundle_path"):
+                    tgt = _prefetch(pair["target"])
+                    prefetched.update({"target_schema": tgt["schema"], "target_desc": tgt["desc"]})
+
+                with span("batch.pair", pair=pair["id"], attempt=attempt + 1):
+                    out = run_fn(
+                        DBConfig(**pair["source"]),
+                        DBConfig(**pair["target"]),
+                        groq_cfg=groq_cfg,
+                        _prefetched=prefetched,
+                        **options,
+                    )
+            except Exception as e:
+                row["error"] = f"{type(e).__name__}: {e}"
+                counter("batch.pair_failures")
+                if attempt < max_retries:
+                    time.sleep(retry_backoff_seconds * (attempt + 1))
+                continue
+
+            row.update(
+                {
+                    "status": "done",
+                    "error": None,
+                    "saved_file": out.get("saved_file"),
+                    "index_source": out.get("index_source"),
+                    "table_match_count": out.get("table_match_count", 0),
+                    "column_match_count": out.get("column_match_count", 0),
+                }
+            )
+            break
+
+        row["seconds"] = round(time.perf_counter() - t0, 3)
+        return row
+
+    # -------------------------
+    # Schedule: group leads first, followers once their lead finished
+    # -------------------------
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="batch") as pool:
+        running: Dict[Future, str] = {}
+        for key, pairs in groups.items():
+            running[pool.submit(contextvars.copy_context().run, _run_pair, pairs[0])] = key
+
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in done:
+                key = running.pop(fut)
+                row = fut.result()
+                results[row["id"]] = row
+
+                followers = groups[key][1:]
+                groups[key] = []
+                for pair in followers:
+                    running[pool.submit(contextvars.copy_context().run, _run_pair, pair)] = key
+
+    rows = [results[p["id"]] for p in batch["pairs"]]
+    summary = {
+        "generated_at": _now_utc_iso(),
+        "output_dir": output_dir,
+        "pair_count": len(rows),
+        "done": sum(r["status"] == "done" for r in rows),
+        "failed": sum(r["status"] == "failed" for r in rows),
+        "distinct_databases": schemas.computed,
+        "target_index_groups": len(groups),
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "pairs": rows,
+    }
+
+    summary_path = os.path.join(output_dir, SUMMARY_FILE)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+    summary["summary_file"] = summary_path
+
+    return summary
@@ -0,0 +1,9 @@
+from .indexer import create_catalog_collection, delete_catalog_schema, index_catalog_schemas
+from .search import catalog_search
+
+__all__ = [
+    "create_catalog_collection",
+    "delete_catalog_schema",
+    "index_catalog_schemas",
+    "catalog_search",
+]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional
+import uuid
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.common.qdrant_utils import (
+    create_vector_collection,
+    get_qdrant_client,
+)
+from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.telemetry import traced
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+SCHEMA_ID_FIELD = "schema_id"
+
+# stable point ids -> re-indexing a schema overwrites its own points
+_POINT_NAMESPACE = uuid.UUID("5d0c3a9e-4b7f-4f5e-9a51-7f3c2b1e8d40")
+
+
+def _point_id(schema_id: str, column_id: str) -> str:
+    return str(uuid.uuid5(_POINT_NAMESPACE, f"{schema_id}\x1f{column_id}"))
+
+
+def create_catalog_collection(client: QdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    """
+    Shared MiniLM collection for many target schemas:
+      - `type_family` keyword index (same as the single-target collections)
+      - `schema_id` keyword index with is_tenant=True, so Qdrant co-locates
+        each schema's points and per-schema filters stay cheap
+    """
+    from qdrant_client.models import KeywordIndexParams, KeywordIndexType
+
+    create_vector_collection(client, qdrant_cfg)
+
+    try:
+        client.create_payload_index(
+            collection_name=qdrant_cfg.collection_name,
+            field_name=SCHEMA_ID_FIELD,
+            field_schema=KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True),
+        )
+    except Exception:
+        # already exists / not supported by this backend
+        pass
+
+
+def delete_catalog_schema(qdrant_cfg: QdrantConfig, schema_id: str) -> None:
+    """
+    Removes every point of one target schema from the catalog collection.
+    """
+    from qdrant_client.models import FieldCondition, Filter, FilterSelector, MatchValue
+
+    client = get_qdrant_client(qdrant_cfg)
+    client.delete(
+        collection_name=qdrant_cfg.collection_name,
+        points_selector=FilterSelector(
+            filter=Filter(must=[FieldCondition(key=SCHEMA_ID_FIELD, match=MatchValue(value=schema_id))])
+        ),
+    )
+
+
+@traced()
+def index_catalog_schemas(
+    target_schemas: Dict[str, Dict[str, Any]],
+    qdrant_cfg: QdrantConfig,
+    descriptions: Optional[Dict[str, Dict[str, Any]]] = None,
+    recreate: bool = False,
+    batch_size: int = 256,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    Index MANY target schemas into one shared MiniLM collection, every point
+    tagged with its `schema_id`.
+
+    Input:
+      target_schemas = {"crm_prod": extract_schema(cfg1), "erp": extract_schema(cfg2), ...}
+      descriptions   = {"crm_prod": describe_schema_with_groq(...), ...} (optional)
+      recreate = True  -> drop + create the whole catalog collection
+                 False -> create if missing, replace only the given schemas
+
+    Output:
+      {"collection": "...", "schema_count": N, "indexed_points": M,
+       "schemas": {"crm_prod": 120, ...}, "encode_stats": {"crm_prod": {...}, ...}}
+    """
+    from qdrant_client.models import PointStruct
+
+    client = get_qdrant_client(qdrant_cfg)
+    descriptions = descriptions or {}
+
+    if recreate:
+        try:
+            client.delete_collection(collection_name=qdrant_cfg.collection_name)
+        except Exception:
+            pass
+        create_catalog_collection(client, qdrant_cfg)
+    elif not client.collection_exists(qdrant_cfg.collection_name):
+        create_catalog_collection(client, qdrant_cfg)
+
+    model = get_sentence_model(MODEL_NAME)
+    counts: Dict[str, int] = {}
+    encode_stats: Dict[str, Any] = {}
+
+    for schema_id, schema in target_schemas.items():
+        if not recreate:
+            # dropped / renamed columns must not linger
+            delete_catalog_schema(qdrant_cfg, schema_id)
+
+        cols = flatten_columns_with_desc(schema, descriptions.get(schema_id), text_mode=text_mode)
+        vectors, encode_stats[schema_id] = embed_texts(model, [c["text"] for c in cols], encoding)
+
+        for start in range(0, len(cols), batch_size):
+            points = [
+                PointStruct(
+                    id=_point_id(schema_id, c["column_id"]),
+                    vector={qdrant_cfg.vector_name: vectors[i].tolist()},
+                    payload={
+                        SCHEMA_ID_FIELD: schema_id,
+                        "column_id": c["column_id"],
+                        "table_name": c["column_id"].split(".", 1)[0],
+                        "data_type": c["data_type"],
+                        "type_family": type_family(c["data_type"]),
+                        "description": c["description"],
+                        "text": c["text"],
+                    },
+                )
+                for i, c in enumerate(cols[start : start + batch_size], start=start)
+            ]
+            client.upsert(collection_name=qdrant_cfg.collection_name, points=points)
+
+        counts[schema_id] = len(cols)
+
+    return {
+        "collection": qdrant_cfg.collection_name,
+        "schema_count": len(counts),
+        "indexed_points": sum(counts.values()),
+        "schemas": counts,
+        "encode_stats": encode_stats,
+    }
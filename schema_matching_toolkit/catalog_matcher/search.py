@@ -0,0 +1,190 @@
+from typing import Dict, Any, Iterable, List, Optional
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, search_params, type_family_filter
+from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.telemetry import span, traced
+
+from .indexer import SCHEMA_ID_FIELD
+
+
+def _query_filter(data_type: str, schema_ids: Optional[List[str]], type_filter: bool):
+    from qdrant_client.models import FieldCondition, Filter, MatchAny
+
+    must = []
+    if schema_ids:
+        must.append(FieldCondition(key=SCHEMA_ID_FIELD, match=MatchAny(any=schema_ids)))
+
+    if type_filter:
+        flt = type_family_filter(data_type)
+        if flt is not None:
+            must.extend(flt.must)
+
+    return Filter(must=must) if must else None
+
+
+def _table_matches(column_matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Source table -> target table inside one schema: target tables are voted by
+    the summed scores of the source table's column best matches.
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for m in column_matches:
+        grouped.setdefault(m["source"].split(".", 1)[0], []).append(m)
+
+    tables = []
+    for src_table, cols in grouped.items():
+        votes: Dict[str, float] = {}
+        for m in cols:
+            tgt_table = m["best_match"].split(".", 1)[0]
+            votes[tgt_table] = votes.get(tgt_table, 0.0) + m["confidence"]
+
+        best_table, total = max(votes.items(), key=lambda x: x[1])
+        tables.append(
+            {
+                "source_table": src_table,
+                "best_match_table": best_table,
+                "confidence": round(total / len(cols), 4),
+                "column_match_count": len(cols),
+            }
+        )
+
+    tables.sort(key=lambda x: x["confidence"], reverse=True)
+    return tables
+
+
+@traced()
+def catalog_search(
+    source_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    source_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 20,
+    top_schemas: int = 5,
+    schema_ids: Optional[Iterable[str]] = None,
+    type_filter: bool = False,
+    chunk_size: int = 64,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    Which catalog schemas (see index_catalog_schemas) does this source belong to?
+
+    One batched query per source chunk over the shared collection; every
+    column keeps its top_k hits across ALL schemas (raise top_k when many
+    schemas are near-duplicates). Hits are grouped by `schema_id` in the
+    same pass:
+
+      column match per schema = best hit of that schema for the column
+      schema score            = sum of column best scores / source columns
+                                (columns without a hit in the schema count 0)
+      coverage                = share of source columns with a hit in the schema
+
+    schema_ids given -> search only those schemas (tenant filter)
+
+    Output:
+      {
+        "method": "catalog_search",
+        "source_column_count": N,
+        "schema_count": S,              (schemas with at least one hit)
+        "schemas": [                    (best first, top_schemas)
+          {
+            "schema_id": "crm_prod",
+            "score": 0.71,
+            "coverage": 0.95,
+            "column_match_count": 38,
+            "table_matches": [{"source_table", "best_match_table", "confidence", ...}],
+            "column_matches": [{"source", "best_match", "confidence", "candidates"}]
+          }
+        ],
+        "encode_stats": {...}
+      }
+    """
+    from qdrant_client.models import QueryRequest
+
+    client = get_qdrant_client(qdrant_cfg)
+    schema_ids = list(schema_ids) if schema_ids is not None else None
+
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
+    qvecs, encode_stats = embed_texts(get_sentence_model(MODEL_NAME), [c["text"] for c in source_cols], encoding)
+
+    # schema_id -> source column -> candidates (hit order = score order)
+    per_schema: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+    params = search_params(qdrant_cfg)
+
+    for start in range(0, len(source_cols), chunk_size):
+        chunk = source_cols[start : start + chunk_size]
+
+        requests = [
+            QueryRequest(
+                query=qvecs[start + i].tolist(),
+                using=qdrant_cfg.vector_name,
+                filter=_query_filter(src["data_type"], schema_ids, type_filter),
+                params=params,
+                limit=top_k,
+                with_payload=True,
+            )
+            for i, src in enumerate(chunk)
+        ]
+
+        with span("qdrant.query_batch", collection=qdrant_cfg.collection_name, queries=len(requests)):
+            responses = client.query_batch_points(
+                collection_name=qdrant_cfg.collection_name,
+                requests=requests,
+            )
+
+        for src, resp in zip(chunk, responses):
+            for h in resp.points:
+                payload = h.payload or {}
+                schema_id = payload.get(SCHEMA_ID_FIELD)
+                if schema_id is None:
+                    continue
+
+                per_schema.setdefault(schema_id, {}).setdefault(src["column_id"], []).append(
+                    {
+                        "target": payload.get("column_id", str(h.id)),
+                        "score": float(h.score),
+                        "data_type": payload.get("data_type", ""),
+                        "description": payload.get("description", ""),
+                    }
+                )
+
+    n_source = len(source_cols)
+    schemas = []
+
+    for schema_id, by_col in per_schema.items():
+        column_matches = [
+            {
+                "source": src,
+                "best_match": cands[0]["target"],
+                "confidence": round(cands[0]["score"], 4),
+                "candidates": cands,
+            }
+            for src, cands in by_col.items()
+        ]
+
+        total = sum(m["confidence"] for m in column_matches)
+
+        schemas.append(
+            {
+                "schema_id": schema_id,
+                "score": round(total / n_source, 4) if n_source else 0.0,
+                "coverage": round(len(column_matches) / n_source, 4) if n_source else 0.0,
+                "column_match_count": len(column_matches),
+                "table_matches": _table_matches(column_matches),
+                "column_matches": column_matches,
+            }
+        )
+
+    schemas.sort(key=lambda x: (x["score"], x["coverage"]), reverse=True)
+
+    return {
+        "method": "catalog_search",
+        "source_column_count": n_source,
+        "schema_count": len(schemas),
+        "schemas": schemas[:top_schemas],
+        "encode_stats": encode_stats,
+    }
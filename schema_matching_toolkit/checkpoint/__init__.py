@@ -0,0 +1,3 @@
+from .store import RunCheckpoint, checkpointed, content_hash
+
+__all__ = ["RunCheckpoint", "checkpointed", "content_hash"]
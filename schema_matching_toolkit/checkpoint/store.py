@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+MANIFEST_FILE = "manifest.json"
+CHECKPOINT_VERSION = 1
+
+_NDARRAY_EXT = 1
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+# -------------------------
+# Content hashes
+# -------------------------
+def _hash_default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if hasattr(obj, "tobytes") and hasattr(obj, "dtype"):
+        # numpy arrays / scalars: hash the raw buffer, not a huge list
+        return {
+            "dtype": str(obj.dtype),
+            "shape": list(getattr(obj, "shape", ())),
+            "sha256": hashlib.sha256(obj.tobytes()).hexdigest(),
+        }
+    return str(obj)
+
+
+def content_hash(obj: Any) -> str:
+    """
+    Stable sha256 of any JSON-like value (dict key order does not matter;
+    dataclass configs, sets and NumPy arrays are supported).
+    """
+    raw = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_hash_default)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# -------------------------
+# Artifact encoding
+# -------------------------
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def _msgpack_default(obj: Any) -> Any:
+    msgpack = _msgpack()
+
+    if hasattr(obj, "tobytes") and hasattr(obj, "dtype") and hasattr(obj, "shape"):
+        if obj.shape == ():
+            return obj.item()
+        payload = msgpack.packb([obj.dtype.str, list(obj.shape), obj.tobytes()], use_bin_type=True)
+        return msgpack.ExtType(_NDARRAY_EXT, payload)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+
+    raise TypeError(f"Cannot checkpoint value of type {type(obj).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    msgpack = _msgpack()
+
+    if code == _NDARRAY_EXT:
+        import numpy as np
+
+        dtype, shape, buf = msgpack.unpackb(data, raw=False)
+        return np.frombuffer(buf, dtype=np.dtype(dtype)).reshape(shape).copy()
+    return msgpack.ExtType(code, data)
+
+
+def encode_artifact(value: Any) -> Tuple[bytes, str]:
+    """
+    value -> (bytes, format). msgpack (NumPy arrays as raw buffers) when
+    installed, else pickle protocol 5. Never indented JSON.
+
+    Values msgpack cannot represent losslessly (Decimal / datetime samples
+    in profiles, ...) fall back to pickle.
+    """
+    msgpack = _msgpack()
+    if msgpack is not None:
+        try:
+            return msgpack.packb(value, default=_msgpack_default, use_bin_type=True), "msgpack"
+        except TypeError:
+            pass
+    return pickle.dumps(value, protocol=5), "pickle"
+
+
+def decode_artifact(data: bytes, fmt: str) -> Any:
+    if fmt == "msgpack":
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise ValueError("Checkpoint artifact is msgpack but msgpack is not installed")
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+    if fmt == "pickle":
+        return pickle.loads(data)
+    raise ValueError(f"Unknown checkpoint artifact format: {fmt}")
+
+
+# -------------------------
+# Run directory
+# -------------------------
+class RunCheckpoint:
+    """
+    Per-run artifact store for stage outputs.
+
+      <run_dir>/manifest.json          stage -> input hash, output hash, file
+      <run_dir>/<stage>.msgpack|.pkl   stage output
+
+    A stage is reused only when resume=True, its recorded input hash equals
+    the hash of the current inputs and the artifact bytes still match the
+    recorded output hash; otherwise it is recomputed and overwritten.
+    Thread-safe (stages of one run may finish concurrently).
+
+    Note: msgpack returns tuples as lists.
+    """
+
+    def __init__(self, run_dir: str, resume: bool = True):
+        self.run_dir = run_dir
+        self.resume = resume
+        self._lock = threading.Lock()
+        self._hits: List[str] = []
+        self._saved: List[str] = []
+
+        os.makedirs(run_dir, exist_ok=True)
+        self._manifest = self._load_manifest()
+
+    # -------------------------
+    # Manifest
+    # -------------------------
+    def _manifest_path(self) -> str:
+        return os.path.join(self.run_dir, MANIFEST_FILE)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self._manifest_path()
+        if not os.path.exists(path):
+            return {"version": CHECKPOINT_VERSION, "stages": {}}
+
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        if manifest.get("version") != CHECKPOINT_VERSION:
+            return {"version": CHECKPOINT_VERSION, "stages": {}}
+        return manifest
+
+    def _write_manifest(self) -> None:
+        path = self._manifest_path()
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def load(self, stage: str, input_hash: str) -> Tuple[bool, Any]:
+        """
+        (True, value) if a valid artifact for these inputs exists, else (False, None).
+        """
+        if not self.resume:
+            return False, None
+
+        with self._lock:
+            entry = self._manifest["stages"].get(stage)
+
+        if not entry or entry.get("input_hash") != input_hash:
+            return False, None
+
+        path = os.path.join(self.run_dir, entry["file"])
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False, None
+
+        # ✅ truncated / edited artifacts are recomputed, never trusted
+        if hashlib.sha256(data).hexdigest() != entry.get("output_hash"):
+            return False, None
+
+        value = decode_artifact(data, entry["format"])
+
+        with self._lock:
+            self._hits.append(stage)
+        return True, value
+
+    def save(self, stage: str, input_hash: str, value: Any) -> Dict[str, Any]:
+        data, fmt = encode_artifact(value)
+        file_name = f"{stage}.{'msgpack' if fmt == 'msgpack' else 'pkl'}"
+        path = os.path.join(self.run_dir, file_name)
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        entry = {
+            "input_hash": input_hash,
+            "output_hash": hashlib.sha256(data).hexdigest(),
+            "file": file_name,
+            "format": fmt,
+            "bytes": len(data),
+            "saved_at": _now_utc_iso(),
+        }
+
+        with self._lock:
+            self._manifest["stages"][stage] = entry
+            self._saved.append(stage)
+            self._write_manifest()
+
+        return entry
+
+    def cached(self, stage: str, inputs: Any, fn: Callable[[], Any]) -> Any:
+        """
+        Returns the stored output of `stage` if its inputs are unchanged,
+        otherwise runs fn() and stores the result.
+        """
+        input_hash = content_hash(inputs)
+
+        hit, value = self.load(stage, input_hash)
+        if hit:
+            return value
+
+        value = fn()
+        self.save(stage, input_hash, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "run_dir": self.run_dir,
+                "resume": self.resume,
+                "reused": sorted(self._hits),
+                "computed": sorted(self._saved),
+            }
+
+
+def checkpointed(
+    checkpoint: Optional[RunCheckpoint],
+    stage: str,
+    inputs: Any,
+    fn: Callable[[], Any],
+) -> Any:
+    """
+    checkpoint.cached(...) or plain fn() when no checkpoint is configured.
+    """
+    if checkpoint is None:
+        return fn()
+    return checkpoint.cached(stage, inputs, fn)
@@ -0,0 +1,36 @@
+import asyncio
+import functools
+from contextlib import nullcontext
+from typing import Any, Callable, TypeVar
+
+from schema_matching_toolkit.common.db_config import DBConfig
+
+
+T = TypeVar("T")
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a blocking / CPU-bound call (model load, inference, NumPy scoring)
+    in the default executor so the event loop keeps serving other jobs.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+async def run_with_async_connection(cfg: DBConfig, fn: Callable[[Callable[[], Any]], T]) -> T:
+    """
+    Runs sync SQLAlchemy code on an async engine (AsyncConnection.run_sync).
+
+    fn receives a `connect()` callable returning a context manager that
+    yields the (greenlet-adapted) sync Connection, so the existing
+    `with connect() as conn:` query code is reused as-is.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(cfg.sqlalchemy_async_url())
+    try:
+        async with engine.connect() as conn:
+            return await conn.run_sync(lambda sync_conn: fn(lambda: nullcontext(sync_conn)))
+    finally:
+        await engine.dispose()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from schema_matching_toolkit.common.db_config import QdrantConfig
+from schema_matching_toolkit.common.qdrant_utils import create_vector_collection, get_qdrant_client
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", (value or "").lower()).strip("_")
+
+
+def versioned_collection_name(prefix: str, model_name: str, fingerprint: str) -> str:
+    """
+    Physical collection name for one (model, target content) version.
+
+    'minilm_columns', 'sentence-transformers/all-MiniLM-L6-v2', 'ab12...'
+      -> 'minilm_columns__all_minilm_l6_v2__ab12cd34ef56ab78'
+    """
+    model_slug = _slug(model_name.split("/")[-1])
+    return f"{prefix}__{model_slug}__{fingerprint[:16]}"
+
+
+def target_alias_name(prefix: str, target_key: str) -> str:
+    """
+    Stable alias for one logical target, e.g. 'minilm_columns__gpc_public'.
+    """
+    return f"{prefix}__{_slug(target_key)}"
+
+
+def _collection_exists(client: QdrantClient, name: str) -> bool:
+    try:
+        client.get_collection(collection_name=name)
+        return True
+    except Exception:
+        return False
+
+
+def _point_count(client: QdrantClient, name: str) -> int:
+    try:
+        return int(client.count(collection_name=name, exact=True).count)
+    except Exception:
+        return -1
+
+
+def _stamp(client: QdrantClient, name: str, key: str) -> None:
+    """
+    Records a wall-clock timestamp in the collection metadata
+    ("created_at" / "retired_at"), read by gc_unreferenced_versions().
+    """
+    try:
+        client.update_collection(collection_name=name, metadata={key: time.time()})
+    except Exception:
+        # backend without collection metadata -> version counts as untracked
+        pass
+
+
+def _version_age(client: QdrantClient, name: str, now: float) -> Optional[float]:
+    """
+    Seconds since the version was retired (or created, if never retired).
+    None -> no timestamp recorded.
+    """
+    try:
+        metadata = client.get_collection(collection_name=name).config.metadata or {}
+    except Exception:
+        return None
+
+    stamp = metadata.get("retired_at") or metadata.get("created_at")
+    return None if stamp is None else now - float(stamp)
+
+
+def _alias_map(client: QdrantClient) -> Dict[str, str]:
+    """
+    {alias_name: collection_name}
+    """
+    try:
+        aliases = client.get_aliases().aliases
+    except Exception:
+        return {}
+    return {a.alias_name: a.collection_name for a in aliases}
+
+
+def swap_alias(client: QdrantClient, alias: str, collection_name: str) -> Optional[str]:
+    """
+    Atomically points `alias` to `collection_name` (single alias update request).
+    Returns the previous collection behind the alias (or None).
+    """
+    from qdrant_client.models import (
+        CreateAlias,
+        CreateAliasOperation,
+        DeleteAlias,
+        DeleteAliasOperation,
+    )
+
+    previous = _alias_map(client).get(alias)
+    if previous == collection_name:
+        return previous
+
+    ops: List[Any] = []
+    if previous is not None:
+        ops.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+    ops.append(
+        CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=collection_name, alias_name=alias)
+        )
+    )
+
+    client.update_collection_aliases(change_aliases_operations=ops)
+    return previous
+
+
+def ensure_versioned_collection(
+    qdrant_cfg: QdrantConfig,
+    alias: str,
+    model_name: str,
+    fingerprint: str,
+    expected_points: int,
+    build_fn: Callable[[QdrantConfig], Any],
+    wait_timeout: float = 300.0,
+    poll_interval: float = 1.0,
+    create_fn: Callable[[QdrantClient, QdrantConfig], None] = create_vector_collection,
+) -> Dict[str, Any]:
+    """
+    Makes `alias` point to a ready collection for (model, fingerprint).
+
+    Steps:
+      1) version collection already ready (point count == expected) -> share it
+      2) else create it off to the side and call build_fn(version_cfg)
+         (build_fn must upsert into version_cfg.collection_name, NOT recreate it)
+         - another job is building the same version -> wait for it
+           (not ready after wait_timeout -> rebuild it ourselves)
+      3) atomic alias swap
+
+    The previous version behind the alias is NOT dropped here: a job that
+    resolved the alias earlier may still be matching against it. It is
+    stamped "retired_at" and reclaimed by gc_unreferenced_versions() once
+    its grace period has passed. Match against the returned "collection"
+    (pinned version, never the alias).
+
+    qdrant_cfg.collection_name is used as the collection name prefix.
+    create_fn creates an empty collection (default: single named vector).
+
+    Output:
+      {"alias": "...", "collection": "...", "status": "shared|built|rebuilt", "previous": "..."|None}
+    """
+    client = get_qdrant_client(qdrant_cfg)
+    version = versioned_collection_name(qdrant_cfg.collection_name, model_name, fingerprint)
+    version_cfg = replace(qdrant_cfg, collection_name=version)
+
+    status = "shared"
+
+    if _point_count(client, version) != expected_points:
+        created = False
+        if not _collection_exists(client, version):
+            try:
+                create_fn(client, version_cfg)
+                _stamp(client, version, "created_at")
+                created = True
+            except Exception:
+                # lost the race: another job created it
+                created = False
+
+        if created:
+            build_fn(version_cfg)
+            status = "built"
+        else:
+            deadline = time.monotonic() + wait_timeout
+            while _point_count(client, version) != expected_points:
+                if time.monotonic() > deadline:
+                    # builder died half way -> take over
+                    try:
+                        client.delete_collection(collection_name=version)
+                    except Exception:
+                        pass
+                    create_fn(client, version_cfg)
+                    _stamp(client, version, "created_at")
+                    build_fn(version_cfg)
+                    status = "rebuilt"
+                    break
+                time.sleep(poll_interval)
+
+    previous = swap_alias(client, alias, version)
+    if previous == version:
+        previous = None
+    elif previous is not None:
+        # grace period for jobs still matching against it starts now
+        _stamp(client, previous, "retired_at")
+
+    return {"alias": alias, "collection": version, "status": status, "previous": previous}
+
+
+def gc_unreferenced_versions(
+    qdrant_cfg: QdrantConfig,
+    grace_seconds: float = 3600.0,
+) -> List[str]:
+    """
+    Deletes '<prefix>__*' version collections that no alias points to and
+    that were retired (or, never aliased, created) more than grace_seconds ago.
+
+    The grace period protects jobs still matching against a version they
+    pinned before the alias was swapped, and versions another job is still
+    building; keep it above the longest mapping run.
+
+    Versions without timestamps (created before tracking / backend without
+    collection metadata) are only dropped with grace_seconds=0.
+    """
+    client = get_qdrant_client(qdrant_cfg)
+    prefix = f"{qdrant_cfg.collection_name}__"
+    referenced = set(_alias_map(client).values())
+    now = time.time()
+
+    dropped = []
+    for c in client.get_collections().collections:
+        if not c.name.startswith(prefix) or c.name in referenced:
+            continue
+
+        if grace_seconds > 0:
+            age = _version_age(client, c.name, now)
+            if age is None or age < grace_seconds:
+                continue
+
+        try:
+            client.delete_collection(collection_name=c.name)
+            dropped.append(c.name)
+        except Exception:
+            pass
+
+    return dropped
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -48,11 +48,80 @@ class DBConfig:
 
         raise ValueError(f"Unsupported db_type: {self.db_type}")
 
+    def sqlalchemy_async_url(self) -> str:
+        """
+        Same target as sqlalchemy_url() with an asyncio driver
+        (asyncpg / aiomysql / aioodbc / oracledb_async / aiosqlite).
+        """
+        t = (self.db_type or "").lower().strip()
+
+        if t in ["postgres", "postgresql"]:
+            return (
+                f"postgresql+asyncpg://{self.username}:{self.password}"
+                f"@{self.host}:{self.port}/{self.database}"
+            )
+
+        if t == "mysql":
+            return (
+                f"mysql+aiomysql://{self.username}:{self.password}"
+                f"@{self.host}:{self.port}/{self.database}"
+            )
+
+        if t in ["mssql", "sqlserver"]:
+            driver = "ODBC Driver 17 for SQL Server"
+            return (
+                f"mssql+aioodbc://{self.username}:{self.password}"
+                f"@{self.host}:{self.port}/{self.database}"
+                f"?driver={driver.replace(' ', '+')}"
+            )
+
+        if t == "oracle":
+            return (
+                f"oracle+oracledb_async://{self.username}:{self.password}"
+                f"@{self.host}:{self.port}/?service_name={self.database}"
+            )
+
+        if t == "sqlite":
+            path = self.sqlite_path or ":memory:"
+            return f"sqlite+aiosqlite:///{path}"
+
+        raise ValueError(f"Unsupported db_type: {self.db_type}")
+
+
+@dataclass
+class HnswConfig:
+    """
+    HNSW graph settings applied when a collection is created
+    (None = Qdrant default)
+
+      m                   : edges per node (higher -> better recall, more RAM)
+      ef_construct        : candidate list size while building the graph
+      full_scan_threshold : segments below this size (KB of vectors) are
+                            brute-forced instead of using the graph
+    """
+    m: Optional[int] = None
+    ef_construct: Optional[int] = None
+    full_scan_threshold: Optional[int] = None
+
 
 @dataclass
 class QdrantConfig:
     """
     One unified QdrantConfig for all modules
+
+    Connection modes:
+      - server   : host / port (default, docker/qdrant)
+      - in-memory: location=":memory:"  (embedded, no server process)
+      - on-disk  : path="./qdrant_local" (embedded, persisted locally)
+
+    Index / search tuning (see qdrant_tuning.sweep_hnsw_params):
+      - hnsw_config  : HnswConfig(...) used by the indexers on create
+      - shard_number : shards per collection (server / cluster only)
+      - hnsw_ef      : per-search candidate list size (None = Qdrant default)
+      - exact        : True -> brute-force search (ground truth, no HNSW)
+
+    Embedded mode always searches exhaustively; these settings only change
+    latency / recall on a Qdrant server.
     """
     host: str = "localhost"
     port: int = 6333
@@ -64,8 +133,115 @@ class QdrantConfig:
     vector_name: str = "dense_vector"
     vector_size: int = 384
 
+    # embedded local mode (takes priority over host/port)
+    location: Optional[str] = None
+    path: Optional[str] = None
+
+    # HNSW build / search parameters
+    hnsw_config: Optional[HnswConfig] = None
+    shard_number: Optional[int] = None
+    hnsw_ef: Optional[int] = None
+    exact: bool = False
+
 
 @dataclass
 class GroqConfig:
     api_key: str
     model: str = "llama-3.1-8b-instant"
+
+
+@dataclass
+class EncodingConfig:
+    """
+    Embedding batch scheduler settings (shared by MiniLM / MPNet pipelines)
+
+      token_budget   : max padded tokens per batch (batch_size * longest item)
+      max_batch_size : hard cap on items per batch
+      max_seq_length : truncate inputs to this many tokens (None = model default)
+    """
+    token_budget: int = 8192
+    max_batch_size: int = 256
+    max_seq_length: Optional[int] = None
+
+
+@dataclass
+class EmbeddingServiceConfig:
+    """
+    In-process micro-batching encode service (one worker thread per model)
+
+      enabled         : False -> callers encode directly on the model
+      max_batch_texts : stop coalescing once this many texts are queued
+      max_wait_ms     : latency window to wait for more concurrent requests
+    """
+    enabled: bool = True
+    max_batch_texts: int = 512
+    max_wait_ms: float = 5.0
+
+
+@dataclass
+class RerankConfig:
+    """
+    Cross-encoder second stage over the fused candidates
+
+      model_name : sentence-transformers CrossEncoder (small CPU model)
+      backend    : "torch" | "onnx" (onnx needs sentence-transformers[onnx])
+      top_k      : fused candidates rescored per source column
+      max_pairs  : total (source, candidate) pairs per run; columns with the
+                   smallest top-1 / top-2 fused margin are rescored first
+      weight     : final_score = (1 - weight) * fused + weight * rerank
+      batch_size : pairs per CrossEncoder.predict batch
+      max_length : max tokens per pair
+    """
+    model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    backend: str = "torch"
+    top_k: int = 5
+    max_pairs: int = 2000
+    weight: float = 0.5
+    batch_size: int = 64
+    max_length: int = 128
+
+
+@dataclass
+class ServiceConfig:
+    """
+    Long-running mapping service (schema_matching_toolkit.service)
+
+      host / port      : HTTP listen address
+      unix_socket      : path -> serve HTTP on a Unix socket instead of TCP
+      workers          : jobs executed concurrently (thread pool)
+      max_queue        : queued jobs before new submissions get HTTP 429
+      max_finished     : finished jobs (status + result) kept in memory
+      warm_models      : loaded at startup: "minilm", "mpnet", "rerank"
+      output_dir       : mapping jobs without "output_file" save to
+                         <output_dir>/<job_id>.<format>; the file is removed
+                         when the job is evicted from the finished list
+    """
+    host: str = "127.0.0.1"
+    port: int = 8765
+    unix_socket: Optional[str] = None
+    workers: int = 2
+    max_queue: int = 32
+    max_finished: int = 1000
+    warm_models: Tuple[str, ...] = ("minilm", "mpnet")
+    output_dir: str = "service_outputs"
+
+
+@dataclass
+class TelemetryConfig:
+    """
+    Spans + metrics (schema_matching_toolkit.telemetry)
+
+      enabled        : False -> every span / counter / histogram is a no-op
+      in_memory      : keep spans in an InMemoryExporter (span_summary())
+      jsonl_path     : append spans + metric snapshots as JSON lines
+      opentelemetry  : bridge to the global OpenTelemetry tracer / meter
+                       (needs opentelemetry-api + a configured SDK)
+      service_name   : OpenTelemetry instrumentation scope name
+      max_spans      : in-memory span cap (oldest dropped first)
+    """
+    enabled: bool = True
+    in_memory: bool = True
+    jsonl_path: Optional[str] = None
+    opentelemetry: bool = False
+    service_name: str = "schema_matching_toolkit"
+    max_spans: int = 100_000
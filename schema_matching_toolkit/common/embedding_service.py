@@ -0,0 +1,293 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import astuple, dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import EmbeddingServiceConfig, EncodingConfig
+from schema_matching_toolkit.common.encoding import encode_texts
+
+
+@dataclass
+class _EncodeRequest:
+    texts: List[str]
+    encoding: EncodingConfig
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingService:
+    """
+    Coalesces encode requests from many threads / asyncio tasks into one
+    model batch.
+
+    The worker thread takes the first queued request, then keeps draining the
+    queue until `max_wait_ms` has passed or `max_batch_texts` texts are
+    collected. Requests with the same EncodingConfig are encoded together
+    (encode_texts: length-bucketed, token-budgeted) and each caller gets back
+    only its own rows. Only the worker thread touches the model.
+    """
+
+    def __init__(self, model, cfg: Optional[EmbeddingServiceConfig] = None):
+        self.model = model
+        self.cfg = cfg or EmbeddingServiceConfig()
+
+        self._queue: "queue.Queue[Optional[_EncodeRequest]]" = queue.Queue()
+        self._closed = False
+        self._stats = {"requests": 0, "batches": 0, "texts": 0}
+        self._stats_lock = threading.Lock()
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"embedding-service-{id(model):x}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def submit(self, texts: List[str], encoding: Optional[EncodingConfig] = None) -> Future:
+        if self._closed:
+            raise ValueError("EmbeddingService is closed")
+
+        fut: Future = Future()
+        self._queue.put(_EncodeRequest(list(texts), encoding or EncodingConfig(), fut))
+        return fut
+
+    def encode(
+        self,
+        texts: List[str],
+        encoding: Optional[EncodingConfig] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Blocking encode (thread-safe). Output = (vectors, stats) like encode_texts().
+        """
+        return self.submit(texts, encoding).result(timeout=timeout)
+
+    async def encode_async(
+        self,
+        texts: List[str],
+        encoding: Optional[EncodingConfig] = None,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Awaitable encode for asyncio callers (does not block the event loop).
+        """
+        return await asyncio.wrap_future(self.submit(texts, encoding))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["avg_requests_per_batch"] = (
+            round(out["requests"] / out["batches"], 2) if out["batches"] else 0.0
+        )
+        return out
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout=timeout)
+
+    # -------------------------
+    # Worker
+    # -------------------------
+    def _collect(self, first: _EncodeRequest) -> Tuple[List[_EncodeRequest], bool]:
+        batch = [first]
+        n_texts = len(first.texts)
+        deadline = time.perf_counter() + self.cfg.max_wait_ms / 1000.0
+
+        while n_texts < self.cfg.max_batch_texts:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                req = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if req is None:
+                return batch, True
+            batch.append(req)
+            n_texts += len(req.texts)
+
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch, stop = self._collect(first)
+            self._process(batch)
+
+            if stop:
+                break
+
+        # fail anything still queued after close()
+        while True:
+            try:
+                req = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if req is not None and not req.future.done():
+                req.future.set_exception(ValueError("EmbeddingService is closed"))
+
+    def _process(self, batch: List[_EncodeRequest]) -> None:
+        groups: Dict[Tuple, List[_EncodeRequest]] = {}
+        for req in batch:
+            if req.future.set_running_or_notify_cancel():
+                groups.setdefault(astuple(req.encoding), []).append(req)
+
+        for reqs in groups.values():
+            texts = [t for r in reqs for t in r.texts]
+            started = time.perf_counter()
+
+            try:
+                vectors, batch_stats = encode_texts(self.model, texts, reqs[0].encoding)
+            except Exception as e:
+                for r in reqs:
+                    r.future.set_exception(e)
+                continue
+
+            with self._stats_lock:
+                self._stats["requests"] += len(reqs)
+                self._stats["batches"] += 1
+                self._stats["texts"] += len(texts)
+
+            offset = 0
+            for r in reqs:
+                n = len(r.texts)
+                r.future.set_result(
+                    (
+                        vectors[offset : offset + n],
+                        {
+                            "texts": n,
+                            "service": True,
+                            "queue_wait_seconds": round(started - r.enqueued_at, 4),
+                            "coalesced_requests": len(reqs),
+                            "coalesced_texts": len(texts),
+                            "batch": batch_stats,
+                        },
+                    )
+                )
+                offset += n
+
+
+# -------------------------
+# Shared services (one per model instance)
+# -------------------------
+_SERVICES: Dict[int, EmbeddingService] = {}
+_SERVICES_LOCK = threading.Lock()
+_SERVICE_CFG = EmbeddingServiceConfig()
+
+
+def configure_embedding_service(cfg: EmbeddingServiceConfig) -> None:
+    """
+    Sets the config used by embed_texts(); running services pick up the
+    new latency window / batch size immediately.
+    """
+    global _SERVICE_CFG
+    with _SERVICES_LOCK:
+        _SERVICE_CFG = cfg
+        for svc in _SERVICES.values():
+            svc.cfg = cfg
+
+
+def get_embedding_service(model) -> EmbeddingService:
+    with _SERVICES_LOCK:
+        svc = _SERVICES.get(id(model))
+        if svc is None or svc._closed:
+            svc = EmbeddingService(model, _SERVICE_CFG)
+            _SERVICES[id(model)] = svc
+        return svc
+
+
+def close_embedding_services() -> None:
+    with _SERVICES_LOCK:
+        for svc in _SERVICES.values():
+            svc.close()
+        _SERVICES.clear()
+
+
+def _dedupe(texts: List[str]) -> Tuple[List[str], np.ndarray]:
+    unique: Dict[str, int] = {}
+    inverse = np.fromiter(
+        (unique.setdefault(t, len(unique)) for t in texts),
+        dtype=np.int64,
+        count=len(texts),
+    )
+    return list(unique), inverse
+
+
+def _fan_out(
+    texts: List[str],
+    unique_texts: List[str],
+    inverse: np.ndarray,
+    vectors: np.ndarray,
+    stats: Dict[str, Any],
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    stats = {
+        **stats,
+        "total_texts": len(texts),
+        "unique_texts": len(unique_texts),
+        "unique_ratio": round(len(unique_texts) / len(texts), 4) if texts else 1.0,
+    }
+
+    if len(unique_texts) == len(texts):
+        return vectors, stats
+
+    # ✅ fan vectors back out to every duplicate
+    return vectors[inverse], stats
+
+
+def embed_texts(
+    model,
+    texts: List[str],
+    encoding: Optional[EncodingConfig] = None,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Entry point for matchers / indexers.
+
+    Identical texts are encoded once and fanned back out (stats report
+    "total_texts", "unique_texts", "unique_ratio").
+
+    Goes through the shared micro-batching service of `model` (so concurrent
+    callers share model batches), or straight to encode_texts() when the
+    service is disabled.
+    """
+    unique_texts, inverse = _dedupe(texts)
+
+    if not _SERVICE_CFG.enabled or not unique_texts:
+        vectors, stats = encode_texts(model, unique_texts, encoding)
+    else:
+        vectors, stats = get_embedding_service(model).encode(unique_texts, encoding)
+
+    return _fan_out(texts, unique_texts, inverse, vectors, stats)
+
+
+async def embed_texts_async(
+    model,
+    texts: List[str],
+    encoding: Optional[EncodingConfig] = None,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    embed_texts() for asyncio callers: awaits the shared service (or runs
+    encode_texts() in the default executor), never blocking the event loop.
+    """
+    from schema_matching_toolkit.common.async_utils import run_blocking
+
+    unique_texts, inverse = _dedupe(texts)
+
+    if not _SERVICE_CFG.enabled or not unique_texts:
+        vectors, stats = await run_blocking(encode_texts, model, unique_texts, encoding)
+    else:
+        vectors, stats = await get_embedding_service(model).encode_async(unique_texts, encoding)
+
+    return _fan_out(texts, unique_texts, inverse, vectors, stats)
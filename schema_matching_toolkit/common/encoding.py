@@ -0,0 +1,184 @@
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import EncodingConfig
+from schema_matching_toolkit.telemetry import counter, span, traced
+
+
+def _tokenize(model, texts: List[str], max_len: int) -> Tuple[List[int], Optional[Dict[str, List[List[int]]]]]:
+    """
+    Tokenized length per text (special tokens included, truncated to max_len)
+    plus the token ids themselves, which are fed to the model as-is.
+
+    Falls back to whitespace words (ids = None -> model.encode()) when the
+    model has no HF tokenizer.
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None or not hasattr(tokenizer, "pad"):
+        return [min(len(t.split()) + 2, max_len) for t in texts], None
+
+    enc = tokenizer(
+        texts,
+        add_special_tokens=True,
+        truncation=True,
+        max_length=max_len,
+    )
+    features = {k: enc[k] for k in enc.keys()}
+    return [len(x) for x in features["input_ids"]], features
+
+
+def _encode_tokenized(model, features: Dict[str, List[List[int]]], batch: List[int], normalize: bool) -> np.ndarray:
+    """
+    SentenceTransformer forward pass on already tokenized (and truncated)
+    texts: padded to the batch's longest item, no second tokenization and
+    no change to the shared model's max_seq_length.
+    """
+    import torch
+
+    tokenizer = model.tokenizer
+    padded = tokenizer.pad({k: [v[i] for i in batch] for k, v in features.items()}, padding=True, return_tensors="pt")
+    padded = {k: v.to(model.device) for k, v in padded.items()}
+
+    with torch.inference_mode():
+        emb = model(padded)["sentence_embedding"]
+        if normalize:
+            emb = torch.nn.functional.normalize(emb, p=2, dim=1)
+
+    return emb.float().cpu().numpy()
+
+
+def plan_batches(
+    lengths: List[int],
+    token_budget: int = 8192,
+    max_batch_size: int = 256,
+) -> List[List[int]]:
+    """
+    Groups text indices into batches sorted by token length (longest first),
+    so each batch pads to a similar length.
+
+    A batch grows while batch_size * longest_item <= token_budget
+    (a single over-budget item still gets its own batch).
+
+    Output:
+      [[i, j, ...], ...]   indices into the original list
+    """
+    order = sorted(range(len(lengths)), key=lambda i: -lengths[i])
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_max = 0
+
+    for i in order:
+        n = lengths[i]
+        longest = max(current_max, n)
+
+        if current and ((len(current) + 1) * longest > token_budget or len(current) >= max_batch_size):
+            batches.append(current)
+            current, longest = [], n
+
+        current.append(i)
+        current_max = longest
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+@traced()
+def encode_texts(
+    model,
+    texts: List[str],
+    encoding: Optional[EncodingConfig] = None,
+    normalize_embeddings: bool = True,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Length-bucketed, token-budgeted SentenceTransformer encoding.
+
+    Input:
+      model    = SentenceTransformer(...)
+      texts    = ["table col dtype desc", ...]
+      encoding = EncodingConfig(...) (optional); max_seq_length truncates
+                 this call only (thread-safe on a shared model)
+
+    Texts are tokenized once: the ids measured for batching are the ids
+    the model runs on.
+
+    Output:
+      (vectors float32 [N, dim] in the ORIGINAL order, stats)
+
+      stats = {
+        "texts": N, "batches": B,
+        "real_tokens": ..., "padded_tokens": ..., "padding_waste": 0.12,
+        "encode_seconds": ..., "tokens_per_second": ...,
+        "batch_timings": [{"size": 64, "max_tokens": 32, "seconds": 0.05}, ...]
+      }
+    """
+    encoding = encoding or EncodingConfig()
+
+    # ✅ truncation is applied per call on the token ids: the model is shared
+    #    by every thread, so its max_seq_length is never modified
+    max_len = int(encoding.max_seq_length or getattr(model, "max_seq_length", None) or 512)
+    dim = model.get_sentence_embedding_dimension()
+
+    vectors = np.zeros((len(texts), dim or 0), dtype=np.float32)
+    stats: Dict[str, Any] = {
+        "texts": len(texts),
+        "batches": 0,
+        "real_tokens": 0,
+        "padded_tokens": 0,
+        "padding_waste": 0.0,
+        "encode_seconds": 0.0,
+        "tokens_per_second": 0.0,
+        "batch_timings": [],
+    }
+
+    if not texts:
+        return vectors, stats
+
+    lengths, features = _tokenize(model, texts, max_len)
+    batches = plan_batches(lengths, encoding.token_budget, encoding.max_batch_size)
+
+    total_start = time.perf_counter()
+
+    for batch in batches:
+        batch_max = max(lengths[i] for i in batch)
+
+        t0 = time.perf_counter()
+        with span("encode_texts.batch", size=len(batch), max_tokens=batch_max):
+            if features is not None:
+                out = _encode_tokenized(model, features, batch, normalize_embeddings)
+            else:
+                out = model.encode(
+                    [texts[i] for i in batch],
+                    batch_size=len(batch),
+                    normalize_embeddings=normalize_embeddings,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+        seconds = time.perf_counter() - t0
+
+        # ✅ restore original order
+        vectors[batch] = np.asarray(out, dtype=np.float32)
+
+        stats["real_tokens"] += sum(lengths[i] for i in batch)
+        stats["padded_tokens"] += batch_max * len(batch)
+        stats["batch_timings"].append(
+            {"size": len(batch), "max_tokens": batch_max, "seconds": round(seconds, 4)}
+        )
+
+    elapsed = time.perf_counter() - total_start
+
+    stats["batches"] = len(batches)
+    counter("encode.texts", len(texts))
+    counter("encode.real_tokens", stats["real_tokens"])
+    counter("encode.padded_tokens", stats["padded_tokens"])
+    stats["encode_seconds"] = round(elapsed, 4)
+    if stats["padded_tokens"]:
+        stats["padding_waste"] = round(1.0 - stats["real_tokens"] / stats["padded_tokens"], 4)
+    if elapsed > 0:
+        stats["tokens_per_second"] = round(stats["real_tokens"] / elapsed, 1)
+
+    return vectors, stats
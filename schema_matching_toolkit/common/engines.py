@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict
+
+from schema_matching_toolkit.common.db_config import DBConfig
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+_ENGINES: Dict[str, Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_engine(cfg: DBConfig) -> Engine:
+    """
+    Returns a shared SQLAlchemy engine (one connection pool) per database URL.
+
+    Extraction, profiling and relationship detection on the same database
+    reuse pooled connections instead of opening a new engine per call
+    (matters for the long-running service, see schema_matching_toolkit.service).
+    """
+    from sqlalchemy import create_engine
+
+    url = cfg.sqlalchemy_url()
+
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            engine = create_engine(url, pool_pre_ping=True)
+            _ENGINES[url] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """
+    Closes all pooled connections of the cached engines.
+    """
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            try:
+                engine.dispose()
+            except Exception:
+                pass
+        _ENGINES.clear()
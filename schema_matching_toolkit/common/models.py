@@ -0,0 +1,52 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+_MODELS: Dict[str, Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+_CROSS_ENCODERS: Dict[Tuple, Any] = {}
+
+
+def get_sentence_model(model_name: str):
+    """
+    Returns a shared SentenceTransformer for model_name.
+
+    Loaded on first use (not at import time), so entry points that never
+    embed don't pull in sentence_transformers / torch.
+    """
+    with _MODELS_LOCK:
+        model = _MODELS.get(model_name)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(model_name)
+            _MODELS[model_name] = model
+        return model
+
+
+def get_cross_encoder(model_name: str, backend: str = "torch", max_length: Optional[int] = None):
+    """
+    Returns a shared sentence-transformers CrossEncoder (loaded on first use).
+
+    backend = "onnx" -> ONNX Runtime on CPU (sentence-transformers >= 4 with
+              the onnx extra); "torch" -> default PyTorch model
+    """
+    backend = (backend or "torch").lower().strip()
+    if backend not in {"torch", "onnx"}:
+        raise ValueError("backend must be one of: torch, onnx")
+
+    key = (model_name, backend, max_length)
+
+    with _MODELS_LOCK:
+        model = _CROSS_ENCODERS.get(key)
+        if model is None:
+            from sentence_transformers import CrossEncoder
+
+            kwargs: Dict[str, Any] = {"max_length": max_length}
+            if backend != "torch":
+                kwargs["backend"] = backend
+
+            model = CrossEncoder(model_name, **kwargs)
+            _CROSS_ENCODERS[key] = model
+        return model
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import threading
+import weakref
+
+from schema_matching_toolkit.common.db_config import QdrantConfig
+from schema_matching_toolkit.utils.type_family import (
+    UNKNOWN,
+    compatible_families,
+    type_family,
+)
+
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient, QdrantClient
+    from qdrant_client.models import Filter, SearchParams
+
+
+TYPE_FAMILY_FIELD = "type_family"
+
+
+_CLIENTS: Dict[Tuple, QdrantClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# event loop -> {client key: AsyncQdrantClient}; weak keys, so a finished
+# loop (asyncio.run) drops its clients and a new loop never inherits them
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[Any, Dict[Tuple, AsyncQdrantClient]]" = weakref.WeakKeyDictionary()
+
+
+def _client_key(cfg: QdrantConfig) -> Tuple:
+    if cfg.path:
+        return ("path", cfg.path)
+    if cfg.location == ":memory:":
+        return ("memory",)
+    if cfg.location:
+        return ("url", cfg.location)
+    return ("server", cfg.host, int(cfg.port))
+
+
+def get_qdrant_client(cfg: QdrantConfig) -> QdrantClient:
+    """
+    Returns a shared QdrantClient for the given config.
+
+    Clients are cached per connection target. This matters for embedded mode:
+    every QdrantClient(":memory:") is its own empty store and an on-disk `path`
+    can only be opened by one client, so indexers and matchers must reuse
+    the same instance to see each other's collections.
+    """
+    from qdrant_client import QdrantClient
+
+    key = _client_key(cfg)
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is not None:
+            return client
+
+        if key[0] == "path":
+            client = QdrantClient(path=cfg.path)
+        elif key[0] == "memory":
+            client = QdrantClient(location=":memory:")
+        elif key[0] == "url":
+            client = QdrantClient(location=cfg.location)
+        else:
+            client = QdrantClient(host=cfg.host, port=cfg.port)
+
+        _CLIENTS[key] = client
+        return client
+
+
+def get_async_qdrant_client(cfg: QdrantConfig) -> AsyncQdrantClient:
+    """
+    Returns a shared AsyncQdrantClient for the given config and the running
+    event loop (async clients are bound to the loop that created them).
+
+    Clients are cached per loop object (not its id, which a later loop can
+    reuse) and released together with the loop.
+
+    Note: embedded mode (":memory:" / path) gives the async client its OWN
+    local store, so sync indexers and async matchers only see each other's
+    collections on a Qdrant server.
+    """
+    import asyncio
+
+    from qdrant_client import AsyncQdrantClient
+
+    loop = asyncio.get_running_loop()
+    key = _client_key(cfg)
+
+    with _CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is not None:
+            return client
+
+        if key[0] == "path":
+            client = AsyncQdrantClient(path=cfg.path)
+        elif key[0] == "memory":
+            client = AsyncQdrantClient(location=":memory:")
+        elif key[0] == "url":
+            client = AsyncQdrantClient(location=cfg.location)
+        else:
+            client = AsyncQdrantClient(host=cfg.host, port=cfg.port)
+
+        clients[key] = client
+        return client
+
+
+async def close_async_qdrant_clients() -> None:
+    """
+    Closes the cached async clients of the running event loop.
+    """
+    import asyncio
+
+    with _CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+
+    for client in clients.values():
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+def close_qdrant_clients() -> None:
+    """
+    Closes all cached clients (releases embedded on-disk locks).
+    """
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _CLIENTS.clear()
+
+
+def collection_params(qdrant_cfg: QdrantConfig) -> Dict[str, Any]:
+    """
+    create_collection() kwargs for the configured HNSW graph / shard count
+    (empty -> Qdrant defaults).
+    """
+    from qdrant_client.models import HnswConfigDiff
+
+    kwargs: Dict[str, Any] = {}
+
+    hnsw = qdrant_cfg.hnsw_config
+    if hnsw is not None:
+        kwargs["hnsw_config"] = HnswConfigDiff(
+            m=hnsw.m,
+            ef_construct=hnsw.ef_construct,
+            full_scan_threshold=hnsw.full_scan_threshold,
+        )
+
+    if qdrant_cfg.shard_number is not None:
+        kwargs["shard_number"] = qdrant_cfg.shard_number
+
+    return kwargs
+
+
+def search_params(qdrant_cfg: QdrantConfig) -> Optional[SearchParams]:
+    """
+    Per-search HNSW parameters (None -> Qdrant defaults).
+    """
+    if qdrant_cfg.hnsw_ef is None and not qdrant_cfg.exact:
+        return None
+
+    from qdrant_client.models import SearchParams
+
+    return SearchParams(hnsw_ef=qdrant_cfg.hnsw_ef, exact=qdrant_cfg.exact)
+
+
+def ensure_type_family_index(client: QdrantClient, collection_name: str) -> None:
+    """
+    Creates a keyword payload index on `type_family` so filtered HNSW
+    search only visits compatible points.
+    """
+    from qdrant_client.models import PayloadSchemaType
+
+    try:
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=TYPE_FAMILY_FIELD,
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+    except Exception:
+        # already exists / not supported by this backend
+        pass
+
+
+def recreate_vector_collection(client: QdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    """
+    Delete (if exists) + create a single named-vector cosine collection,
+    then index the type_family payload.
+    """
+    try:
+        client.delete_collection(collection_name=qdrant_cfg.collection_name)
+    except Exception:
+        pass
+
+    create_vector_collection(client, qdrant_cfg)
+
+
+def _vectors_config(qdrant_cfg: QdrantConfig):
+    from qdrant_client.models import Distance, VectorParams
+
+    return {
+        qdrant_cfg.vector_name: VectorParams(
+            size=qdrant_cfg.vector_size,
+            distance=Distance.COSINE,
+        )
+    }
+
+
+def create_vector_collection(client: QdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    """
+    Create a single named-vector cosine collection + type_family index.
+    Raises if the collection already exists.
+    """
+    client.create_collection(
+        collection_name=qdrant_cfg.collection_name,
+        vectors_config=_vectors_config(qdrant_cfg),
+        **collection_params(qdrant_cfg),
+    )
+
+    ensure_type_family_index(client, qdrant_cfg.collection_name)
+
+
+async def recreate_vector_collection_async(client: AsyncQdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    """
+    recreate_vector_collection() for an AsyncQdrantClient.
+    """
+    from qdrant_client.models import PayloadSchemaType
+
+    try:
+        await client.delete_collection(collection_name=qdrant_cfg.collection_name)
+    except Exception:
+        pass
+
+    await client.create_collection(
+        collection_name=qdrant_cfg.collection_name,
+        vectors_config=_vectors_config(qdrant_cfg),
+        **collection_params(qdrant_cfg),
+    )
+
+    try:
+        await client.create_payload_index(
+            collection_name=qdrant_cfg.collection_name,
+            field_name=TYPE_FAMILY_FIELD,
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+    except Exception:
+        pass
+
+
+def type_family_filter(source_dtype: str) -> Optional[Filter]:
+    """
+    Qdrant filter restricting search to target columns whose type family
+    is compatible with the source column type.
+    Returns None for unknown source types (no restriction).
+    """
+    from qdrant_client.models import FieldCondition, Filter, MatchAny
+
+    family = type_family(source_dtype)
+    if family == UNKNOWN:
+        return None
+
+    return Filter(
+        must=[
+            FieldCondition(
+                key=TYPE_FAMILY_FIELD,
+                match=MatchAny(any=compatible_families(family)),
+            )
+        ]
+    )
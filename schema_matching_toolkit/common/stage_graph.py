@@ -0,0 +1,197 @@
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from schema_matching_toolkit.telemetry import record_span, span
+
+
+STAGE_POOLS = ("thread", "process")
+
+
+@dataclass
+class Stage:
+    """
+    One node of a StageGraph.
+
+      fn   : called as fn(inputs) with inputs = {dep_name: dep_result}
+      deps : stages that must finish first
+      pool : "thread" (I/O, GIL-releasing model calls, shared clients) |
+             "process" (pure-Python CPU work; fn and inputs must pickle)
+    """
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    pool: str = "thread"
+
+
+def _timed_call(fn: Callable[[Dict[str, Any]], Any], inputs: Dict[str, Any]) -> Tuple[Any, float, float, str]:
+    # wall clock (not perf_counter) so process-pool timings line up with the parent
+    started = time.time()
+    result = fn(inputs)
+    return result, started, time.time(), f"{os.getpid()}/{threading.current_thread().name}"
+
+
+def _traced_call(name: str, fn: Callable[[Dict[str, Any]], Any], inputs: Dict[str, Any]) -> Tuple[Any, float, float, str]:
+    with span(f"stage.{name}"):
+        return _timed_call(fn, inputs)
+
+
+class StageGraph:
+    """
+    Small dependency-graph executor.
+
+    Every stage runs exactly once, as soon as all of its deps are done,
+    on a bounded thread pool (max_threads) or process pool (max_processes).
+    Independent stages overlap; the first failure cancels everything not yet
+    started and is re-raised.
+
+    Usage:
+      graph = StageGraph()
+      graph.add("source_schema", lambda _: extract_schema(src_cfg))
+      graph.add("target_schema", lambda _: extract_schema(tgt_cfg))
+      graph.add("source_desc", lambda r: describe(r["source_schema"]), deps=["source_schema"])
+      results, timeline = graph.run(max_threads=4)
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[Dict[str, Any]], Any],
+        deps: Optional[List[str]] = None,
+        pool: str = "thread",
+    ) -> "StageGraph":
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        if pool not in STAGE_POOLS:
+            raise ValueError(f"pool must be one of: {', '.join(STAGE_POOLS)}")
+
+        self._stages[name] = Stage(name=name, fn=fn, deps=tuple(deps or ()), pool=pool)
+        return self
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._stages
+
+    # -------------------------
+    # Validation
+    # -------------------------
+    def order(self) -> List[str]:
+        """
+        Topological order (raises ValueError on unknown deps / cycles).
+        """
+        for st in self._stages.values():
+            missing = [d for d in st.deps if d not in self._stages]
+            if missing:
+                raise ValueError(f"Stage '{st.name}' depends on unknown stage(s): {missing}")
+
+        indegree = {name: len(st.deps) for name, st in self._stages.items()}
+        children: Dict[str, List[str]] = {name: [] for name in self._stages}
+        for st in self._stages.values():
+            for d in st.deps:
+                children[d].append(st.name)
+
+        ready = [n for n, deg in indegree.items() if deg == 0]
+        out: List[str] = []
+
+        while ready:
+            n = ready.pop(0)
+            out.append(n)
+            for c in children[n]:
+                indegree[c] -= 1
+                if indegree[c] == 0:
+                    ready.append(c)
+
+        if len(out) != len(self._stages):
+            cyclic = sorted(n for n, deg in indegree.items() if deg > 0)
+            raise ValueError(f"Stage graph has a cycle through: {cyclic}")
+
+        return out
+
+    # -------------------------
+    # Execution
+    # -------------------------
+    def run(
+        self,
+        max_threads: int = 4,
+        max_processes: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Output:
+          (
+            {stage_name: result, ...},
+            [
+              {"stage": "target_schema", "pool": "thread", "deps": [],
+               "start_s": 0.0, "end_s": 1.42, "seconds": 1.42,
+               "worker": "<pid>/stage_0"},
+              ...                       # sorted by start time
+            ]
+          )
+        start_s / end_s are relative to run() start.
+        """
+        self.order()
+
+        needs_processes = any(st.pool == "process" for st in self._stages.values())
+
+        threads = ThreadPoolExecutor(max_workers=max(1, max_threads), thread_name_prefix="stage")
+        processes = ProcessPoolExecutor(max_workers=max_processes) if needs_processes else None
+
+        results: Dict[str, Any] = {}
+        timeline: List[Dict[str, Any]] = []
+        running: Dict[Future, Stage] = {}
+        pending = dict(self._stages)
+        t0 = time.time()
+
+        def _submit_ready() -> None:
+            for name, st in list(pending.items()):
+                if all(d in results for d in st.deps):
+                    inputs = {d: results[d] for d in st.deps}
+                    if st.pool == "process":
+                        fut = processes.submit(_timed_call, st.fn, inputs)
+                    else:
+                        # ✅ stage spans nest under the caller's span
+                        fut = threads.submit(contextvars.copy_context().run, _traced_call, st.name, st.fn, inputs)
+                    running[fut] = st
+                    del pending[name]
+
+        try:
+            _submit_ready()
+
+            while running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+
+                for fut in done:
+                    st = running.pop(fut)
+                    # ✅ first failure aborts the run (not-started stages are cancelled below)
+                    result, started, finished, worker = fut.result()
+
+                    results[st.name] = result
+                    if st.pool == "process":
+                        record_span(f"stage.{st.name}", started, finished, pool="process", worker=worker)
+                    timeline.append(
+                        {
+                            "stage": st.name,
+                            "pool": st.pool,
+                            "deps": list(st.deps),
+                            "start_s": round(started - t0, 4),
+                            "end_s": round(finished - t0, 4),
+                            "seconds": round(finished - started, 4),
+                            "worker": worker,
+                        }
+                    )
+
+                _submit_ready()
+        finally:
+            for fut in running:
+                fut.cancel()
+            threads.shutdown(wait=True)
+            if processes is not None:
+                processes.shutdown(wait=True)
+
+        timeline.sort(key=lambda r: r["start_s"])
+        return results, timeline
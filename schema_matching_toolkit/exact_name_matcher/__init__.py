@@ -0,0 +1,4 @@
+from .normalizer import normalize_identifier, split_identifier
+from .matcher import exact_name_match
+
+__all__ = ["exact_name_match", "normalize_identifier", "split_identifier"]
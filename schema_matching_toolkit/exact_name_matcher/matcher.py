@@ -0,0 +1,107 @@
+from typing import Dict, Any, List, Optional, Sequence
+
+from schema_matching_toolkit.utils.schema_flatten import flatten_schema_columns
+from schema_matching_toolkit.utils.type_family import types_compatible
+from schema_matching_toolkit.telemetry import traced
+
+from .normalizer import normalize_identifier, DEFAULT_STRIP_PREFIXES
+
+
+def _keyed_columns(
+    schema: Dict[str, Any],
+    abbreviations: Optional[Dict[str, str]],
+    strip_prefixes: Sequence[str],
+) -> List[Dict[str, Any]]:
+    cols = flatten_schema_columns(schema)
+
+    for c in cols:
+        c["table_key"] = normalize_identifier(c["table"], abbreviations, strip_prefixes)
+        c["column_key"] = normalize_identifier(c["column"], abbreviations, strip_prefixes)
+
+    return cols
+
+
+@traced()
+def exact_name_match(
+    source_schema: Dict[str, Any],
+    target_schema: Dict[str, Any],
+    abbreviations: Optional[Dict[str, str]] = None,
+    strip_prefixes: Sequence[str] = DEFAULT_STRIP_PREFIXES,
+    require_compatible_types: bool = True,
+) -> Dict[str, Any]:
+    """
+    Exact / normalized-name pre-matching (no model inference).
+
+    Source and target columns are hash-joined on normalized identifiers:
+      1) (table_key, column_key)  -> orders.CustID == tbl_orders.cust_id
+      2) column_key only          -> only if exactly ONE target column has that key
+
+    Ambiguous column-only keys (e.g. customer_id in 10 target tables)
+    are NOT emitted, they are left for the retrievers.
+
+    Output:
+      {
+        "method": "exact_name",
+        "match_count": N,
+        "matches": [
+          {
+            "source": "table.col",
+            "source_type": "...",
+            "best_match": "table.col",
+            "target_type": "...",
+            "confidence": 1.0,
+            "match_level": "table_column" | "column",
+            "match_key": "customer_id"
+          }
+        ]
+      }
+    """
+    source_cols = _keyed_columns(source_schema, abbreviations, strip_prefixes)
+    target_cols = _keyed_columns(target_schema, abbreviations, strip_prefixes)
+
+    # hash indexes over target
+    by_table_column: Dict[tuple, List[Dict[str, Any]]] = {}
+    by_column: Dict[str, List[Dict[str, Any]]] = {}
+
+    for t in target_cols:
+        by_table_column.setdefault((t["table_key"], t["column_key"]), []).append(t)
+        by_column.setdefault(t["column_key"], []).append(t)
+
+    def _typed(cands: List[Dict[str, Any]], src: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not require_compatible_types:
+            return cands
+        return [t for t in cands if types_compatible(src["data_type"], t["data_type"])]
+
+    matches = []
+
+    for src in source_cols:
+        level = "table_column"
+        key = f"{src['table_key']}.{src['column_key']}"
+        cands = _typed(by_table_column.get((src["table_key"], src["column_key"]), []), src)
+
+        if len(cands) != 1:
+            level = "column"
+            key = src["column_key"]
+            cands = _typed(by_column.get(src["column_key"], []), src)
+
+        if len(cands) != 1:
+            continue
+
+        tgt = cands[0]
+        matches.append(
+            {
+                "source": src["id"],
+                "source_type": src["data_type"],
+                "best_match": tgt["id"],
+                "target_type": tgt["data_type"],
+                "confidence": 1.0,
+                "match_level": level,
+                "match_key": key,
+            }
+        )
+
+    return {
+        "method": "exact_name",
+        "match_count": len(matches),
+        "matches": matches,
+    }
@@ -0,0 +1,37 @@
+from typing import Dict, Optional, Sequence
+
+from schema_matching_toolkit.utils.identifier_tokenizer import (
+    DEFAULT_ABBREVIATIONS,  # noqa: F401 (re-exported, defined with the tokenizer)
+    get_identifier_tokenizer,
+    split_identifier,  # noqa: F401 (re-exported, same splitting rule as the tokenizer)
+)
+
+
+DEFAULT_STRIP_PREFIXES = ("tbl_", "tb_", "col_", "fld_")
+
+
+def normalize_identifier(
+    name: str,
+    abbreviations: Optional[Dict[str, str]] = None,
+    strip_prefixes: Sequence[str] = DEFAULT_STRIP_PREFIXES,
+) -> str:
+    """
+    Normalizes a table / column identifier into a join key.
+
+    Steps:
+      1) lowercase + strip common prefixes (tbl_, col_, ...)
+      2) snake / camel / digit splitting
+      3) abbreviation expansion (cust -> customer), including run-together
+         tokens ('custid' -> 'customer_id'), see IdentifierTokenizer
+
+    Example:
+      'CustID', 'cust_id', 'custid', 'tbl_customer_id' -> 'customer_id'
+    """
+    raw = (name or "").strip()
+    lowered = raw.lower()
+    for p in strip_prefixes:
+        if lowered.startswith(p) and len(lowered) > len(p):
+            raw = raw[len(p):]
+            break
+
+    return "_".join(get_identifier_tokenizer(abbreviations).tokenize(raw))
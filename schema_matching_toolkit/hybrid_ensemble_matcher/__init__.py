@@ -1,4 +1,22 @@
 from .matcher import hybrid_ensemble_match
-from .runner import run_hybrid_mapping
+from .runner import run_hybrid_mapping, run_hybrid_mapping_async
+from .compact import (
+    CompactMappingResult,
+    compact_from_dict,
+    compact_to_dict,
+    compact_to_verbose,
+    load_compact_npz,
+    save_compact_npz,
+)
 
-__all__ = ["hybrid_ensemble_match", "run_hybrid_mapping"]
+__all__ = [
+    "hybrid_ensemble_match",
+    "run_hybrid_mapping",
+    "run_hybrid_mapping_async",
+    "CompactMappingResult",
+    "compact_from_dict",
+    "compact_to_dict",
+    "compact_to_verbose",
+    "load_compact_npz",
+    "save_compact_npz",
+]
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+
+COMPACT_VERSION = 1
+
+# candidate score keys first in this order, any other "*_score" after
+_SCORE_ORDER = ["final", "bm25", "minilm", "mpnet", "static", "fused", "rerank"]
+
+# table candidate values (table_cand_scores last axis)
+TABLE_CANDIDATE_FIELDS = ["score", "coverage", "matched_columns"]
+
+
+@dataclass
+class CompactMappingResult:
+    """
+    Column-major mapping result (hybrid_ensemble_match(result_mode="compact")).
+
+      ids          : interned column ids ("table.column"), sources + targets
+      tables       : interned table names
+      score_fields : candidate score names, e.g. ["final", "bm25", "minilm", "mpnet"]
+      match_sources: names behind match_source codes ("ensemble", "exact_name", ...)
+
+      per column match (N rows):
+        source, best       int32   -> ids (best = -1: none)
+        confidence         float32
+        match_source       uint8   -> match_sources
+        cand_ids           int32   [N, k]     -> ids (-1 = padding)
+        cand_scores        float32 [N, k, F]  (NaN = padding / score absent)
+
+      per table match (T rows):
+        table_source, table_best  int32 -> tables
+        table_confidence, table_coverage float32, table_column_count int32
+        table_cand_ids     int32   [T, k]     -> tables (-1 = padding)
+        table_cand_scores  float32 [T, k, 3]  TABLE_CANDIDATE_FIELDS (NaN = padding)
+        (table_coverage NaN -> best_match vote, no table candidates)
+
+      meta : top-level counts / stats of the verbose result
+    """
+    ids: List[str]
+    tables: List[str]
+    score_fields: List[str]
+    match_sources: List[str]
+    source: np.ndarray
+    best: np.ndarray
+    confidence: np.ndarray
+    match_source: np.ndarray
+    cand_ids: np.ndarray
+    cand_scores: np.ndarray
+    table_source: np.ndarray
+    table_best: np.ndarray
+    table_confidence: np.ndarray
+    table_coverage: np.ndarray
+    table_column_count: np.ndarray
+    meta: Dict[str, Any] = field(default_factory=dict)
+    table_cand_ids: np.ndarray = field(default_factory=lambda: np.full((0, 0), -1, dtype=np.int32))
+    table_cand_scores: np.ndarray = field(
+        default_factory=lambda: np.full((0, 0, len(TABLE_CANDIDATE_FIELDS)), np.nan, dtype=np.float32)
+    )
+
+    @property
+    def column_match_count(self) -> int:
+        return int(len(self.source))
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.source, self.best, self.confidence, self.match_source, self.cand_ids, self.cand_scores,
+            self.table_source, self.table_best, self.table_confidence, self.table_coverage,
+            self.table_column_count, self.table_cand_ids, self.table_cand_scores,
+        ]
+        return int(sum(a.nbytes for a in arrays))
+
+
+# -------------------------
+# Build
+# -------------------------
+def build_compact_result(
+    column_matches: List[Dict[str, Any]],
+    table_matches: Optional[List[Dict[str, Any]]] = None,
+    top_k: Optional[int] = None,
+    meta: Optional[Dict[str, Any]] = None,
+) -> CompactMappingResult:
+    """
+    Packs hybrid column matches (+ table matches) into a CompactMappingResult,
+    keeping at most top_k candidates per column (None = all).
+    """
+    ids: Dict[str, int] = {}
+    tables: Dict[str, int] = {}
+    sources: Dict[str, int] = {}
+
+    def _id(x: Optional[str]) -> int:
+        return -1 if x is None else ids.setdefault(x, len(ids))
+
+    def _table(x: Optional[str]) -> int:
+        return -1 if x is None else tables.setdefault(x, len(tables))
+
+    fields_seen = set()
+    for m in column_matches:
+        for c in m.get("candidates", [])[:top_k]:
+            fields_seen.update(key[:-6] for key in c if key.endswith("_score"))
+
+    score_fields = [f for f in _SCORE_ORDER if f in fields_seen]
+    score_fields += sorted(fields_seen - set(score_fields))
+    field_index = {f: i for i, f in enumerate(score_fields)}
+
+    n = len(column_matches)
+    k = max((len(m.get("candidates", [])[:top_k]) for m in column_matches), default=0)
+
+    source = np.empty(n, dtype=np.int32)
+    best = np.empty(n, dtype=np.int32)
+    confidence = np.empty(n, dtype=np.float32)
+    match_source = np.empty(n, dtype=np.uint8)
+    cand_ids = np.full((n, k), -1, dtype=np.int32)
+    cand_scores = np.full((n, k, len(score_fields)), np.nan, dtype=np.float32)
+
+    for i, m in enumerate(column_matches):
+        source[i] = _id(m["source"])
+        best[i] = _id(m.get("best_match"))
+        confidence[i] = m.get("confidence", 0.0)
+        match_source[i] = sources.setdefault(m.get("match_source", "ensemble"), len(sources))
+
+        for j, c in enumerate(m.get("candidates", [])[:top_k]):
+            cand_ids[i, j] = _id(c.get("candidate", c.get("target")))
+            for key, value in c.items():
+                if key.endswith("_score") and value is not None:
+                    cand_scores[i, j, field_index[key[:-6]]] = value
+
+    table_matches = table_matches or []
+
+    table_source = np.asarray([_table(t["source_table"]) for t in table_matches], dtype=np.int32)
+    table_best = np.asarray([_table(t.get("best_match_table")) for t in table_matches], dtype=np.int32)
+
+    # score-matrix table matches (table_pooling) carry ranked target tables
+    t_k = max((len(t.get("candidates") or []) for t in table_matches), default=0)
+    table_cand_ids = np.full((len(table_matches), t_k), -1, dtype=np.int32)
+    table_cand_scores = np.full((len(table_matches), t_k, len(TABLE_CANDIDATE_FIELDS)), np.nan, dtype=np.float32)
+
+    for t, tm in enumerate(table_matches):
+        for j, c in enumerate(tm.get("candidates") or []):
+            table_cand_ids[t, j] = _table(c["target_table"])
+            table_cand_scores[t, j] = [c.get(f, np.nan) for f in TABLE_CANDIDATE_FIELDS]
+
+    return CompactMappingResult(
+        ids=list(ids),
+        tables=list(tables),
+        score_fields=score_fields,
+        match_sources=list(sources),
+        source=source,
+        best=best,
+        confidence=confidence,
+        match_source=match_source,
+        cand_ids=cand_ids,
+        cand_scores=cand_scores,
+        table_source=table_source,
+        table_best=table_best,
+        table_confidence=np.asarray([t.get("confidence") or 0.0 for t in table_matches], dtype=np.float32),
+        table_coverage=np.asarray(
+            [np.nan if t.get("coverage") is None else t["coverage"] for t in table_matches], dtype=np.float32
+        ),
+        table_column_count=np.asarray([t.get("column_match_count", 0) for t in table_matches], dtype=np.int32),
+        meta=dict(meta or {}),
+        table_cand_ids=table_cand_ids,
+        table_cand_scores=table_cand_scores,
+    )
+
+
+# -------------------------
+# Convert back
+# -------------------------
+def _round(x: float) -> float:
+    return round(float(x), 4)
+
+
+def compact_column_matches(result: CompactMappingResult) -> List[Dict[str, Any]]:
+    """
+    Verbose column match dicts (same keys as hybrid_ensemble_match), in order.
+    """
+    ids, fields = result.ids, result.score_fields
+    out = []
+
+    for i in range(len(result.source)):
+        candidates = []
+        for j, cid in enumerate(result.cand_ids[i].tolist()):
+            if cid < 0:
+                break
+            cand: Dict[str, Any] = {"candidate": ids[cid]}
+            for f, v in zip(fields, result.cand_scores[i, j].tolist()):
+                if v == v:  # not NaN
+                    cand[f"{f}_score"] = _round(v)
+            candidates.append(cand)
+
+        best = int(result.best[i])
+        out.append(
+            {
+                "source": ids[int(result.source[i])],
+                "best_match": ids[best] if best >= 0 else None,
+                "confidence": _round(result.confidence[i]),
+                "match_source": result.match_sources[int(result.match_source[i])],
+                "candidates": candidates,
+            }
+        )
+
+    return out
+
+
+def _table_candidates(result: CompactMappingResult, t: int) -> List[Dict[str, Any]]:
+    if t >= len(result.table_cand_ids):
+        return []
+
+    candidates = []
+    for j, tid in enumerate(result.table_cand_ids[t].tolist()):
+        if tid < 0:
+            break
+        score, coverage, matched = result.table_cand_scores[t, j].tolist()
+        candidates.append(
+            {
+                "target_table": result.tables[tid],
+                "score": _round(score),
+                "coverage": _round(coverage),
+                "matched_columns": int(matched),
+            }
+        )
+    return candidates
+
+
+def compact_to_verbose(result: CompactMappingResult) -> Dict[str, Any]:
+    """
+    Rebuilds today's hybrid_ensemble_match() output (tables first with nested
+    column matches, or flat "column_matches") from the compact form.
+    """
+    column_matches = compact_column_matches(result)
+    out: Dict[str, Any] = {k: v for k, v in result.meta.items() if k != "include_table_matches"}
+    out["column_match_count"] = len(column_matches)
+
+    if not result.meta.get("include_table_matches", True):
+        out["column_matches"] = column_matches
+        return out
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for m in column_matches:
+        if "." in m["source"]:
+            grouped.setdefault(m["source"].split(".", 1)[0], []).append(m)
+
+    tables_out = []
+    for t in range(len(result.table_source)):
+        src_table = result.tables[int(result.table_source[t])]
+        best = int(result.table_best[t])
+        table_out = {
+            "source_table": src_table,
+            "best_match_table": result.tables[best] if best >= 0 else None,
+            "confidence": _round(result.table_confidence[t]),
+            "column_match_count": int(result.table_column_count[t]),
+            "column_matches": grouped.get(src_table, []),
+        }
+        if not np.isnan(result.table_coverage[t]):
+            table_out["coverage"] = _round(result.table_coverage[t])
+            table_out["table_candidates"] = _table_candidates(result, t)
+        tables_out.append(table_out)
+
+    out["table_match_count"] = len(tables_out)
+    out["tables"] = tables_out
+    return out
+
+
+def compact_to_rows(result: CompactMappingResult) -> List[Dict[str, Any]]:
+    """
+    Flat CSV / XLSX rows (one per column match) straight from the arrays.
+
+    Same rows as the verbose CSV flattener: grouped by table match in table
+    order (column matches of source tables without a table match are not
+    written), or every column match with no table columns when the result
+    was built without table matches.
+    """
+    def _row(i: int, source_table: Optional[str], t: Optional[int]) -> Dict[str, Any]:
+        best = int(result.best[i])
+        tgt_table = int(result.table_best[t]) if t is not None else -1
+        return {
+            "source_table": source_table,
+            "target_table": result.tables[tgt_table] if tgt_table >= 0 else None,
+            "table_confidence": _round(result.table_confidence[t]) if t is not None else None,
+            "source_column": result.ids[int(result.source[i])],
+            "best_match_column": result.ids[best] if best >= 0 else None,
+            "column_confidence": _round(result.confidence[i]),
+        }
+
+    if not result.meta.get("include_table_matches", True):
+        return [
+            _row(i, result.ids[int(result.source[i])].split(".", 1)[0], None)
+            for i in range(len(result.source))
+        ]
+
+    grouped: Dict[str, List[int]] = {}
+    for i, sid in enumerate(result.source.tolist()):
+        src = result.ids[sid]
+        if "." in src:
+            grouped.setdefault(src.split(".", 1)[0], []).append(i)
+
+    rows = []
+    for t, tid in enumerate(result.table_source.tolist()):
+        src_table = result.tables[tid]
+        rows.extend(_row(i, src_table, t) for i in grouped.get(src_table, []))
+
+    return rows
+
+
+# -------------------------
+# Serialize
+# -------------------------
+_ARRAYS = [
+    "source", "best", "confidence", "match_source", "cand_ids", "cand_scores",
+    "table_source", "table_best", "table_confidence", "table_coverage", "table_column_count",
+    "table_cand_ids", "table_cand_scores",
+]
+
+
+def compact_to_dict(result: CompactMappingResult) -> Dict[str, Any]:
+    """
+    JSON-friendly compact payload (scores rounded to 4 decimals, NaN -> null).
+    """
+    out: Dict[str, Any] = {
+        "format": "compact",
+        "version": COMPACT_VERSION,
+        "ids": result.ids,
+        "tables": result.tables,
+        "score_fields": result.score_fields,
+        "match_sources": result.match_sources,
+        "meta": result.meta,
+    }
+    for name in _ARRAYS:
+        arr = getattr(result, name)
+        if arr.dtype.kind == "f":
+            arr = np.round(arr.astype(np.float64), 4)
+            out[name] = np.where(np.isnan(arr), None, arr).tolist()
+        else:
+            out[name] = arr.tolist()
+    return out
+
+
+def compact_from_dict(data: Dict[str, Any]) -> CompactMappingResult:
+    if data.get("format") != "compact" or data.get("version") != COMPACT_VERSION:
+        raise ValueError("Not a compact mapping result (format/version mismatch)")
+
+    dtypes = {
+        "source": np.int32, "best": np.int32, "confidence": np.float32, "match_source": np.uint8,
+        "cand_ids": np.int32, "cand_scores": np.float32, "table_source": np.int32, "table_best": np.int32,
+        "table_confidence": np.float32, "table_coverage": np.float32, "table_column_count": np.int32,
+        "table_cand_ids": np.int32, "table_cand_scores": np.float32,
+    }
+    arrays = {}
+    for name, dtype in dtypes.items():
+        # payloads written before table candidates were stored
+        values = data.get(name, [])
+        if np.dtype(dtype).kind == "f":
+            values = np.asarray(values, dtype=object)
+            values = np.where(values == None, np.nan, values)  # noqa: E711
+        arrays[name] = np.asarray(values, dtype=dtype)
+
+    n = len(arrays["source"])
+    if arrays["cand_ids"].ndim != 2:
+        # no rows -> np.asarray([]) is 1-D
+        arrays["cand_ids"] = arrays["cand_ids"].reshape(n, 0)
+    arrays["cand_scores"] = arrays["cand_scores"].reshape(n, arrays["cand_ids"].shape[1], len(data["score_fields"]))
+
+    n_tables = len(arrays["table_source"])
+    if arrays["table_cand_ids"].ndim != 2:
+        arrays["table_cand_ids"] = arrays["table_cand_ids"].reshape(n_tables, 0)
+    arrays["table_cand_scores"] = arrays["table_cand_scores"].reshape(
+        n_tables, arrays["table_cand_ids"].shape[1], len(TABLE_CANDIDATE_FIELDS)
+    )
+
+    return CompactMappingResult(
+        ids=list(data["ids"]),
+        tables=list(data["tables"]),
+        score_fields=list(data["score_fields"]),
+        match_sources=list(data["match_sources"]),
+        meta=dict(data.get("meta") or {}),
+        **arrays,
+    )
+
+
+def save_compact_npz(result: CompactMappingResult, path: str) -> str:
+    """
+    Binary compact form: every array as-is + ids / tables / meta as JSON.
+    """
+    header = {
+        "version": COMPACT_VERSION,
+        "ids": result.ids,
+        "tables": result.tables,
+        "score_fields": result.score_fields,
+        "match_sources": result.match_sources,
+        "meta": result.meta,
+    }
+    with open(path, "wb") as f:
+        np.savez_compressed(
+            f,
+            header=np.frombuffer(json.dumps(header, default=str).encode("utf-8"), dtype=np.uint8),
+            **{name: getattr(result, name) for name in _ARRAYS},
+        )
+    return path
+
+
+def load_compact_npz(path: str) -> CompactMappingResult:
+    with np.load(path) as data:
+        header = json.loads(data["header"].tobytes().decode("utf-8"))
+        if header.get("version") != COMPACT_VERSION:
+            raise ValueError(f"Unsupported compact result version {header.get('version')}")
+
+        return CompactMappingResult(
+            ids=header["ids"],
+            tables=header["tables"],
+            score_fields=header["score_fields"],
+            match_sources=header["match_sources"],
+            meta=header.get("meta") or {},
+            **{name: data[name] for name in _ARRAYS if name in data.files},
+        )
@@ -4,6 +4,10 @@ import json
 from typing import Dict, Any, List
 from datetime import datetime, timezone
 
+from schema_matching_toolkit.telemetry import traced
+
+from .compact import CompactMappingResult, compact_to_dict, compact_to_rows, save_compact_npz
+
 
 def _now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -13,9 +17,27 @@ def _flatten_mapping_for_csv(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Convert nested output into flat rows for CSV/XLSX.
     Each row = one column match.
+
+    Flat output (include_table_matches=False) -> one row per column match,
+    target_table / table_confidence empty (same rows as compact_to_rows).
     """
     rows: List[Dict[str, Any]] = []
 
+    if "tables" not in result:
+        for cm in result.get("column_matches", []):
+            src = cm.get("source") or ""
+            rows.append(
+                {
+                    "source_table": src.split(".", 1)[0],
+                    "target_table": None,
+                    "table_confidence": None,
+                    "source_column": cm.get("source"),
+                    "best_match_column": cm.get("best_match"),
+                    "column_confidence": cm.get("confidence"),
+                }
+            )
+        return rows
+
     tables = result.get("tables", [])
     for t in tables:
         src_table = t.get("source_table")
@@ -37,33 +59,48 @@ def _flatten_mapping_for_csv(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     return rows
 
 
+@traced()
 def save_mapping_output(
-    result: Dict[str, Any],
+    result: Dict[str, Any] | CompactMappingResult,
     output_format: str = "csv",
     output_file: str | None = None,
 ) -> str:
     """
     Saves mapping output in json/csv/xlsx format.
     Returns saved file path.
+
+    CompactMappingResult (result_mode="compact") is written directly:
+      json -> compact_to_dict() payload (ids + arrays, no indentation)
+      npz  -> save_compact_npz()
+      csv / xlsx -> one row per column match, from the arrays
     """
     output_format = (output_format or "csv").lower().strip()
+    compact = isinstance(result, CompactMappingResult)
 
-    if output_format not in {"json", "csv", "xlsx"}:
-        raise ValueError("output_format must be one of: json, csv, xlsx")
+    formats = {"json", "csv", "xlsx", "npz"} if compact else {"json", "csv", "xlsx"}
+    if output_format not in formats:
+        raise ValueError(f"output_format must be one of: {', '.join(sorted(formats))}")
 
     # default file name
     if output_file is None:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"hybrid_mapping_output_{ts}.{output_format}"
 
+    # NPZ (compact only)
+    if output_format == "npz":
+        return save_compact_npz(result, output_file)
+
     # JSON
     if output_format == "json":
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+            if compact:
+                json.dump(compact_to_dict(result), f, ensure_ascii=False, separators=(",", ":"), default=str)
+            else:
+                json.dump(result, f, indent=2, ensure_ascii=False)
         return output_file
 
     # CSV / XLSX needs flattening
-    rows = _flatten_mapping_for_csv(result)
+    rows = compact_to_rows(result) if compact else _flatten_mapping_for_csv(result)
 
     # CSV
     if output_format == "csv":
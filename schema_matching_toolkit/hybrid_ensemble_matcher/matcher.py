@@ -1,11 +1,24 @@
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 
 from schema_matching_toolkit.sparse_bm25 import bm25_match
 from schema_matching_toolkit.minilm_dense_matcher import match_source_to_target_dense
 from schema_matching_toolkit.mpnet_embedding_matcher import mpnet_dense_match
-from schema_matching_toolkit.common.db_config import QdrantConfig
-
-from .table_mapper import build_table_matches_from_column_matches
+from schema_matching_toolkit.multivector_matcher import multivector_dense_match
+from schema_matching_toolkit.static_embedding_matcher import StaticEmbeddingTable, static_dense_match
+from schema_matching_toolkit.exact_name_matcher import exact_name_match
+from schema_matching_toolkit.target_bundle import TargetBundle, bundle_bm25_match, bundle_dense_match
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig, RerankConfig
+from schema_matching_toolkit.mapping_memory import MappingMemory, apply_mapping_memory
+from schema_matching_toolkit.utils.fingerprint import schema_fingerprint
+from schema_matching_toolkit.utils.schema_flatten import (
+    drop_schema_columns,
+    flatten_columns_with_desc,
+    flatten_schema_columns,
+)
+from schema_matching_toolkit.telemetry import span, traced
+
+from .compact import CompactMappingResult, build_compact_result
+from .table_mapper import build_table_matches, build_table_matches_from_column_matches
 
 
 def _safe_float(x, default=0.0) -> float:
@@ -33,6 +46,7 @@ def _collect_candidates(
     bm25_res: Dict[str, Any],
     minilm_res: Dict[str, Any],
     mpnet_res: Dict[str, Any],
+    static_res: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Dict[str, Dict[str, float]]]:
     """
     Output:
@@ -41,7 +55,8 @@ def _collect_candidates(
          "target_col": {
             "bm25": score,
             "minilm": score,
-            "mpnet": score
+            "mpnet": score,
+            "static": score   (only if static_res given)
          }
       }
     }
@@ -90,6 +105,21 @@ def _collect_candidates(
             combined.setdefault(src, {}).setdefault(tgt, {})
             combined[src][tgt]["mpnet"] = score
 
+    # ---- Static embeddings (top_k candidates)
+    for row in (static_res or {}).get("matches", []):
+        src = row.get("source")
+        if not src:
+            continue
+
+        for cand in row.get("candidates", []):
+            tgt = cand.get("target")
+            score = _safe_float(cand.get("score", 0.0))
+            if not tgt:
+                continue
+
+            combined.setdefault(src, {}).setdefault(tgt, {})
+            combined[src][tgt]["static"] = score
+
     return combined
 
 
@@ -111,28 +141,39 @@ def _pick_best_candidate(
     minilm_norm = _normalize_scores(minilm_scores)
     mpnet_norm = _normalize_scores(mpnet_scores)
 
+    use_static = weights.get("static", 0.0) > 0
+    static_norm = (
+        _normalize_scores({t: v.get("static", 0.0) for t, v in candidate_map.items()})
+        if use_static
+        else {}
+    )
+
     ranked = []
 
     for tgt in candidate_map.keys():
         s_bm25 = bm25_norm.get(tgt, 0.0)
         s_minilm = minilm_norm.get(tgt, 0.0)
         s_mpnet = mpnet_norm.get(tgt, 0.0)
+        s_static = static_norm.get(tgt, 0.0)
 
         final_score = (
             weights.get("bm25", 0.0) * s_bm25
             + weights.get("minilm", 0.0) * s_minilm
             + weights.get("mpnet", 0.0) * s_mpnet
+            + weights.get("static", 0.0) * s_static
         )
 
-        ranked.append(
-            {
-                "candidate": tgt,
-                "bm25_score": round(s_bm25, 4),
-                "minilm_score": round(s_minilm, 4),
-                "mpnet_score": round(s_mpnet, 4),
-                "final_score": round(final_score, 4),
-            }
-        )
+        row = {
+            "candidate": tgt,
+            "bm25_score": round(s_bm25, 4),
+            "minilm_score": round(s_minilm, 4),
+            "mpnet_score": round(s_mpnet, 4),
+            "final_score": round(final_score, 4),
+        }
+        if use_static:
+            row["static_score"] = round(s_static, 4)
+
+        ranked.append(row)
 
     ranked.sort(key=lambda x: x["final_score"], reverse=True)
 
@@ -143,6 +184,27 @@ def _pick_best_candidate(
     return best["candidate"], float(best["final_score"]), ranked
 
 
+def _mask_rejected(res: Dict[str, Any], rejected: Dict[str, set]) -> Dict[str, Any]:
+    """
+    Drops rejected (source, target) pairs from a dense matcher result
+    and re-derives best_match / confidence.
+    """
+    matches = []
+    for row in res.get("matches", []):
+        blocked = rejected.get(row.get("source"))
+        if blocked:
+            cands = [c for c in row.get("candidates", []) if c.get("target") not in blocked]
+            row = {
+                **row,
+                "candidates": cands,
+                "best_match": cands[0]["target"] if cands else None,
+                "confidence": cands[0]["score"] if cands else 0.0,
+            }
+        matches.append(row)
+
+    return {**res, "matches": matches}
+
+
 def _group_column_matches_by_table(
     column_matches: List[Dict[str, Any]]
 ) -> Dict[str, List[Dict[str, Any]]]:
@@ -167,115 +229,452 @@ def _group_column_matches_by_table(
     return grouped
 
 
+def _table_matches(
+    column_matches: List[Dict[str, Any]],
+    table_pooling: Optional[str],
+    table_selection: str,
+    table_top_k: int,
+    source_schema: Dict[str, Any],
+    target_schema: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    if table_pooling:
+        table_info = build_table_matches(
+            column_matches,
+            pooling=table_pooling,
+            selection=table_selection,
+            k=table_top_k,
+            source_schema=source_schema,
+            target_schema=target_schema,
+        )
+    else:
+        table_info = build_table_matches_from_column_matches({"matches": column_matches})
+
+    return table_info.get("table_matches", [])
+
+
+@traced()
 def hybrid_ensemble_match(
     source_schema: Dict[str, Any],
     target_schema: Dict[str, Any],
-    qdrant_cfg_minilm: QdrantConfig,
-    qdrant_cfg_mpnet: QdrantConfig,
+    qdrant_cfg_minilm: Optional[QdrantConfig],
+    qdrant_cfg_mpnet: Optional[QdrantConfig],
     source_descriptions: Optional[Dict[str, Any]] = None,
     target_descriptions: Optional[Dict[str, Any]] = None,
     top_k_dense: int = 5,
     weights: Optional[Dict[str, float]] = None,
     include_table_matches: bool = True,
     min_confidence: float = 0.0, 
-) -> Dict[str, Any]:
+    exact_name_prematch: bool = False,
+    abbreviations: Optional[Dict[str, str]] = None,
+    require_compatible_types: bool = True,
+    type_filter: bool = False,
+    qdrant_cfg_multivector: Optional[QdrantConfig] = None,
+    static_table: Optional[StaticEmbeddingTable] = None,
+    static_cascade_threshold: Optional[float] = None,
+    static_cascade_margin: float = 0.05,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    target_bundle: Optional[TargetBundle] = None,
+    rerank: Optional[RerankConfig] = None,
+    table_pooling: Optional[str] = None,
+    table_selection: str = "top_k",
+    table_top_k: int = 1,
+    result_mode: str = "verbose",
+    compact_top_k: Optional[int] = None,
+    mapping_memory: Optional[MappingMemory] = None,
+) -> Union[Dict[str, Any], CompactMappingResult]:
     """
     Hybrid Ensemble Matching:
+      - exact / normalized-name hash join (optional, no model inference)
       - BM25 (sparse)
       - MiniLM dense (Qdrant)
       - MPNet dense (Qdrant)
 
+    exact_name_prematch=True:
+      columns like customer_id <-> customer_id or CustID <-> cust_id are
+      emitted with confidence 1.0 and removed from the retriever batches.
+
+    type_filter=True:
+      all retrievers only consider target columns whose type family
+      (numeric / text / datetime / boolean / binary) is compatible.
+
+    qdrant_cfg_multivector given:
+      MiniLM + MPNet are read from ONE multi-vector collection
+      (index_target_columns_multivector) with one batched query per source
+      chunk; qdrant_cfg_minilm / qdrant_cfg_mpnet may then be None.
+
+    static_table given (static_embedding_matcher, NumPy only):
+      - weights["static"] > 0          -> fused as another weighted method
+      - static_cascade_threshold given -> cheap first stage: source columns whose
+        static top-1 score >= threshold and beats top-2 by static_cascade_margin
+        are emitted directly and skip BM25 / MiniLM / MPNet
+
+    encoding = EncodingConfig(...) -> token-budgeted, length-bucketed batching
+      for the MiniLM / MPNet source encodes (stats in out["encode_stats"])
+
+    text_mode="column":
+      dense texts without the table name, so repeated columns (created_at,
+      tenant_id, ...) share one embedding; collections must be indexed with
+      the same text_mode
+
+    target_bundle given (load_target_bundle):
+      BM25 / MiniLM / MPNet run in-process on the bundle's stored postings and
+      embedding matrices (no Qdrant, only the source is encoded);
+      qdrant_cfg_minilm / qdrant_cfg_mpnet may then be None. Only the dense
+      models stored in the bundle are fused (weights rescaled).
+
+    rerank = RerankConfig(...) given:
+      cross-encoder second stage on the fused top-k candidates of ensemble
+      matches (before min_confidence), bounded by rerank.max_pairs with the
+      most ambiguous columns first; rerank scores are folded into final_score
+      (stats in out["rerank_stats"])
+
+    table_pooling given ("max_sum" | "mean_row_max" | "coverage_weighted"):
+      table matches come from a sparse source-table x target-table score
+      matrix over ALL fused candidates (build_table_matches) instead of the
+      best_match vote; table_selection = "top_k" (table_top_k per source
+      table) | "greedy" | "optimal" one-to-one assignment
+
+    abbreviations = {"cust": "customer", ...} (default DEFAULT_ABBREVIATIONS):
+      shared by exact-name keys and the BM25 identifier tokenizer
+      (bundles use the dictionary they were written with)
+
     Output format:
       - table matches first
       - inside each table -> column matches
     """
 
+    if result_mode not in {"verbose", "compact"}:
+        raise ValueError("result_mode must be one of: verbose, compact")
+
     if weights is None:
         weights = {"bm25": 0.25, "minilm": 0.35, "mpnet": 0.40}
 
-    # 1) BM25
-    bm25_res = bm25_match(
-        source_schema=source_schema,
-        target_schema=target_schema,
-        top_k=1,
+    # bundle without some dense model -> fuse only the methods present,
+    # their weights rescaled to the same total
+    bundle_dense = (
+        [k for k in ("minilm", "mpnet") if k in target_bundle.models] if target_bundle is not None else []
     )
+    if target_bundle is not None and len(bundle_dense) < 2:
+        missing = {"minilm", "mpnet"} - set(bundle_dense)
+        kept = {k: v for k, v in weights.items() if k not in missing}
+        total, kept_total = sum(weights.values()), sum(kept.values())
+        weights = {k: v * total / kept_total for k, v in kept.items()} if kept_total > 0 else kept
+
+    # 0) Mapping memory (steward decisions)
+    memory_matches: List[Dict[str, Any]] = []
+    rejected: Dict[str, set] = {}
+    retrieval_source = source_schema
+
+    if mapping_memory is not None:
+        memory = apply_mapping_memory(
+            mapping_memory,
+            source_schema,
+            target_fingerprint=(
+                target_bundle.fingerprint if target_bundle is not None else schema_fingerprint(target_schema)
+            ),
+            target_columns={c["id"] for c in flatten_schema_columns(target_schema)},
+        )
+        memory_matches = memory["accepted"]
+        rejected = memory["rejected"]
+        retrieval_source = drop_schema_columns(
+            retrieval_source, {m["source"] for m in memory_matches}
+        )
 
-    # 2) MiniLM
-    minilm_res = match_source_to_target_dense(
-        source_schema=source_schema,
-        qdrant_cfg=qdrant_cfg_minilm,
-        source_descriptions=source_descriptions,
-        top_k=top_k_dense,
-    )
+    # 0a) Exact-name fast path
+    exact_matches: List[Dict[str, Any]] = []
+
+    if exact_name_prematch:
+        exact_res = exact_name_match(
+            source_schema=retrieval_source,
+            target_schema=target_schema,
+            abbreviations=abbreviations,
+            require_compatible_types=require_compatible_types,
+        )
+        exact_matches = [
+            m for m in exact_res.get("matches", [])
+            if m["best_match"] not in rejected.get(m["source"], ())
+        ]
+        retrieval_source = drop_schema_columns(
+            retrieval_source, {m["source"] for m in exact_matches}
+        )
 
-    # 3) MPNet
-    mpnet_res = mpnet_dense_match(
-        source_schema=source_schema,
-        target_schema=target_schema,
-        qdrant_cfg=qdrant_cfg_mpnet,
-        source_descriptions=source_descriptions,
-        target_descriptions=target_descriptions,
-        top_k=top_k_dense,
-        recreate_index=False,
+    # 0b) Static-embedding stage (weighted method and/or cascade)
+    static_res: Optional[Dict[str, Any]] = None
+    cascade_matches: List[Dict[str, Any]] = []
+
+    use_static = static_table is not None and (
+        weights.get("static", 0.0) > 0 or static_cascade_threshold is not None
     )
 
-    combined = _collect_candidates(bm25_res, minilm_res, mpnet_res)
+    if use_static and flatten_schema_columns(retrieval_source):
+        static_res = static_dense_match(
+            source_schema=retrieval_source,
+            target_schema=target_schema,
+            table=static_table,
+            source_descriptions=source_descriptions,
+            target_descriptions=target_descriptions,
+            top_k=top_k_dense,
+            type_filter=type_filter,
+        )
+
+        if rejected:
+            static_res = _mask_rejected(static_res, rejected)
+
+        if static_cascade_threshold is not None:
+            for row in static_res.get("matches", []):
+                cands = row.get("candidates", [])
+                if not cands:
+                    continue
+
+                top1 = cands[0]["score"]
+                top2 = cands[1]["score"] if len(cands) > 1 else 0.0
+                if top1 >= static_cascade_threshold and top1 - top2 >= static_cascade_margin:
+                    cascade_matches.append(row)
+
+            resolved = {m["source"] for m in cascade_matches}
+            retrieval_source = drop_schema_columns(retrieval_source, resolved)
+            static_res = {
+                **static_res,
+                "matches": [m for m in static_res.get("matches", []) if m["source"] not in resolved],
+            }
+
+    if flatten_schema_columns(retrieval_source):
+        # 1) BM25
+        if target_bundle is not None:
+            bm25_res = bundle_bm25_match(
+                source_schema=retrieval_source,
+                bundle=target_bundle,
+                type_filter=type_filter,
+            )
+        else:
+            bm25_res = bm25_match(
+                source_schema=retrieval_source,
+                target_schema=target_schema,
+                top_k=1,
+                type_filter=type_filter,
+                abbreviations=abbreviations,
+            )
+
+        if target_bundle is not None:
+            # 2+3) MiniLM / MPNet against the bundle matrices (models it has)
+            dense_res = {
+                key: bundle_dense_match(
+                    source_schema=retrieval_source,
+                    bundle=target_bundle,
+                    model_key=key,
+                    source_descriptions=source_descriptions,
+                    top_k=top_k_dense,
+                    type_filter=type_filter,
+                    encoding=encoding,
+                )
+                for key in bundle_dense
+            }
+            minilm_res = dense_res.get("minilm", {"matches": []})
+            mpnet_res = dense_res.get("mpnet", {"matches": []})
+            encode_stats = {key: res.get("encode_stats", {}) for key, res in dense_res.items()}
+        elif qdrant_cfg_multivector is not None:
+            # 2+3) MiniLM + MPNet in one pass
+            mv_res = multivector_dense_match(
+                source_schema=retrieval_source,
+                qdrant_cfg=qdrant_cfg_multivector,
+                source_descriptions=source_descriptions,
+                top_k=top_k_dense,
+                type_filter=type_filter,
+                encoding=encoding,
+                text_mode=text_mode,
+            )
+            encode_stats = mv_res.get("encode_stats", {})
+            minilm_res = mv_res["minilm"]
+            mpnet_res = mv_res["mpnet"]
+        else:
+            # 2) MiniLM
+            minilm_res = match_source_to_target_dense(
+                source_schema=retrieval_source,
+                qdrant_cfg=qdrant_cfg_minilm,
+                source_descriptions=source_descriptions,
+                top_k=top_k_dense,
+                type_filter=type_filter,
+                encoding=encoding,
+                text_mode=text_mode,
+            )
+
+            # 3) MPNet
+            mpnet_res = mpnet_dense_match(
+                source_schema=retrieval_source,
+                target_schema=target_schema,
+                qdrant_cfg=qdrant_cfg_mpnet,
+                source_descriptions=source_descriptions,
+                target_descriptions=target_descriptions,
+                top_k=top_k_dense,
+                recreate_index=False,
+                type_filter=type_filter,
+                index_target=False,
+                encoding=encoding,
+                text_mode=text_mode,
+            )
+            encode_stats = {
+                "minilm": minilm_res.get("encode_stats", {}),
+                "mpnet": mpnet_res.get("encode_stats", {}),
+            }
+
+        combined = _collect_candidates(
+            bm25_res,
+            minilm_res,
+            mpnet_res,
+            static_res if weights.get("static", 0.0) > 0 else None,
+        )
+    else:
+        combined = {}
+        encode_stats = {}
+
+    # ✅ rejected pairs never reach fusion
+    for src, targets in rejected.items():
+        for tgt in targets:
+            combined.get(src, {}).pop(tgt, None)
 
     # -------------------------
     # Column matches
     # -------------------------
-    column_matches: List[Dict[str, Any]] = []
+    column_matches: List[Dict[str, Any]] = list(memory_matches)
 
-    for src, cand_map in combined.items():
-        best_target, best_score, ranked_candidates = _pick_best_candidate(
-            candidate_map=cand_map,
-            weights=weights,
+    for m in exact_matches:
+        column_matches.append(
+            {
+                "source": m["source"],
+                "best_match": m["best_match"],
+                "confidence": 1.0,
+                "match_source": "exact_name",
+                "candidates": [{"candidate": m["best_match"], "final_score": 1.0}],
+            }
         )
 
-        if best_target is None:
-            continue
-
-        # ✅ CONFIDENCE FILTER
-        if best_score < min_confidence:
+    for m in cascade_matches:
+        score = round(float(m["confidence"]), 4)
+        if score < min_confidence:
             continue
 
         column_matches.append(
             {
-                "source": src,
-                "best_match": best_target,
-                "confidence": round(best_score, 4),
-                "match_source": "ensemble",
-                "candidates": ranked_candidates,
+                "source": m["source"],
+                "best_match": m["best_match"],
+                "confidence": score,
+                "match_source": "static_cascade",
+                "candidates": [
+                    {
+                        "candidate": c["target"],
+                        "static_score": round(c["score"], 4),
+                        "final_score": round(c["score"], 4),
+                    }
+                    for c in m.get("candidates", [])
+                ],
             }
         )
 
+    ensemble_matches: List[Dict[str, Any]] = []
+
+    with span("fusion", sources=len(combined)) as fusion_span:
+        for src, cand_map in combined.items():
+            best_target, best_score, ranked_candidates = _pick_best_candidate(
+                candidate_map=cand_map,
+                weights=weights,
+            )
+
+            if best_target is None:
+                continue
+
+            ensemble_matches.append(
+                {
+                    "source": src,
+                    "best_match": best_target,
+                    "confidence": round(best_score, 4),
+                    "match_source": "ensemble",
+                    "candidates": ranked_candidates,
+                }
+            )
+
+        fusion_span.set_attribute("candidates", sum(len(c) for c in combined.values()))
+
+    # 4) Cross-encoder rerank (bounded pair budget)
+    rerank_stats: Optional[Dict[str, Any]] = None
+
+    if rerank is not None and ensemble_matches:
+        from schema_matching_toolkit.reranker import rerank_column_matches
+
+        rerank_stats = rerank_column_matches(
+            ensemble_matches,
+            source_texts={
+                c["column_id"]: c["text"]
+                for c in flatten_columns_with_desc(retrieval_source, source_descriptions)
+            },
+            target_texts={
+                c["column_id"]: c["text"]
+                for c in flatten_columns_with_desc(target_schema, target_descriptions)
+            },
+            cfg=rerank,
+        )
+
+    # ✅ CONFIDENCE FILTER
+    column_matches.extend(m for m in ensemble_matches if m["confidence"] >= min_confidence)
+
 
     # Always keep column count available
     out: Dict[str, Any] = {
         "column_match_count": len(column_matches),
     }
 
+    if mapping_memory is not None:
+        out["memory_match_count"] = len(memory_matches)
+        out["memory_masked_pairs"] = sum(len(t) for t in rejected.values())
+
+    if exact_name_prematch:
+        out["exact_match_count"] = len(exact_matches)
+
+    if static_cascade_threshold is not None:
+        out["static_cascade_count"] = len(cascade_matches)
+
+    if encode_stats:
+        out["encode_stats"] = encode_stats
+
+    if rerank_stats is not None:
+        out["rerank_stats"] = rerank_stats
+
     # -------------------------
     # Table matches first + nested column matches
     # -------------------------
+    if result_mode == "compact":
+        table_matches = []
+        if include_table_matches:
+            table_matches = _table_matches(
+                column_matches, table_pooling, table_selection, table_top_k, source_schema, target_schema
+            )
+            out["table_match_count"] = len(table_matches)
+
+        out["include_table_matches"] = include_table_matches
+        return build_compact_result(column_matches, table_matches, top_k=compact_top_k, meta=out)
+
     if include_table_matches:
-        table_info = build_table_matches_from_column_matches({"matches": column_matches})
-        table_matches = table_info.get("table_matches", [])
+        table_matches = _table_matches(
+            column_matches, table_pooling, table_selection, table_top_k, source_schema, target_schema
+        )
 
         grouped_cols = _group_column_matches_by_table(column_matches)
 
         tables_out = []
         for t in table_matches:
             src_table = t.get("source_table")
-            tables_out.append(
-                {
-                    "source_table": src_table,
-                    "best_match_table": t.get("best_match_table"),
-                    "confidence": t.get("confidence"),
-                    "column_match_count": t.get("column_match_count", 0),
-                    "column_matches": grouped_cols.get(src_table, []),
-                }
-            )
+            table_out = {
+                "source_table": src_table,
+                "best_match_table": t.get("best_match_table"),
+                "confidence": t.get("confidence"),
+                "column_match_count": t.get("column_match_count", 0),
+                "column_matches": grouped_cols.get(src_table, []),
+            }
+            if "candidates" in t:
+                table_out["coverage"] = t.get("coverage")
+                table_out["table_candidates"] = t["candidates"]
+
+            tables_out.append(table_out)
 
         out["table_match_count"] = len(tables_out)
         out["tables"] = tables_out
@@ -1,28 +1,94 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Any, Optional
+from dataclasses import replace
 from datetime import datetime, timezone
 
-from schema_matching_toolkit.common.db_config import DBConfig, QdrantConfig, GroqConfig
-from schema_matching_toolkit.schema_extractor import extract_schema
-from schema_matching_toolkit.llm_description import describe_schema_with_groq
+from schema_matching_toolkit.common.db_config import DBConfig, EncodingConfig, QdrantConfig, GroqConfig, RerankConfig
+from schema_matching_toolkit.schema_extractor import extract_schema, extract_schema_async
+from schema_matching_toolkit.llm_description import describe_schema_with_groq, describe_schema_with_groq_async
+from schema_matching_toolkit.common.collection_versions import (
+    ensure_versioned_collection,
+    gc_unreferenced_versions,
+    target_alias_name,
+)
 
 from schema_matching_toolkit.minilm_dense_matcher import index_target_schema_to_qdrant
+from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME as MINILM_MODEL_NAME
 from schema_matching_toolkit.mpnet_embedding_matcher import index_target_columns_mpnet
+from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME as MPNET_MODEL_NAME
+from schema_matching_toolkit.multivector_matcher import index_target_columns_multivector
+from schema_matching_toolkit.multivector_matcher.indexer import (
+    MODEL_NAME as MULTIVECTOR_MODEL_NAME,
+    create_multivector_collection,
+)
+from schema_matching_toolkit.common.qdrant_utils import create_vector_collection
+from schema_matching_toolkit.common.stage_graph import StageGraph
+from schema_matching_toolkit.checkpoint.store import RunCheckpoint, checkpointed
+from schema_matching_toolkit.target_snapshot.snapshot import (
+    export_target_snapshot,
+    load_snapshot_manifest,
+    restore_target_snapshot,
+    snapshot_matches,
+)
+from schema_matching_toolkit.target_bundle import load_target_bundle
+from schema_matching_toolkit.mapping_memory import MappingMemory
+from schema_matching_toolkit.utils.fingerprint import schema_fingerprint
+from schema_matching_toolkit.utils.schema_flatten import flatten_schema_columns
 
 from schema_matching_toolkit.hybrid_ensemble_matcher.matcher import hybrid_ensemble_match
 from schema_matching_toolkit.hybrid_ensemble_matcher.exporter import save_mapping_output
+from schema_matching_toolkit.hybrid_ensemble_matcher.compact import CompactMappingResult
+from schema_matching_toolkit.telemetry import traced
 
 
 def _now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _to_artifact(result: Dict[str, Any] | CompactMappingResult) -> Dict[str, Any]:
+    # compact arrays are stored as raw buffers (lossless, unlike compact_to_dict)
+    if isinstance(result, CompactMappingResult):
+        return {"compact": dict(vars(result))}
+    return {"verbose": result}
+
+
+def _from_artifact(stored: Dict[str, Any]) -> Dict[str, Any] | CompactMappingResult:
+    if "compact" in stored:
+        return CompactMappingResult(**stored["compact"])
+    return stored["verbose"]
+
+
+def mapping_options_from_json(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON run_hybrid_mapping() options (service jobs, batch manifests) ->
+    kwargs: nested config dicts become EncodingConfig / RerankConfig.
+    """
+    kwargs = dict(options)
+    if isinstance(kwargs.get("encoding"), dict):
+        kwargs["encoding"] = EncodingConfig(**kwargs["encoding"])
+    if isinstance(kwargs.get("rerank"), dict):
+        kwargs["rerank"] = RerankConfig(**kwargs["rerank"])
+    return kwargs
+
+
+def _default_target_key(cfg: DBConfig) -> str:
+    """
+    Logical target id used for the collection alias, e.g. 'postgres_localhost_gpc_public'.
+    """
+    parts = [cfg.db_type, cfg.host, cfg.database or cfg.sqlite_path, cfg.schema_name]
+    return "_".join(str(p) for p in parts if p)
+
+
+@traced()
 def run_hybrid_mapping(
     src_cfg: DBConfig,
     tgt_cfg: DBConfig,
     qdrant_host: str = "localhost",
     qdrant_port: int = 6333,
+    qdrant_location: Optional[str] = None,  # ":memory:" -> embedded, no server
+    qdrant_path: Optional[str] = None,      # embedded, persisted on disk
     groq_cfg: Optional[GroqConfig] = None,
     top_k_dense: int = 5,
     weights: Optional[Dict[str, float]] = None,
@@ -30,84 +96,423 @@ def run_hybrid_mapping(
     output_format: str = "csv",        # ✅ user decides
     output_file: Optional[str] = None, # ✅ optional file name
     min_confidence: float = 0.7,
+    exact_name_prematch: bool = False,
+    abbreviations: Optional[Dict[str, str]] = None,
+    type_filter: bool = False,
+    snapshot_dir: Optional[str] = None,
+    versioned_collections: bool = True,
+    target_alias: Optional[str] = None,
+    version_gc_grace_seconds: Optional[float] = 3600.0,
+    index_mode: str = "separate",
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    target_bundle_path: Optional[str] = None,
+    rerank: Optional[RerankConfig] = None,
+    table_pooling: Optional[str] = None,
+    table_selection: str = "top_k",
+    table_top_k: int = 1,
+    result_mode: str = "verbose",
+    compact_top_k: Optional[int] = None,
+    mapping_memory_path: Optional[str] = None,
+    max_stage_workers: int = 4,
+    run_dir: Optional[str] = None,
+    resume: bool = False,
+    _prefetched: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     End-to-end hybrid mapping runner.
 
     ✅ Auto creates qdrant configs internally
-    ✅ Always recreates collections
+       (server via qdrant_host/port, or embedded via qdrant_location/qdrant_path)
+    ✅ Versioned collections (versioned_collections=True, default)
+       - one collection per (model, target fingerprint), built off to the side
+       - stable alias per logical target (target_alias, default from tgt_cfg)
+         swapped atomically once the new version is ready
+       - a ready version is shared instead of rebuilt; matching is pinned to the
+         resolved version
+       - after the swap, unaliased versions retired more than
+         version_gc_grace_seconds ago are dropped (None -> no GC)
+       versioned_collections=False -> fixed names, always recreated
+    ✅ snapshot_dir given -> collections restored from snapshot when the target
+       fingerprint + models match, otherwise built and snapshotted
+    ✅ index_mode="separate"    -> minilm_columns + mpnet_columns collections
+       index_mode="multivector" -> one hybrid_columns collection, both vectors per point
+    ✅ encoding=EncodingConfig(...) -> token budget / max_seq_length for all
+       MiniLM + MPNet encodes (index + query), stats in "encode_stats"
+       (identical texts are embedded once, see "unique_ratio")
+    ✅ text_mode="column" -> embed "col dtype desc" without the table name so
+       columns repeated across tables share one vector
+    ✅ target_bundle_path given (prepare_target) -> no target extraction, Groq
+       descriptions or indexing; BM25 + dense run in-process on the mmap'd bundle
+    ✅ rerank=RerankConfig(...) -> cross-encoder rescoring of the fused top-k
+       under a pair budget (most ambiguous columns first), see "rerank_stats"
+    ✅ table_pooling="mean_row_max" (or "max_sum" / "coverage_weighted") ->
+       table matches from the score matrix over all fused candidates,
+       table_selection="top_k" (table_top_k per source table) | "greedy" |
+       "optimal" (one-to-one)
+    ✅ result_mode="compact" -> "result" is a CompactMappingResult (arrays,
+       candidates cut to compact_top_k), saved directly; output_format "npz"
+    ✅ mapping_memory_path given -> steward decisions (MappingMemory sqlite):
+       accepted pairs skip retrieval, rejected pairs are masked out
+    ✅ Stages run on a dependency graph (StageGraph, max_stage_workers threads):
+       source / target extraction overlap, both Groq descriptions run in
+       parallel, MiniLM + MPNet indexing run concurrently (chained for an
+       embedded Qdrant); per-stage start / end in "stage_timeline"
+    ✅ run_dir given -> every stage output (schemas, descriptions, target
+       embeddings, match results) is stored there with content hashes
+       (RunCheckpoint, msgpack); resume=True skips stages whose inputs are
+       unchanged, so a late Groq / Qdrant failure does not redo extraction
+       or embedding. Extraction is keyed on the DBConfig: use resume=False
+       after the database itself changed. See "checkpoint" in the output.
+    ✅ Optional exact-name fast path (exact_name_prematch=True)
+    ✅ Optional type-family pre-filtering (type_filter=True)
     ✅ Saves output automatically in user requested format
     ✅ Returns summary + full results
     """
 
+    index_mode = (index_mode or "separate").lower().strip()
+    if index_mode not in {"separate", "multivector"}:
+        raise ValueError("index_mode must be one of: separate, multivector")
+
+    if index_mode == "multivector" and snapshot_dir:
+        raise ValueError("snapshot_dir is only supported with index_mode='separate'")
+
     # auto qdrant configs
-    qdrant_cfg_minilm = QdrantConfig(
-        host=qdrant_host,
-        port=qdrant_port,
-        collection_name="minilm_columns",
-        vector_name="dense_vector",
-        vector_size=384,
-    )
+    def _qdrant_cfg(collection_name: str, vector_size: int) -> QdrantConfig:
+        return QdrantConfig(
+            host=qdrant_host,
+            port=qdrant_port,
+            location=qdrant_location,
+            path=qdrant_path,
+            collection_name=collection_name,
+            vector_name="dense_vector",
+            vector_size=vector_size,
+        )
 
-    qdrant_cfg_mpnet = QdrantConfig(
-        host=qdrant_host,
-        port=qdrant_port,
-        collection_name="mpnet_columns",
-        vector_name="dense_vector",
-        vector_size=768,
-    )
+    if index_mode == "multivector":
+        qdrant_cfgs = {"hybrid": _qdrant_cfg("hybrid_columns", 768)}
+        model_names = {"hybrid": MULTIVECTOR_MODEL_NAME}
+    else:
+        qdrant_cfgs = {
+            "minilm": _qdrant_cfg("minilm_columns", 384),
+            "mpnet": _qdrant_cfg("mpnet_columns", 768),
+        }
+        model_names = {"minilm": MINILM_MODEL_NAME, "mpnet": MPNET_MODEL_NAME}
 
-    # extract schemas
-    source_schema = extract_schema(src_cfg)
-    target_schema = extract_schema(tgt_cfg)
+    # column-only vectors differ from the default ones -> separate versions / snapshots
+    if text_mode != "table":
+        model_names = {k: f"{v}|text={text_mode}" for k, v in model_names.items()}
 
     # descriptions (NOT optional in your requirement)
     if groq_cfg is None:
         raise ValueError("groq_cfg is required for hybrid mapping descriptions")
 
-    source_desc = describe_schema_with_groq(source_schema, groq_cfg)
-    target_desc = describe_schema_with_groq(target_schema, groq_cfg)
+    # already fetched by run_hybrid_mapping_async
+    fetched = _prefetched or {}
 
-    # always recreate index
-    index_target_schema_to_qdrant(
-        target_schema=target_schema,
-        qdrant_cfg=qdrant_cfg_minilm,
-        recreate=True,
-    )
+    checkpoint = RunCheckpoint(run_dir, resume=resume) if run_dir else None
+    memory_in_use = bool(mapping_memory_path)
 
-    index_target_columns_mpnet(
-        target_schema=target_schema,
-        qdrant_cfg=qdrant_cfg_mpnet,
-        recreate=True,
-    )
+    def _stage(key: str, fn, stage_inputs):
+        # prefetched value > stored artifact (same inputs) > compute
+        def run(inputs: Dict[str, Any]):
+            if key in fetched:
+                return fetched[key]
+            return checkpointed(checkpoint, key, stage_inputs(inputs), lambda: fn(inputs))
+        return run
 
-    # run matching
-    result = hybrid_ensemble_match(
-        source_schema=source_schema,
-        target_schema=target_schema,
-        qdrant_cfg_minilm=qdrant_cfg_minilm,
-        qdrant_cfg_mpnet=qdrant_cfg_mpnet,
-        source_descriptions=source_desc,
-        target_descriptions=target_desc,
-        top_k_dense=top_k_dense,
-        weights=weights,
-        include_table_matches=include_table_matches,
-        min_confidence=min_confidence,
-    )
+    def _describe(schema_key: str):
+        return _stage(
+            schema_key.replace("_schema", "_desc"),
+            lambda r: describe_schema_with_groq(r[schema_key], groq_cfg),
+            lambda r: {"schema": r[schema_key], "model": groq_cfg.model},
+        )
+
+    graph = StageGraph()
+    index_encode_stats: Dict[str, Any] = {}
+
+    # -------------------------
+    # Source side: extract -> describe
+    # -------------------------
+    graph.add("source_schema", _stage("source_schema", lambda _: extract_schema(src_cfg), lambda _: {"db": src_cfg}))
+    graph.add("source_desc", _describe("source_schema"), deps=["source_schema"])
+
+    # -------------------------
+    # Target side: bundle, or extract -> (describe || index per model)
+    # -------------------------
+    if target_bundle_path:
+        # ✅ prepared target: catalog, descriptions, BM25 stats and vectors are mmap'd
+        graph.add("target_bundle", lambda _: load_target_bundle(target_bundle_path))
+        target_stages = ["target_bundle"]
+    else:
+        graph.add("target_schema", _stage("target_schema", lambda _: extract_schema(tgt_cfg), lambda _: {"db": tgt_cfg}))
+        graph.add("target_desc", _describe("target_schema"), deps=["target_schema"])
+
+        def _plan(inputs: Dict[str, Any]) -> Dict[str, Any]:
+            target_schema = inputs["target_schema"]
+
+            # collections are indexed without descriptions
+            fingerprint = schema_fingerprint(target_schema)
+            use_snapshot = bool(snapshot_dir) and snapshot_matches(
+                load_snapshot_manifest(snapshot_dir), fingerprint, model_names
+            )
+            return {
+                "target_schema": target_schema,
+                "fingerprint": fingerprint,
+                "use_snapshot": use_snapshot,
+                "expected_points": len(flatten_schema_columns(target_schema)),
+            }
+
+        graph.add("target_plan", _plan, deps=["target_schema"])
+
+        def _build(plan: Dict[str, Any], key: str, cfg: QdrantConfig, recreate: bool) -> None:
+            if plan["use_snapshot"]:
+                restore_target_snapshot(
+                    snapshot_dir, {key: cfg}, fingerprint=plan["fingerprint"], recreate=recreate
+                )
+                return
+
+            if key == "hybrid":
+                indexer = index_target_columns_multivector
+            elif key == "minilm":
+                indexer = index_target_schema_to_qdrant
+            else:
+                indexer = index_target_columns_mpnet
+
+            info = indexer(
+                target_schema=plan["target_schema"],
+                qdrant_cfg=cfg,
+                recreate=recreate,
+                encoding=encoding,
+                text_mode=text_mode,
+                checkpoint=checkpoint,
+            )
+            index_encode_stats[key] = info.get("encode_stats", {})
+
+        def _index(key: str, cfg: QdrantConfig):
+            def run(inputs: Dict[str, Any]) -> Dict[str, Any]:
+                plan = inputs["target_plan"]
+
+                if not versioned_collections:
+                    # always recreate index
+                    _build(plan, key, cfg, recreate=True)
+                    return {"info": {"collection": cfg.collection_name, "status": "built"}, "cfg": cfg}
+
+                info = ensure_versioned_collection(
+                    qdrant_cfg=cfg,
+                    alias=target_alias_name(cfg.collection_name, target_alias or _default_target_key(tgt_cfg)),
+                    model_name=model_names[key],
+                    fingerprint=plan["fingerprint"],
+                    expected_points=plan["expected_points"],
+                    build_fn=lambda version_cfg: _build(plan, key, version_cfg, recreate=False),
+                    create_fn=create_multivector_collection if key == "hybrid" else create_vector_collection,
+                )
+
+                if version_gc_grace_seconds is not None:
+                    info["gc_dropped"] = gc_unreferenced_versions(cfg, grace_seconds=version_gc_grace_seconds)
+
+                # ✅ pinned to the resolved version: a concurrent alias swap
+                #    cannot switch collections mid-run
+                return {"info": info, "cfg": replace(cfg, collection_name=info["collection"])}
+
+            return run
+
+        # ✅ MiniLM / MPNet indexing overlap; an embedded (in-process) Qdrant
+        #    store is not shared across threads -> chained instead
+        embedded = bool(qdrant_location or qdrant_path)
+        target_stages = []
+        for key, cfg in qdrant_cfgs.items():
+            deps = ["target_plan"] + (target_stages[-1:] if embedded else [])
+            graph.add(f"index_{key}", _index(key, cfg), deps=deps)
+            target_stages.append(f"index_{key}")
 
-    # save output file
-    saved_file = save_mapping_output(
-        result=result,
-        output_format=output_format,
-        output_file=output_file,
+        def _snapshot(inputs: Dict[str, Any]) -> None:
+            plan = inputs["target_plan"]
+            if plan["use_snapshot"]:
+                return
+            cfgs = {key: inputs[f"index_{key}"]["cfg"] for key in qdrant_cfgs}
+            export_target_snapshot(snapshot_dir, cfgs, plan["fingerprint"], model_names)
+
+        if snapshot_dir:
+            graph.add("snapshot_export", _snapshot, deps=["target_plan"] + target_stages)
+            target_stages = target_stages + ["snapshot_export"]
+
+        target_stages = ["target_desc", "target_plan"] + target_stages
+
+    # -------------------------
+    # Match -> save
+    # -------------------------
+    def _match(inputs: Dict[str, Any]):
+        bundle = inputs.get("target_bundle")
+        if bundle is not None:
+            target_schema, target_desc = bundle.schema, bundle.descriptions
+            target_fp = bundle.fingerprint
+            cfgs: Dict[str, QdrantConfig] = {}
+        else:
+            target_schema, target_desc = inputs["target_plan"]["target_schema"], inputs["target_desc"]
+            target_fp = inputs["target_plan"]["fingerprint"]
+            cfgs = {key: inputs[f"index_{key}"]["cfg"] for key in qdrant_cfgs}
+
+        params = dict(
+            top_k_dense=top_k_dense,
+            weights=weights,
+            include_table_matches=include_table_matches,
+            min_confidence=min_confidence,
+            exact_name_prematch=exact_name_prematch,
+            abbreviations=abbreviations,
+            type_filter=type_filter,
+            encoding=encoding,
+            text_mode=text_mode,
+            rerank=rerank,
+            table_pooling=table_pooling,
+            table_selection=table_selection,
+            table_top_k=table_top_k,
+            result_mode=result_mode,
+            compact_top_k=compact_top_k,
+        )
+
+        def run():
+            memory = MappingMemory(mapping_memory_path) if mapping_memory_path else None
+
+            try:
+                return hybrid_ensemble_match(
+                    source_schema=inputs["source_schema"],
+                    target_schema=target_schema,
+                    qdrant_cfg_minilm=cfgs.get("minilm"),
+                    qdrant_cfg_mpnet=cfgs.get("mpnet"),
+                    qdrant_cfg_multivector=cfgs.get("hybrid"),
+                    source_descriptions=inputs["source_desc"],
+                    target_descriptions=target_desc,
+                    target_bundle=bundle,
+                    mapping_memory=memory,
+                    **params,
+                )
+            finally:
+                if memory is not None:
+                    memory.close()
+
+        # steward decisions change between runs -> never served from a checkpoint
+        if checkpoint is None or memory_in_use:
+            return run()
+
+        stored = checkpoint.cached(
+            "match",
+            {
+                "source_schema": inputs["source_schema"],
+                "source_desc": inputs["source_desc"],
+                "target_fingerprint": target_fp,
+                "target_desc": target_desc,
+                "index_mode": index_mode,
+                "models": model_names,
+                "params": params,
+            },
+            lambda: _to_artifact(run()),
+        )
+        return _from_artifact(stored)
+
+    graph.add("match", _match, deps=["source_schema", "source_desc"] + target_stages)
+    graph.add(
+        "save_output",
+        lambda r: save_mapping_output(result=r["match"], output_format=output_format, output_file=output_file),
+        deps=["match"],
     )
 
+    stages, timeline = graph.run(max_threads=max_stage_workers)
+
+    result = stages["match"]
+    saved_file = stages["save_output"]
+
+    index_info: Dict[str, Any] = {}
+
+    if target_bundle_path:
+        bundle = stages["target_bundle"]
+        target_fingerprint = bundle.fingerprint
+        index_source = "bundle"
+        index_info["bundle"] = {"path": target_bundle_path, "models": bundle.models}
+    else:
+        plan = stages["target_plan"]
+        target_fingerprint = plan["fingerprint"]
+        index_info = {key: stages[f"index_{key}"]["info"] for key in qdrant_cfgs}
+
+        if not any(i["status"] != "shared" for i in index_info.values()):
+            index_source = "shared"
+        elif plan["use_snapshot"]:
+            index_source = "snapshot"
+        else:
+            index_source = "rebuilt"
+
+    # compact results keep the top-level counts / stats in .meta
+    summary = result.meta if isinstance(result, CompactMappingResult) else result
+
     # return summary + results
     return {
         "generated_at": _now_utc_iso(),
         "output_format": output_format,
         "saved_file": saved_file,
-        "table_match_count": result.get("table_match_count", 0),
-        "column_match_count": result.get("column_match_count", 0),
+        "target_fingerprint": target_fingerprint,
+        "index_mode": index_mode,
+        "index_source": index_source,
+        "index_info": index_info,
+        "encode_stats": {
+            "index": index_encode_stats,
+            "query": summary.get("encode_stats", {}),
+        },
+        "rerank_stats": summary.get("rerank_stats"),
+        "table_match_count": summary.get("table_match_count", 0),
+        "column_match_count": summary.get("column_match_count", 0),
+        "stage_timeline": timeline,
+        "checkpoint": checkpoint.stats() if checkpoint is not None else None,
         "result": result,  # full payload
     }
+
+
+@traced()
+async def run_hybrid_mapping_async(
+    src_cfg: DBConfig,
+    tgt_cfg: DBConfig,
+    groq_cfg: Optional[GroqConfig] = None,
+    target_bundle_path: Optional[str] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    run_hybrid_mapping() for asyncio callers (many mapping jobs in one loop).
+
+    I/O-bound steps are awaited concurrently:
+      - source + target extraction (async SQLAlchemy engines)
+      - source + target Groq descriptions (AsyncGroq), each starting as soon
+        as its schema is extracted
+
+    Indexing, encoding and fusion (CPU / model bound) then run in the default
+    executor via run_hybrid_mapping(), so the event loop stays responsive.
+
+    kwargs: any other run_hybrid_mapping() parameter. Output: same.
+    """
+    from schema_matching_toolkit.common.async_utils import run_blocking
+
+    if groq_cfg is None:
+        raise ValueError("groq_cfg is required for hybrid mapping descriptions")
+
+    async def _fetch(cfg: DBConfig) -> Dict[str, Any]:
+        schema = await extract_schema_async(cfg)
+        desc = await describe_schema_with_groq_async(schema, groq_cfg)
+        return {"schema": schema, "desc": desc}
+
+    jobs = [_fetch(src_cfg)]
+    if not target_bundle_path:
+        jobs.append(_fetch(tgt_cfg))
+
+    fetched = await asyncio.gather(*jobs)
+
+    prefetched = {"source_schema": fetched[0]["schema"], "source_desc": fetched[0]["desc"]}
+    if len(fetched) > 1:
+        prefetched.update({"target_schema": fetched[1]["schema"], "target_desc": fetched[1]["desc"]})
+
+    return await run_blocking(
+        run_hybrid_mapping,
+        src_cfg,
+        tgt_cfg,
+        groq_cfg=groq_cfg,
+        target_bundle_path=target_bundle_path,
+        _prefetched=prefetched,
+        **kwargs,
+    )
@@ -72,7 +72,14 @@
 #         "table_matches": table_matches,
 #         "column_matches": matches,
 #     }
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+
+TABLE_POOLINGS = ("max_sum", "mean_row_max", "coverage_weighted")
+TABLE_SELECTIONS = ("top_k", "greedy", "optimal")
 
 
 def build_table_matches_from_column_matches(
@@ -145,3 +152,328 @@ def build_table_matches_from_column_matches(
         "table_match_count": len(table_matches),
         "table_matches": table_matches,
     }
+
+
+# -------------------------
+# Score-matrix table mapping
+# -------------------------
+@dataclass
+class TableScoreMatrix:
+    """
+    Sparse (source table x target table) scores in COO form.
+
+      rows / cols / values : one entry per table pair with any candidate
+      coverage             : Dice overlap of matched columns per entry
+      matched_columns      : source columns with a candidate in the target table
+    """
+    source_tables: List[str]
+    target_tables: List[str]
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray
+    coverage: np.ndarray
+    matched_columns: np.ndarray
+    source_column_counts: np.ndarray
+    pooling: str
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.source_tables), len(self.target_tables)
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=np.float32)
+        dense[self.rows, self.cols] = self.values
+        return dense
+
+    def to_scipy(self):
+        from scipy.sparse import coo_matrix
+
+        return coo_matrix((self.values, (self.rows, self.cols)), shape=self.shape).tocsr()
+
+
+def _split_table(ids: np.ndarray) -> np.ndarray:
+    return np.asarray([c.split(".", 1)[0] for c in ids.tolist()], dtype=object)
+
+
+def _schema_column_counts(schema: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    if not schema:
+        return {}
+    return {t.get("table_name"): len(t.get("columns", [])) for t in schema.get("tables", [])}
+
+
+def build_table_score_matrix(
+    column_matches: List[Dict[str, Any]],
+    pooling: str = "mean_row_max",
+    source_schema: Optional[Dict[str, Any]] = None,
+    target_schema: Optional[Dict[str, Any]] = None,
+) -> TableScoreMatrix:
+    """
+    Aggregates ALL fused column candidates (not only best_match) into a sparse
+    source-table x target-table score matrix.
+
+    Per source column c and target table T:  b(c, T) = best candidate score in T
+
+    pooling:
+      "max_sum"           -> sum_c b(c, T)                      (rewards large overlaps)
+      "mean_row_max"      -> sum_c b(c, T) / |S|                 (unmatched columns count 0)
+      "coverage_weighted" -> mean of b(c, T) over matched columns * 2m / (|S| + |T|)
+
+    |S| / |T| come from source_schema / target_schema when given, otherwise from
+    the columns seen in column_matches / the candidates.
+    Candidates may use the ensemble keys ("candidate", "final_score") or the
+    single-matcher keys ("target", "score").
+    """
+    if pooling not in TABLE_POOLINGS:
+        raise ValueError(f"pooling must be one of: {', '.join(TABLE_POOLINGS)}")
+
+    src_ids: List[str] = []
+    tgt_ids: List[str] = []
+    scores: List[float] = []
+
+    for m in column_matches:
+        src = m.get("source")
+        if not src:
+            continue
+        for c in m.get("candidates", []):
+            tgt = c.get("candidate", c.get("target"))
+            if not tgt:
+                continue
+            src_ids.append(src)
+            tgt_ids.append(tgt)
+            scores.append(float(c.get("final_score", c.get("score", 0.0))))
+
+    # intern column + table ids
+    src_cols, src_col_idx = np.unique(np.asarray(src_ids, dtype=object), return_inverse=True)
+    tgt_cols, tgt_col_idx = np.unique(np.asarray(tgt_ids, dtype=object), return_inverse=True)
+
+    source_tables, src_col_table = np.unique(_split_table(src_cols), return_inverse=True)
+    target_tables, tgt_col_table = np.unique(_split_table(tgt_cols), return_inverse=True)
+
+    n_st, n_tt = len(source_tables), len(target_tables)
+
+    source_counts = _schema_column_counts(source_schema)
+    target_counts = _schema_column_counts(target_schema)
+
+    # |S|: schema column count, else source columns present per table
+    n_src = np.bincount(src_col_table, minlength=n_st).astype(np.float64)
+    if source_counts:
+        n_src = np.asarray([source_counts.get(t, n) for t, n in zip(source_tables.tolist(), n_src)], dtype=np.float64)
+
+    n_tgt = np.bincount(tgt_col_table, minlength=n_tt).astype(np.float64)
+    if target_counts:
+        n_tgt = np.asarray([target_counts.get(t, n) for t, n in zip(target_tables.tolist(), n_tgt)], dtype=np.float64)
+
+    empty = np.zeros(0)
+    if not scores:
+        return TableScoreMatrix(
+            source_tables.tolist(), target_tables.tolist(),
+            empty.astype(np.int64), empty.astype(np.int64), empty.astype(np.float32),
+            empty.astype(np.float32), empty.astype(np.int64), n_src.astype(np.int64), pooling,
+        )
+
+    values = np.asarray(scores, dtype=np.float64)
+    src_col_idx = src_col_idx.astype(np.int64)
+    tgt_table_of = tgt_col_table[tgt_col_idx].astype(np.int64)
+
+    # 1) b(c, T): keep the best candidate per (source column, target table)
+    key = src_col_idx * n_tt + tgt_table_of
+    order = np.lexsort((-values, key))
+    key_sorted = key[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = key_sorted[1:] != key_sorted[:-1]
+    best = order[first]
+
+    b = values[best]
+    b_src_table = src_col_table[src_col_idx[best]].astype(np.int64)
+    b_tgt_table = tgt_table_of[best]
+    b_tgt_col = tgt_col_idx[best].astype(np.int64)
+
+    # 2) pool per (source table, target table)
+    pair_key = b_src_table * n_tt + b_tgt_table
+    pairs, inv = np.unique(pair_key, return_inverse=True)
+    rows, cols = pairs // n_tt, pairs % n_tt
+
+    total = np.bincount(inv, weights=b)
+    matched = np.bincount(inv).astype(np.float64)
+
+    # distinct target columns hit per pair (for the target side of coverage)
+    distinct = np.unique(pair_key * len(tgt_cols) + b_tgt_col)
+    distinct_tgt = np.bincount(np.searchsorted(pairs, distinct // len(tgt_cols)), minlength=len(pairs))
+
+    coverage = 2.0 * np.minimum(matched, distinct_tgt) / (n_src[rows] + n_tgt[cols])
+
+    if pooling == "max_sum":
+        pooled = total
+    elif pooling == "mean_row_max":
+        pooled = total / n_src[rows]
+    else:
+        pooled = (total / matched) * coverage
+
+    return TableScoreMatrix(
+        source_tables=source_tables.tolist(),
+        target_tables=target_tables.tolist(),
+        rows=rows,
+        cols=cols,
+        values=pooled.astype(np.float32),
+        coverage=np.minimum(coverage, 1.0).astype(np.float32),
+        matched_columns=matched.astype(np.int64),
+        source_column_counts=n_src.astype(np.int64),
+        pooling=pooling,
+    )
+
+
+def select_table_pairs(
+    matrix: TableScoreMatrix,
+    selection: str = "top_k",
+    k: int = 1,
+) -> List[Tuple[int, int]]:
+    """
+    Picks entries of the score matrix (indices into matrix.rows/cols/values).
+
+      "top_k"   -> k best target tables per source table (targets may repeat)
+      "greedy"  -> one-to-one, highest remaining pair first (sparse, O(nnz log nnz))
+      "optimal" -> one-to-one maximizing the total score
+                   (scipy.optimize.linear_sum_assignment on the dense matrix)
+
+    Output:
+      [(entry_index, rank), ...]  rank = position among the source table's picks
+    """
+    if selection not in TABLE_SELECTIONS:
+        raise ValueError(f"selection must be one of: {', '.join(TABLE_SELECTIONS)}")
+
+    n = len(matrix.values)
+    if n == 0:
+        return []
+
+    if selection == "top_k":
+        order = np.lexsort((-matrix.values, matrix.rows))
+        rows_sorted = matrix.rows[order]
+        starts = np.searchsorted(rows_sorted, rows_sorted, side="left")
+        rank = np.arange(n) - starts
+        keep = rank < max(1, k)
+        return list(zip(order[keep].tolist(), rank[keep].tolist()))
+
+    if selection == "greedy":
+        used_rows, used_cols = set(), set()
+        picks = []
+        for e in np.argsort(-matrix.values, kind="stable").tolist():
+            r, c = int(matrix.rows[e]), int(matrix.cols[e])
+            if r in used_rows or c in used_cols:
+                continue
+            used_rows.add(r)
+            used_cols.add(c)
+            picks.append((e, 0))
+        return picks
+
+    from scipy.optimize import linear_sum_assignment
+
+    # only rows / cols that have entries take part
+    row_ids, row_pos = np.unique(matrix.rows, return_inverse=True)
+    col_ids, col_pos = np.unique(matrix.cols, return_inverse=True)
+
+    dense = np.zeros((len(row_ids), len(col_ids)), dtype=np.float64)
+    entry = np.full((len(row_ids), len(col_ids)), -1, dtype=np.int64)
+    dense[row_pos, col_pos] = matrix.values
+    entry[row_pos, col_pos] = np.arange(n)
+
+    r_idx, c_idx = linear_sum_assignment(dense, maximize=True)
+    return [(int(entry[r, c]), 0) for r, c in zip(r_idx, c_idx) if entry[r, c] >= 0]
+
+
+def build_table_matches(
+    column_matches: List[Dict[str, Any]],
+    pooling: str = "mean_row_max",
+    selection: str = "top_k",
+    k: int = 1,
+    source_schema: Optional[Dict[str, Any]] = None,
+    target_schema: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Score-matrix replacement for build_table_matches_from_column_matches().
+
+    Input:
+      column_matches = hybrid column matches (full fused candidate lists)
+      pooling   = "max_sum" | "mean_row_max" | "coverage_weighted"
+      selection = "top_k" | "greedy" | "optimal" (see select_table_pairs)
+      k         = target tables kept per source table (top_k)
+
+    Output:
+      {
+        "table_match_count": N,
+        "pooling": "...",
+        "selection": "...",
+        "table_matches": [
+          {
+            "source_table": "...",
+            "best_match_table": "...",
+            "confidence": 0.81,          (pooled score)
+            "coverage": 0.9,
+            "column_match_count": 6,
+            "candidates": [{"target_table", "score", "coverage", "matched_columns"}]
+          }
+        ]
+      }
+
+    Source tables without a pick (greedy / optimal with more source than
+    target tables) are listed last with best_match_table = None.
+    """
+    matrix = build_table_score_matrix(column_matches, pooling, source_schema, target_schema)
+    picks = select_table_pairs(matrix, selection, k)
+
+    per_source: Dict[int, List[Tuple[int, int]]] = {}
+    for e, rank in picks:
+        per_source.setdefault(int(matrix.rows[e]), []).append((rank, e))
+
+    table_matches = []
+
+    for r, entries in per_source.items():
+        entries.sort()
+        candidates = [
+            {
+                "target_table": matrix.target_tables[int(matrix.cols[e])],
+                "score": round(float(matrix.values[e]), 4),
+                "coverage": round(float(matrix.coverage[e]), 4),
+                "matched_columns": int(matrix.matched_columns[e]),
+            }
+            for _, e in entries
+        ]
+
+        table_matches.append(
+            {
+                "source_table": matrix.source_tables[r],
+                "best_match_table": candidates[0]["target_table"],
+                "confidence": candidates[0]["score"],
+                "coverage": candidates[0]["coverage"],
+                "column_match_count": candidates[0]["matched_columns"],
+                "candidates": candidates,
+            }
+        )
+
+    table_matches.sort(key=lambda x: x["confidence"], reverse=True)
+
+    # ✅ one-to-one selection can leave source tables unassigned: keep them
+    # (best_match_table = None) so their column matches are not dropped
+    assigned = {t["source_table"] for t in table_matches}
+    unassigned = list(matrix.source_tables)
+    unassigned += sorted({m["source"].split(".", 1)[0] for m in column_matches if "." in m.get("source", "")})
+
+    for src_table in dict.fromkeys(unassigned):
+        if src_table in assigned:
+            continue
+        table_matches.append(
+            {
+                "source_table": src_table,
+                "best_match_table": None,
+                "confidence": 0.0,
+                "coverage": 0.0,
+                "column_match_count": 0,
+                "candidates": [],
+            }
+        )
+
+    return {
+        "table_match_count": len(table_matches),
+        "pooling": pooling,
+        "selection": selection,
+        "table_matches": table_matches,
+    }
@@ -1,3 +1,3 @@
-from .groq_describer import describe_schema_with_groq
+from .groq_describer import describe_schema_with_groq, describe_schema_with_groq_async
 
-__all__ = ["describe_schema_with_groq"]
+__all__ = ["describe_schema_with_groq", "describe_schema_with_groq_async"]
@@ -1,8 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 import json
 
-from groq import Groq
 from schema_matching_toolkit.common.db_config import GroqConfig
+from schema_matching_toolkit.telemetry import counter, span, traced
 
 
 def _schema_to_prompt(schema: Dict[str, Any]) -> str:
@@ -25,26 +25,7 @@ def _schema_to_prompt(schema: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def describe_schema_with_groq(
-    schema: Dict[str, Any],
-    groq_cfg: GroqConfig,
-) -> Dict[str, Any]:
-    """
-    Input:
-      schema: output of extract_schema()
-      groq_cfg: GroqConfig(api_key="...")
-
-    Output:
-      {
-        "tables": [{"table_name": "...", "description": "..."}],
-        "columns": [{"column_id": "table.col", "description": "..."}]
-      }
-    """
-
-    client = Groq(api_key=groq_cfg.api_key)
-    schema_text = _schema_to_prompt(schema)
-
-    system_prompt = """
+_SYSTEM_PROMPT = """
 You are a database metadata expert.
 
 Your job:
@@ -76,6 +57,10 @@ STRICT RULES:
 7) Output must be valid JSON only.
 """
 
+
+def _build_messages(schema: Dict[str, Any]) -> List[Dict[str, str]]:
+    schema_text = _schema_to_prompt(schema)
+
     user_prompt = f"""
 Here is the database schema:
 
@@ -84,16 +69,14 @@ Here is the database schema:
 Now generate JSON descriptions for ALL tables and ALL columns.
 """
 
-    resp = client.chat.completions.create(
-        model=groq_cfg.model,
-        messages=[
-            {"role": "system", "content": system_prompt.strip()},
-            {"role": "user", "content": user_prompt.strip()},
-        ],
-        temperature=0.2,
-    )
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT.strip()},
+        {"role": "user", "content": user_prompt.strip()},
+    ]
 
-    raw = resp.choices[0].message.content.strip()
+
+def _parse_descriptions(raw: str) -> Dict[str, Any]:
+    raw = (raw or "").strip()
 
     # Safe JSON parsing (Groq sometimes wraps with text)
     try:
@@ -115,3 +98,70 @@ Now generate JSON descriptions for ALL tables and ALL columns.
         columns = []
 
     return {"tables": tables, "columns": columns}
+
+
+def _record_usage(resp, groq_span) -> None:
+    usage = getattr(resp, "usage", None)
+    if usage is None:
+        return
+
+    for kind in ("prompt_tokens", "completion_tokens"):
+        n = getattr(usage, kind, None) or 0
+        groq_span.set_attribute(kind, n)
+        counter("groq.tokens", n, kind=kind.split("_")[0])
+
+
+@traced()
+def describe_schema_with_groq(
+    schema: Dict[str, Any],
+    groq_cfg: GroqConfig,
+) -> Dict[str, Any]:
+    """
+    Input:
+      schema: output of extract_schema()
+      groq_cfg: GroqConfig(api_key="...")
+
+    Output:
+      {
+        "tables": [{"table_name": "...", "description": "..."}],
+        "columns": [{"column_id": "table.col", "description": "..."}]
+      }
+    """
+
+    from groq import Groq
+
+    client = Groq(api_key=groq_cfg.api_key)
+
+    with span("groq.chat_completion", model=groq_cfg.model) as groq_span:
+        resp = client.chat.completions.create(
+            model=groq_cfg.model,
+            messages=_build_messages(schema),
+            temperature=0.2,
+        )
+        _record_usage(resp, groq_span)
+
+    return _parse_descriptions(resp.choices[0].message.content)
+
+
+@traced()
+async def describe_schema_with_groq_async(
+    schema: Dict[str, Any],
+    groq_cfg: GroqConfig,
+) -> Dict[str, Any]:
+    """
+    Async variant of describe_schema_with_groq() (groq.AsyncGroq).
+    Same input / output.
+    """
+    from groq import AsyncGroq
+
+    client = AsyncGroq(api_key=groq_cfg.api_key)
+
+    with span("groq.chat_completion", model=groq_cfg.model) as groq_span:
+        resp = await client.chat.completions.create(
+            model=groq_cfg.model,
+            messages=_build_messages(schema),
+            temperature=0.2,
+        )
+        _record_usage(resp, groq_span)
+
+    return _parse_descriptions(resp.choices[0].message.content)
@@ -0,0 +1,3 @@
+from .store import ACCEPTED, REJECTED, MappingMemory, apply_mapping_memory
+
+__all__ = ["ACCEPTED", "REJECTED", "MappingMemory", "apply_mapping_memory"]
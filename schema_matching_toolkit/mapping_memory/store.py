@@ -0,0 +1,258 @@
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, List, Optional, Set
+
+from schema_matching_toolkit.utils.fingerprint import column_signature
+from schema_matching_toolkit.utils.schema_flatten import flatten_schema_columns
+from schema_matching_toolkit.telemetry import traced
+
+
+ACCEPTED = "accepted"
+REJECTED = "rejected"
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS mapping_decisions (
+    source_signature   TEXT NOT NULL,
+    target_fingerprint TEXT NOT NULL,
+    target_column      TEXT NOT NULL,
+    source_column      TEXT NOT NULL,
+    status             TEXT NOT NULL CHECK (status IN ('accepted', 'rejected')),
+    note               TEXT,
+    updated_at         TEXT NOT NULL,
+    PRIMARY KEY (source_signature, target_fingerprint, target_column)
+)
+"""
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class MappingMemory:
+    """
+    Local store of steward decisions, keyed by
+    (source column signature, target schema fingerprint).
+
+      - SQLite in WAL mode: concurrent jobs / processes read while one writes
+        (busy timeout instead of "database is locked")
+      - decisions of a target fingerprint are loaded once into a dict, so
+        lookups during matching are O(1); the cache is dropped when another
+        connection commits (PRAGMA data_version)
+      - one accepted target per source column: accepting a new target
+        replaces the previous accepted one
+    """
+
+    def __init__(self, path: str = "mapping_memory.sqlite", timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA_SQL)
+
+        # fingerprint -> signature -> {"accepted": target | None, "rejected": {targets}}
+        self._cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._data_version = self._read_data_version()
+
+    # -------------------------
+    # Read
+    # -------------------------
+    def _read_data_version(self) -> int:
+        return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def decisions(self, target_fingerprint: str) -> Dict[str, Dict[str, Any]]:
+        """
+        All decisions for one target: {signature: {"accepted": ..., "rejected": set()}}
+        """
+        with self._lock:
+            version = self._read_data_version()
+            if version != self._data_version:
+                # another connection committed -> reload on demand
+                self._cache.clear()
+                self._data_version = version
+
+            cached = self._cache.get(target_fingerprint)
+            if cached is not None:
+                return cached
+
+            rows = self._conn.execute(
+                "SELECT source_signature, target_column, status FROM mapping_decisions "
+                "WHERE target_fingerprint = ?",
+                (target_fingerprint,),
+            ).fetchall()
+
+            decisions: Dict[str, Dict[str, Any]] = {}
+            for signature, target_column, status in rows:
+                entry = decisions.setdefault(signature, {"accepted": None, "rejected": set()})
+                if status == ACCEPTED:
+                    entry["accepted"] = target_column
+                else:
+                    entry["rejected"].add(target_column)
+
+            self._cache[target_fingerprint] = decisions
+            return decisions
+
+    def lookup(self, source_column: str, data_type: str, target_fingerprint: str) -> Dict[str, Any]:
+        """
+        Output: {"accepted": "table.col" | None, "rejected": {"table.col", ...}}
+        """
+        entry = self.decisions(target_fingerprint).get(column_signature(source_column, data_type))
+        return entry or {"accepted": None, "rejected": set()}
+
+    # -------------------------
+    # Write
+    # -------------------------
+    def _write(self, target_fingerprint: str, rows: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                for r in rows:
+                    signature = column_signature(r["source"], r.get("data_type", ""))
+
+                    if r["status"] == ACCEPTED:
+                        cur.execute(
+                            "DELETE FROM mapping_decisions WHERE source_signature = ? "
+                            "AND target_fingerprint = ? AND status = ?",
+                            (signature, target_fingerprint, ACCEPTED),
+                        )
+
+                    cur.execute(
+                        "INSERT OR REPLACE INTO mapping_decisions "
+                        "(source_signature, target_fingerprint, target_column, source_column, status, note, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            signature,
+                            target_fingerprint,
+                            r["target"],
+                            r["source"],
+                            r["status"],
+                            r.get("note"),
+                            _now_utc_iso(),
+                        ),
+                    )
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+            # own commits do not change data_version -> drop this target explicitly
+            self._cache.pop(target_fingerprint, None)
+
+    def accept(
+        self,
+        source_column: str,
+        data_type: str,
+        target_fingerprint: str,
+        target_column: str,
+        note: Optional[str] = None,
+    ) -> None:
+        self.record_decisions(
+            [{"source": source_column, "data_type": data_type, "target": target_column,
+              "status": ACCEPTED, "note": note}],
+            target_fingerprint,
+        )
+
+    def reject(
+        self,
+        source_column: str,
+        data_type: str,
+        target_fingerprint: str,
+        target_column: str,
+        note: Optional[str] = None,
+    ) -> None:
+        self.record_decisions(
+            [{"source": source_column, "data_type": data_type, "target": target_column,
+              "status": REJECTED, "note": note}],
+            target_fingerprint,
+        )
+
+    def record_decisions(
+        self,
+        decisions: Iterable[Dict[str, Any]],
+        target_fingerprint: str,
+        source_schema: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Bulk steward feedback in ONE transaction.
+
+        Input:
+          decisions = [{"source": "t.c", "target": "x.y", "status": "accepted" | "rejected",
+                        "data_type": "..." (optional if source_schema given), "note": "..."}]
+          source_schema = extract_schema(...) -> fills data_type per source column
+
+        Output: number of decisions written
+        """
+        types = {c["id"]: c["data_type"] for c in flatten_schema_columns(source_schema or {})}
+
+        rows = []
+        for d in decisions:
+            status = (d.get("status") or "").lower().strip()
+            if status not in {ACCEPTED, REJECTED}:
+                raise ValueError("status must be one of: accepted, rejected")
+            rows.append({**d, "status": status, "data_type": d.get("data_type", types.get(d["source"], ""))})
+
+        if rows:
+            self._write(target_fingerprint, rows)
+        return len(rows)
+
+    def forget(self, source_column: str, data_type: str, target_fingerprint: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM mapping_decisions WHERE source_signature = ? AND target_fingerprint = ?",
+                (column_signature(source_column, data_type), target_fingerprint),
+            )
+            self._cache.pop(target_fingerprint, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@traced()
+def apply_mapping_memory(
+    memory: MappingMemory,
+    source_schema: Dict[str, Any],
+    target_fingerprint: str,
+    target_columns: Optional[Set[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Splits the source columns by stored decisions before retrieval.
+
+    target_columns given -> accepted targets that no longer exist are ignored
+
+    Output:
+      {
+        "accepted": [{"source", "best_match", "confidence": 1.0, "match_source": "memory",
+                      "candidates": [...]}],
+        "rejected": {"src.col": {"tgt.col", ...}}
+      }
+    """
+    decisions = memory.decisions(target_fingerprint)
+    accepted: List[Dict[str, Any]] = []
+    rejected: Dict[str, Set[str]] = {}
+
+    if not decisions:
+        return {"accepted": accepted, "rejected": rejected}
+
+    for col in flatten_schema_columns(source_schema):
+        entry = decisions.get(column_signature(col["id"], col["data_type"]))
+        if entry is None:
+            continue
+
+        target = entry["accepted"]
+        if target and (target_columns is None or target in target_columns):
+            accepted.append(
+                {
+                    "source": col["id"],
+                    "best_match": target,
+                    "confidence": 1.0,
+                    "match_source": "memory",
+                    "candidates": [{"candidate": target, "final_score": 1.0}],
+                }
+            )
+        elif entry["rejected"]:
+            rejected[col["id"]] = set(entry["rejected"])
+
+    return {"accepted": accepted, "rejected": rejected}
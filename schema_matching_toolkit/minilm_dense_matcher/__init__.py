@@ -1,7 +1,9 @@
-from .indexer import index_target_schema_to_qdrant
-from .matcher import match_source_to_target_dense
+from .indexer import index_target_schema_to_qdrant, index_target_schema_to_qdrant_async
+from .matcher import match_source_to_target_dense, match_source_to_target_dense_async
 
 __all__ = [
     "index_target_schema_to_qdrant",
+    "index_target_schema_to_qdrant_async",
     "match_source_to_target_dense",
+    "match_source_to_target_dense_async",
 ]
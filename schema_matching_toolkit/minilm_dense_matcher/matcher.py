@@ -1,69 +1,91 @@
-from typing import Dict, Any, List
-
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
-
-from schema_matching_toolkit.common.db_config import QdrantConfig
-
-
-EMBEDDER = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+from typing import Dict, Any, List, Optional
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts, embed_texts_async
+from schema_matching_toolkit.common.qdrant_utils import (
+    get_async_qdrant_client,
+    get_qdrant_client,
+    search_params,
+    type_family_filter,
+)
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.telemetry import span, timer, traced
+
+
+def _hits_to_candidates(hits) -> List[Dict[str, Any]]:
+    candidates = []
+    for h in hits:
+        payload = h.payload or {}
+        candidates.append(
+            {
+                "target": payload.get("column_id", str(h.id)),
+                "score": float(h.score),
+                "data_type": payload.get("data_type", ""),
+                "description": payload.get("description", ""),
+            }
+        )
+    return candidates
 
 
-def _get_column_description(descriptions: Dict[str, Any], col_id: str) -> str:
-    if not descriptions:
-        return ""
+def _query_requests(qdrant_cfg: QdrantConfig, source_cols, qvecs, top_k: int, type_filter: bool):
+    """
+    One QueryRequest per source column (named vector, optional type filter).
+    """
+    from qdrant_client.models import QueryRequest
 
-    cols = descriptions.get("columns", [])
-    if not isinstance(cols, list):
-        return ""
+    params = search_params(qdrant_cfg)
 
-    for c in cols:
-        if c.get("column_id") == col_id:
-            return c.get("description") or ""
+    return [
+        QueryRequest(
+            query=qvec.tolist(),
+            using=qdrant_cfg.vector_name,
+            filter=type_family_filter(src["data_type"]) if type_filter else None,
+            params=params,
+            limit=top_k,
+            with_payload=True,
+        )
+        for src, qvec in zip(source_cols, qvecs)
+    ]
 
-    return ""
 
+def _search_all(client, qdrant_cfg: QdrantConfig, source_cols, qvecs, top_k: int, type_filter: bool, chunk_size: int = 64):
+    """
+    Hits per source column, one query_batch_points() call per chunk
+    (works on a Qdrant server and in embedded mode).
+    """
+    all_hits = []
+
+    for start in range(0, len(source_cols), chunk_size):
+        requests = _query_requests(
+            qdrant_cfg,
+            source_cols[start : start + chunk_size],
+            qvecs[start : start + chunk_size],
+            top_k,
+            type_filter,
+        )
 
-def _flatten_source_with_desc(
-    source_schema: Dict[str, Any],
-    descriptions: Dict[str, Any] | None = None,
-) -> List[Dict[str, Any]]:
-    cols = []
-
-    for t in source_schema.get("tables", []):
-        table_name = t.get("table_name") or t.get("table") or t.get("name")
-        if not table_name:
-            continue
-
-        for c in t.get("columns", []):
-            col_name = c.get("column_name") or c.get("column") or c.get("name")
-            dtype = c.get("data_type") or ""
-
-            if not col_name:
-                continue
-
-            col_id = f"{table_name}.{col_name}"
-            desc = _get_column_description(descriptions or {}, col_id)
-
-            text = f"{table_name} {col_name} {dtype} {desc}".strip()
-
-            cols.append(
-                {
-                    "column_id": col_id,
-                    "data_type": dtype,
-                    "description": desc,
-                    "text": text,
-                }
+        with span("qdrant.query_batch", collection=qdrant_cfg.collection_name, queries=len(requests)):
+            responses = client.query_batch_points(
+                collection_name=qdrant_cfg.collection_name,
+                requests=requests,
             )
 
-    return cols
+        all_hits.extend(resp.points for resp in responses)
 
+    return all_hits
 
+
+@traced()
 def match_source_to_target_dense(
     source_schema: Dict[str, Any],
     qdrant_cfg: QdrantConfig,
     source_descriptions: Dict[str, Any] | None = None,
     top_k: int = 5,
+    type_filter: bool = False,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
 ) -> Dict[str, Any]:
     """
     Dense matching (MiniLM + Qdrant)
@@ -73,11 +95,16 @@ def match_source_to_target_dense(
       qdrant_cfg
       source_descriptions (optional from Groq)
       top_k
+      type_filter = True -> only search target columns with a compatible
+                           type family (indexed `type_family` payload)
+      encoding = EncodingConfig(...) (optional, token-budgeted batching)
+      text_mode = "table" | "column" (must match the one used for indexing)
 
     Output:
       {
         "method": "minilm_dense_qdrant",
         "match_count": N,
+        "encode_stats": {...},
         "matches": [
           {
             "source": "table.col",
@@ -89,33 +116,20 @@ def match_source_to_target_dense(
         ]
       }
     """
-    client = QdrantClient(host=qdrant_cfg.host, port=qdrant_cfg.port)
+    client = get_qdrant_client(qdrant_cfg)
 
-    source_cols = _flatten_source_with_desc(source_schema, source_descriptions)
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
 
-    matches = []
+    # ✅ all source columns in length-bucketed batches (not one encode() per column)
+    qvecs, encode_stats = embed_texts(get_sentence_model(MODEL_NAME), [c["text"] for c in source_cols], encoding)
 
-    for src in source_cols:
-        qvec = EMBEDDER.encode([src["text"]], normalize_embeddings=True)[0].tolist()
+    with timer("qdrant.search_seconds", collection=qdrant_cfg.collection_name):
+        all_hits = _search_all(client, qdrant_cfg, source_cols, qvecs, top_k, type_filter)
 
-        hits = client.search(
-            collection_name=qdrant_cfg.collection_name,
-            query_vector=(qdrant_cfg.vector_name, qvec),
-            limit=top_k,
-            with_payload=True,
-        )
+    matches = []
 
-        candidates = []
-        for h in hits:
-            payload = h.payload or {}
-            candidates.append(
-                {
-                    "target": payload.get("column_id", str(h.id)),
-                    "score": float(h.score),
-                    "data_type": payload.get("data_type", ""),
-                    "description": payload.get("description", ""),
-                }
-            )
+    for src, hits in zip(source_cols, all_hits):
+        candidates = _hits_to_candidates(hits)
 
         best_match = candidates[0]["target"] if candidates else None
         best_score = candidates[0]["score"] if candidates else 0.0
@@ -133,5 +147,93 @@ def match_source_to_target_dense(
     return {
         "method": "minilm_dense_qdrant",
         "match_count": len(matches),
+        "encode_stats": encode_stats,
+        "matches": matches,
+    }
+
+
+async def _search_all_async(
+    client,
+    qdrant_cfg: QdrantConfig,
+    source_cols,
+    qvecs,
+    top_k: int,
+    type_filter: bool,
+    chunk_size: int = 64,
+    max_concurrency: int = 8,
+):
+    """
+    _search_all() for AsyncQdrantClient: chunks go out as query_batch_points()
+    calls, at most max_concurrency in flight (bounded however many columns).
+    """
+    import asyncio
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _chunk(start: int):
+        requests = _query_requests(
+            qdrant_cfg,
+            source_cols[start : start + chunk_size],
+            qvecs[start : start + chunk_size],
+            top_k,
+            type_filter,
+        )
+        async with sem:
+            responses = await client.query_batch_points(
+                collection_name=qdrant_cfg.collection_name,
+                requests=requests,
+            )
+        return [resp.points for resp in responses]
+
+    with span("qdrant.search_all_async", collection=qdrant_cfg.collection_name, queries=len(source_cols)):
+        chunks = await asyncio.gather(*(_chunk(start) for start in range(0, len(source_cols), chunk_size)))
+
+    return [hits for chunk in chunks for hits in chunk]
+
+
+@traced()
+async def match_source_to_target_dense_async(
+    source_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    source_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 5,
+    type_filter: bool = False,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    match_source_to_target_dense() with AsyncQdrantClient: encoding runs off
+    the event loop and the batched column searches overlap (bounded).
+
+    Output: same as match_source_to_target_dense()
+    """
+    from schema_matching_toolkit.common.async_utils import run_blocking
+
+    client = get_async_qdrant_client(qdrant_cfg)
+
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
+
+    model = await run_blocking(get_sentence_model, MODEL_NAME)
+    qvecs, encode_stats = await embed_texts_async(model, [c["text"] for c in source_cols], encoding)
+
+    all_hits = await _search_all_async(client, qdrant_cfg, source_cols, qvecs, top_k, type_filter)
+
+    matches = []
+    for src, hits in zip(source_cols, all_hits):
+        candidates = _hits_to_candidates(hits)
+        matches.append(
+            {
+                "source": src["column_id"],
+                "source_type": src["data_type"],
+                "best_match": candidates[0]["target"] if candidates else None,
+                "confidence": candidates[0]["score"] if candidates else 0.0,
+                "candidates": candidates,
+            }
+        )
+
+    return {
+        "method": "minilm_dense_qdrant",
+        "match_count": len(matches),
+        "encode_stats": encode_stats,
         "matches": matches,
     }
@@ -1,4 +1,9 @@
-from .indexer import index_target_columns_mpnet
-from .matcher import mpnet_dense_match
+from .indexer import index_target_columns_mpnet, index_target_columns_mpnet_async
+from .matcher import mpnet_dense_match, mpnet_dense_match_async
 
-__all__ = ["index_target_columns_mpnet", "mpnet_dense_match"]
+__all__ = [
+    "index_target_columns_mpnet",
+    "index_target_columns_mpnet_async",
+    "mpnet_dense_match",
+    "mpnet_dense_match_async",
+]
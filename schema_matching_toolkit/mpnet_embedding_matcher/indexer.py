@@ -1,125 +1,130 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import uuid
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import VectorParams, Distance, PointStruct
-from sentence_transformers import SentenceTransformer
-
-from schema_matching_toolkit.common.db_config import QdrantConfig
-
-
-MPNET = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
-
-
-def _get_column_description(descriptions: Dict[str, Any], col_id: str) -> str:
-    """
-    descriptions format:
-    {
-      "tables": [{"table_name": "...", "description": "..."}],
-      "columns": [{"column_id": "table.col", "description": "..."}]
-    }
-    """
-    if not descriptions:
-        return ""
-
-    cols = descriptions.get("columns", [])
-    if not isinstance(cols, list):
-        return ""
-
-    for c in cols:
-        if c.get("column_id") == col_id:
-            return c.get("description") or ""
-
-    return ""
+from schema_matching_toolkit.checkpoint.store import RunCheckpoint, checkpointed
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts, embed_texts_async
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.common.qdrant_utils import (
+    get_async_qdrant_client,
+    get_qdrant_client,
+    recreate_vector_collection,
+    recreate_vector_collection_async,
+)
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.telemetry import span, traced
+
+
+MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
+
+
+def __getattr__(name: str):
+    # MPNET is loaded on first use (keeps torch out of import time)
+    if name == "MPNET":
+        return get_sentence_model(MODEL_NAME)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _column_points(cols: List[Dict[str, Any]], vectors, vector_name: str) -> List[Any]:
+    from qdrant_client.models import PointStruct
+
+    return [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector={vector_name: vectors[i].tolist()},
+            payload={
+                "column_id": c["column_id"],
+                "column_name": c["column_id"],
+                "data_type": c["data_type"],
+                "type_family": type_family(c["data_type"]),
+                "description": c["description"],
+                "text": c["text"],
+            },
+        )
+        for i, c in enumerate(cols)
+    ]
 
 
-def _flatten_target_columns_with_desc(
+@traced()
+def index_target_columns_mpnet(
     target_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
     descriptions: Dict[str, Any] | None = None,
-) -> List[Dict[str, Any]]:
-    cols = []
+    recreate: bool = True,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    checkpoint: Optional[RunCheckpoint] = None,
+) -> Dict[str, Any]:
+    """
+    Index target schema columns into Qdrant using MPNet embeddings.
 
-    for t in target_schema.get("tables", []):
-        table_name = t.get("table_name") or t.get("table") or t.get("name")
-        if not table_name:
-            continue
+    checkpoint = RunCheckpoint(...) -> embeddings reused across resumed runs
 
-        for c in t.get("columns", []):
-            col_name = c.get("column_name") or c.get("column") or c.get("name")
-            dtype = c.get("data_type") or ""
+    Output:
+      {"collection": "...", "indexed_points": N, "encode_stats": {...}}
+    """
+    client = get_qdrant_client(qdrant_cfg)
 
-            if not col_name:
-                continue
+    cols = flatten_columns_with_desc(target_schema, descriptions, text_mode=text_mode)
 
-            col_id = f"{table_name}.{col_name}"
-            desc = _get_column_description(descriptions or {}, col_id)
+    if recreate:
+        # delete if exists + create collection
+        recreate_vector_collection(client, qdrant_cfg)
 
-            text = f"{table_name} {col_name} {dtype} {desc}".strip()
+    texts = [c["text"] for c in cols]
+    vectors, encode_stats = checkpointed(
+        checkpoint,
+        "target_embeddings_mpnet",
+        {"model": MODEL_NAME, "texts": texts, "encoding": encoding},
+        lambda: embed_texts(get_sentence_model(MODEL_NAME), texts, encoding),
+    )
 
-            cols.append(
-                {
-                    "column_id": col_id,
-                    "text": text,
-                    "data_type": dtype,
-                    "description": desc,
-                }
-            )
+    points = _column_points(cols, vectors, qdrant_cfg.vector_name)
 
-    return cols
+    if points:
+        with span("qdrant.upsert", collection=qdrant_cfg.collection_name, points=len(points)):
+            client.upsert(collection_name=qdrant_cfg.collection_name, points=points)
 
+    return {
+        "collection": qdrant_cfg.collection_name,
+        "indexed_points": len(points),
+        "encode_stats": encode_stats,
+    }
 
-def index_target_columns_mpnet(
+
+@traced()
+async def index_target_columns_mpnet_async(
     target_schema: Dict[str, Any],
     qdrant_cfg: QdrantConfig,
     descriptions: Dict[str, Any] | None = None,
     recreate: bool = True,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
 ) -> Dict[str, Any]:
     """
-    Index target schema columns into Qdrant using MPNet embeddings.
-
-    Output:
-      {"collection": "...", "indexed_points": N}
+    index_target_columns_mpnet() with AsyncQdrantClient; the model load and encoding
+    run off the event loop. Same output.
     """
-    client = QdrantClient(host=qdrant_cfg.host, port=qdrant_cfg.port)
+    from schema_matching_toolkit.common.async_utils import run_blocking
+
+    client = get_async_qdrant_client(qdrant_cfg)
 
-    cols = _flatten_target_columns_with_desc(target_schema, descriptions)
+    cols = flatten_columns_with_desc(target_schema, descriptions, text_mode=text_mode)
 
     if recreate:
-        try:
-            client.delete_collection(collection_name=qdrant_cfg.collection_name)
-        except Exception:
-            pass
-
-        client.create_collection(
-            collection_name=qdrant_cfg.collection_name,
-            vectors_config={
-                qdrant_cfg.vector_name: VectorParams(
-                    size=qdrant_cfg.vector_size,
-                    distance=Distance.COSINE,
-                )
-            },
-        )
+        await recreate_vector_collection_async(client, qdrant_cfg)
 
-    texts = [c["text"] for c in cols]
-    vectors = MPNET.encode(texts, normalize_embeddings=True)
-
-    points = []
-    for i, c in enumerate(cols):
-        points.append(
-            PointStruct(
-                id=str(uuid.uuid4()),
-                vector={qdrant_cfg.vector_name: vectors[i].tolist()},
-                payload={
-                    "column_id": c["column_id"],
-                    "column_name": c["column_id"],
-                    "data_type": c["data_type"],
-                    "description": c["description"],
-                    "text": c["text"],
-                },
-            )
-        )
+    model = await run_blocking(get_sentence_model, MODEL_NAME)
+    vectors, encode_stats = await embed_texts_async(model, [c["text"] for c in cols], encoding)
+
+    points = _column_points(cols, vectors, qdrant_cfg.vector_name)
 
     if points:
-        client.upsert(collection_name=qdrant_cfg.collection_name, points=points)
+        await client.upsert(collection_name=qdrant_cfg.collection_name, points=points)
 
-    return {"collection": qdrant_cfg.collection_name, "indexed_points": len(points)}
+    return {
+        "collection": qdrant_cfg.collection_name,
+        "indexed_points": len(points),
+        "encode_stats": encode_stats,
+    }
@@ -1,66 +1,111 @@
-from typing import Dict, Any, List
-
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
-
-from schema_matching_toolkit.common.db_config import QdrantConfig
-from schema_matching_toolkit.mpnet_embedding_matcher.indexer import index_target_columns_mpnet
-
-
-MPNET = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
+from typing import Dict, Any, List, Optional
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts, embed_texts_async
+from schema_matching_toolkit.common.qdrant_utils import get_async_qdrant_client, get_qdrant_client
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.minilm_dense_matcher.matcher import _search_all, _search_all_async
+from schema_matching_toolkit.mpnet_embedding_matcher.indexer import (
+    MODEL_NAME,
+    index_target_columns_mpnet,
+    index_target_columns_mpnet_async,
+)
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.telemetry import timer, traced
+
+
+def _hits_to_candidates(hits) -> List[Dict[str, Any]]:
+    candidates = []
+    for h in hits:
+        payload = h.payload or {}
+        candidates.append(
+            {
+                "target": payload.get("column_id", str(h.id)),
+                "score": float(h.score),
+                "data_type": payload.get("data_type", ""),
+                "description": payload.get("description", ""),
+            }
+        )
+    return candidates
 
 
-def _get_column_description(descriptions: Dict[str, Any], col_id: str) -> str:
-    if not descriptions:
-        return ""
+@traced()
+def mpnet_dense_match(
+    source_schema: Dict[str, Any],
+    target_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    source_descriptions: Dict[str, Any] | None = None,
+    target_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 3,
+    recreate_index: bool = True,
+    type_filter: bool = False,
+    index_target: bool = True,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    Dense matching using MPNet embeddings + Qdrant (with optional Groq descriptions)
 
-    cols = descriptions.get("columns", [])
-    if not isinstance(cols, list):
-        return ""
+    index_target = False -> target is already indexed in qdrant_cfg.collection_name
+                            (no re-embedding / re-upsert of the target)
 
-    for c in cols:
-        if c.get("column_id") == col_id:
-            return c.get("description") or ""
+    type_filter = True -> only search target columns with a compatible
+                         type family (indexed `type_family` payload)
 
-    return ""
+    encoding = EncodingConfig(...) -> token-budgeted batching for target + source
+    """
+    # 1) Index target
+    if index_target:
+        index_info = index_target_columns_mpnet(
+            target_schema=target_schema,
+            qdrant_cfg=qdrant_cfg,
+            descriptions=target_descriptions,
+            recreate=recreate_index,
+            encoding=encoding,
+            text_mode=text_mode,
+        )
+    else:
+        index_info = {"collection": qdrant_cfg.collection_name, "indexed_points": 0}
 
+    client = get_qdrant_client(qdrant_cfg)
 
-def _flatten_source_with_desc(
-    source_schema: Dict[str, Any],
-    descriptions: Dict[str, Any] | None = None,
-) -> List[Dict[str, Any]]:
-    cols = []
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
 
-    for t in source_schema.get("tables", []):
-        table_name = t.get("table_name") or t.get("table") or t.get("name")
-        if not table_name:
-            continue
+    # ✅ all source columns in length-bucketed batches (not one encode() per column)
+    qvecs, encode_stats = embed_texts(get_sentence_model(MODEL_NAME), [c["text"] for c in source_cols], encoding)
 
-        for c in t.get("columns", []):
-            col_name = c.get("column_name") or c.get("column") or c.get("name")
-            dtype = c.get("data_type") or ""
+    with timer("qdrant.search_seconds", collection=qdrant_cfg.collection_name):
+        all_hits = _search_all(client, qdrant_cfg, source_cols, qvecs, top_k, type_filter)
 
-            if not col_name:
-                continue
+    matches = []
 
-            col_id = f"{table_name}.{col_name}"
-            desc = _get_column_description(descriptions or {}, col_id)
+    for src, hits in zip(source_cols, all_hits):
+        candidates = _hits_to_candidates(hits)
 
-            text = f"{table_name} {col_name} {dtype} {desc}".strip()
+        best_match = candidates[0]["target"] if candidates else None
+        best_score = candidates[0]["score"] if candidates else 0.0
 
-            cols.append(
-                {
-                    "column_id": col_id,
-                    "text": text,
-                    "data_type": dtype,
-                    "description": desc,
-                }
-            )
+        matches.append(
+            {
+                "source": src["column_id"],
+                "source_type": src["data_type"],
+                "best_match": best_match,
+                "best_score": best_score,
+                "candidates": candidates,
+            }
+        )
 
-    return cols
+    return {
+        "method": "mpnet_dense_qdrant",
+        "index_info": index_info,
+        "top_k": top_k,
+        "encode_stats": encode_stats,
+        "matches": matches,
+    }
 
 
-def mpnet_dense_match(
+@traced()
+async def mpnet_dense_match_async(
     source_schema: Dict[str, Any],
     target_schema: Dict[str, Any],
     qdrant_cfg: QdrantConfig,
@@ -68,55 +113,47 @@ def mpnet_dense_match(
     target_descriptions: Dict[str, Any] | None = None,
     top_k: int = 3,
     recreate_index: bool = True,
+    type_filter: bool = False,
+    index_target: bool = True,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
 ) -> Dict[str, Any]:
     """
-    Dense matching using MPNet embeddings + Qdrant (with optional Groq descriptions)
+    mpnet_dense_match() with AsyncQdrantClient (bounded concurrent batched searches,
+    encoding off the event loop). Same output.
     """
-    # 1) Index target
-    index_info = index_target_columns_mpnet(
-        target_schema=target_schema,
-        qdrant_cfg=qdrant_cfg,
-        descriptions=target_descriptions,
-        recreate=recreate_index,
-    )
-
-    client = QdrantClient(host=qdrant_cfg.host, port=qdrant_cfg.port)
-
-    source_cols = _flatten_source_with_desc(source_schema, source_descriptions)
+    from schema_matching_toolkit.common.async_utils import run_blocking
+
+    if index_target:
+        index_info = await index_target_columns_mpnet_async(
+            target_schema=target_schema,
+            qdrant_cfg=qdrant_cfg,
+            descriptions=target_descriptions,
+            recreate=recreate_index,
+            encoding=encoding,
+            text_mode=text_mode,
+        )
+    else:
+        index_info = {"collection": qdrant_cfg.collection_name, "indexed_points": 0}
 
-    matches = []
+    client = get_async_qdrant_client(qdrant_cfg)
 
-    for src in source_cols:
-        qvec = MPNET.encode([src["text"]], normalize_embeddings=True)[0].tolist()
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
 
-        hits = client.search(
-            collection_name=qdrant_cfg.collection_name,
-            query_vector=(qdrant_cfg.vector_name, qvec),
-            limit=top_k,
-            with_payload=True,
-        )
+    model = await run_blocking(get_sentence_model, MODEL_NAME)
+    qvecs, encode_stats = await embed_texts_async(model, [c["text"] for c in source_cols], encoding)
 
-        candidates = []
-        for h in hits:
-            payload = h.payload or {}
-            candidates.append(
-                {
-                    "target": payload.get("column_id", str(h.id)),
-                    "score": float(h.score),
-                    "data_type": payload.get("data_type", ""),
-                    "description": payload.get("description", ""),
-                }
-            )
-
-        best_match = candidates[0]["target"] if candidates else None
-        best_score = candidates[0]["score"] if candidates else 0.0
+    all_hits = await _search_all_async(client, qdrant_cfg, source_cols, qvecs, top_k, type_filter)
 
+    matches = []
+    for src, hits in zip(source_cols, all_hits):
+        candidates = _hits_to_candidates(hits)
         matches.append(
             {
                 "source": src["column_id"],
                 "source_type": src["data_type"],
-                "best_match": best_match,
-                "best_score": best_score,
+                "best_match": candidates[0]["target"] if candidates else None,
+                "best_score": candidates[0]["score"] if candidates else 0.0,
                 "candidates": candidates,
             }
         )
@@ -125,5 +162,6 @@ def mpnet_dense_match(
         "method": "mpnet_dense_qdrant",
         "index_info": index_info,
         "top_k": top_k,
+        "encode_stats": encode_stats,
         "matches": matches,
     }
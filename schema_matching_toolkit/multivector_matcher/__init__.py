@@ -0,0 +1,4 @@
+from .indexer import index_target_columns_multivector
+from .matcher import multivector_dense_match
+
+__all__ = ["index_target_columns_multivector", "multivector_dense_match"]
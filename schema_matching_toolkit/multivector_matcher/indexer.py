@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional
+import uuid
+
+from schema_matching_toolkit.checkpoint.store import RunCheckpoint, checkpointed
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.common.qdrant_utils import (
+    collection_params,
+    ensure_type_family_index,
+    get_qdrant_client,
+)
+from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME as MINILM_MODEL_NAME
+from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME as MPNET_MODEL_NAME
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.telemetry import span, traced
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+# named vectors stored on every point
+MINILM_VECTOR = "minilm"
+MPNET_VECTOR = "mpnet"
+
+MODEL_NAME = f"{MINILM_MODEL_NAME}+{MPNET_MODEL_NAME}"
+
+
+def create_multivector_collection(client: QdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    """
+    One collection, two named vectors per point:
+      minilm -> 384-d, mpnet -> 768-d (cosine)
+    qdrant_cfg.vector_name / vector_size are not used here.
+    """
+    from qdrant_client.models import Distance, VectorParams
+
+    client.create_collection(
+        collection_name=qdrant_cfg.collection_name,
+        vectors_config={
+            MINILM_VECTOR: VectorParams(size=384, distance=Distance.COSINE),
+            MPNET_VECTOR: VectorParams(size=768, distance=Distance.COSINE),
+        },
+        **collection_params(qdrant_cfg),
+    )
+
+    ensure_type_family_index(client, qdrant_cfg.collection_name)
+
+
+def recreate_multivector_collection(client: QdrantClient, qdrant_cfg: QdrantConfig) -> None:
+    try:
+        client.delete_collection(collection_name=qdrant_cfg.collection_name)
+    except Exception:
+        pass
+
+    create_multivector_collection(client, qdrant_cfg)
+
+
+@traced()
+def index_target_columns_multivector(
+    target_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    descriptions: Dict[str, Any] | None = None,
+    recreate: bool = True,
+    batch_size: int = 256,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    checkpoint: Optional[RunCheckpoint] = None,
+) -> Dict[str, Any]:
+    """
+    Index target columns ONCE with both MiniLM and MPNet embeddings
+    as named vectors on a single point (payload stored once).
+
+    checkpoint = RunCheckpoint(...) -> embeddings reused across resumed runs
+
+    Output:
+      {"collection": "...", "indexed_points": N,
+       "encode_stats": {"minilm": {...}, "mpnet": {...}}}
+    """
+    from qdrant_client.models import PointStruct
+
+    client = get_qdrant_client(qdrant_cfg)
+
+    cols = flatten_columns_with_desc(target_schema, descriptions, text_mode=text_mode)
+
+    if recreate:
+        recreate_multivector_collection(client, qdrant_cfg)
+
+    texts = [c["text"] for c in cols]
+    minilm_vectors, minilm_stats = checkpointed(
+        checkpoint,
+        "target_embeddings_minilm",
+        {"model": MINILM_MODEL_NAME, "texts": texts, "encoding": encoding},
+        lambda: embed_texts(get_sentence_model(MINILM_MODEL_NAME), texts, encoding),
+    )
+    mpnet_vectors, mpnet_stats = checkpointed(
+        checkpoint,
+        "target_embeddings_mpnet",
+        {"model": MPNET_MODEL_NAME, "texts": texts, "encoding": encoding},
+        lambda: embed_texts(get_sentence_model(MPNET_MODEL_NAME), texts, encoding),
+    )
+
+    # single upload pass
+    for start in range(0, len(cols), batch_size):
+        points = []
+        for i in range(start, min(start + batch_size, len(cols))):
+            c = cols[i]
+            points.append(
+                PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector={
+                        MINILM_VECTOR: minilm_vectors[i].tolist(),
+                        MPNET_VECTOR: mpnet_vectors[i].tolist(),
+                    },
+                    payload={
+                        "column_id": c["column_id"],
+                        "column_name": c["column_id"],
+                        "data_type": c["data_type"],
+                        "type_family": type_family(c["data_type"]),
+                        "description": c["description"],
+                        "text": c["text"],
+                    },
+                )
+            )
+
+        with span("qdrant.upsert", collection=qdrant_cfg.collection_name, points=len(points)):
+            client.upsert(collection_name=qdrant_cfg.collection_name, points=points)
+
+    return {
+        "collection": qdrant_cfg.collection_name,
+        "indexed_points": len(cols),
+        "encode_stats": {"minilm": minilm_stats, "mpnet": mpnet_stats},
+    }
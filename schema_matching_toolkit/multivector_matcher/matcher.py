@@ -0,0 +1,140 @@
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, search_params, type_family_filter
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.telemetry import span, traced
+
+from .indexer import MINILM_MODEL_NAME, MINILM_VECTOR, MPNET_MODEL_NAME, MPNET_VECTOR
+
+
+def _method_candidates(
+    hits: List[Any],
+    qvec: np.ndarray,
+    vector_name: str,
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """
+    Re-scores the fused hit set with one method's cosine similarity
+    (stored vectors are normalized -> dot product) and keeps its top_k.
+    """
+    candidates = []
+    for h in hits:
+        payload = h.payload or {}
+        vec = (h.vector or {}).get(vector_name)
+        if vec is None:
+            continue
+
+        candidates.append(
+            {
+                "target": payload.get("column_id", str(h.id)),
+                "score": float(np.dot(qvec, np.asarray(vec, dtype=np.float32))),
+                "data_type": payload.get("data_type", ""),
+                "description": payload.get("description", ""),
+            }
+        )
+
+    candidates.sort(key=lambda x: x["score"], reverse=True)
+    return candidates[:top_k]
+
+
+@traced()
+def multivector_dense_match(
+    source_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    source_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 5,
+    type_filter: bool = False,
+    chunk_size: int = 64,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    Dense matching against a multi-vector collection
+    (see index_target_columns_multivector).
+
+    One batched query per source chunk. Each query prefetches top_k on the
+    MiniLM and on the MPNet vector and fuses them (RRF). The fused set holds
+    the union of both top_k lists, so per-method top_k candidates and scores
+    are recovered exactly from the returned vectors.
+
+    Output:
+      {
+        "method": "multivector_dense_qdrant",
+        "minilm": {"method": "minilm_dense_qdrant", "matches": [...]},
+        "mpnet":  {"method": "mpnet_dense_qdrant",  "matches": [...]}
+      }
+      (per-method "matches" have the same shape as the single matchers)
+    """
+    from qdrant_client.models import Fusion, FusionQuery, Prefetch, QueryRequest
+
+    client = get_qdrant_client(qdrant_cfg)
+
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=text_mode)
+
+    all_texts = [c["text"] for c in source_cols]
+    minilm_all, minilm_stats = embed_texts(get_sentence_model(MINILM_MODEL_NAME), all_texts, encoding)
+    mpnet_all, mpnet_stats = embed_texts(get_sentence_model(MPNET_MODEL_NAME), all_texts, encoding)
+
+    minilm_matches: List[Dict[str, Any]] = []
+    mpnet_matches: List[Dict[str, Any]] = []
+
+    params = search_params(qdrant_cfg)
+
+    for start in range(0, len(source_cols), chunk_size):
+        chunk = source_cols[start : start + chunk_size]
+        minilm_q = minilm_all[start : start + chunk_size]
+        mpnet_q = mpnet_all[start : start + chunk_size]
+
+        requests = []
+        for i, src in enumerate(chunk):
+            flt = type_family_filter(src["data_type"]) if type_filter else None
+            requests.append(
+                QueryRequest(
+                    prefetch=[
+                        Prefetch(query=minilm_q[i].tolist(), using=MINILM_VECTOR, limit=top_k, filter=flt, params=params),
+                        Prefetch(query=mpnet_q[i].tolist(), using=MPNET_VECTOR, limit=top_k, filter=flt, params=params),
+                    ],
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    limit=2 * top_k,
+                    with_payload=True,
+                    with_vector=[MINILM_VECTOR, MPNET_VECTOR],
+                )
+            )
+
+        with span("qdrant.query_batch", collection=qdrant_cfg.collection_name, queries=len(requests)):
+            responses = client.query_batch_points(
+                collection_name=qdrant_cfg.collection_name,
+                requests=requests,
+            )
+
+        for i, (src, resp) in enumerate(zip(chunk, responses)):
+            hits = resp.points
+
+            for out, qvec, vector_name in [
+                (minilm_matches, minilm_q[i], MINILM_VECTOR),
+                (mpnet_matches, mpnet_q[i], MPNET_VECTOR),
+            ]:
+                candidates = _method_candidates(hits, qvec, vector_name, top_k)
+
+                out.append(
+                    {
+                        "source": src["column_id"],
+                        "source_type": src["data_type"],
+                        "best_match": candidates[0]["target"] if candidates else None,
+                        "confidence": candidates[0]["score"] if candidates else 0.0,
+                        "candidates": candidates,
+                    }
+                )
+
+    return {
+        "method": "multivector_dense_qdrant",
+        "match_count": len(source_cols),
+        "encode_stats": {"minilm": minilm_stats, "mpnet": mpnet_stats},
+        "minilm": {"method": "minilm_dense_qdrant", "matches": minilm_matches},
+        "mpnet": {"method": "mpnet_dense_qdrant", "matches": mpnet_matches},
+    }
@@ -1,3 +1,3 @@
-from .profiler import profile_schema
+from .profiler import profile_schema, profile_schema_async
 
-__all__ = ["profile_schema"]
+__all__ = ["profile_schema", "profile_schema_async"]
@@ -0,0 +1,3 @@
+from .sweep import pick_hnsw_params, sweep_hnsw_params, sweep_hnsw_vectors
+
+__all__ = ["sweep_hnsw_params", "sweep_hnsw_vectors", "pick_hnsw_params"]
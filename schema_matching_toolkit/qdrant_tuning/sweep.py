@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, HnswConfig, QdrantConfig
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, recreate_vector_collection
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.utils.vector_search import normalize_rows, topk_cosine
+from schema_matching_toolkit.telemetry import traced
+
+
+DEFAULT_HNSW_GRID = [
+    HnswConfig(m=m, ef_construct=ef)
+    for m in (8, 16, 32)
+    for ef in (64, 128, 256)
+]
+DEFAULT_HNSW_EF = (16, 32, 64, 128, 256)
+
+
+def _percentile_ms(seconds: List[float], q: float) -> float:
+    return round(float(np.percentile(np.asarray(seconds) * 1000.0, q)), 3) if seconds else 0.0
+
+
+def _wait_until_indexed(client, collection_name: str, timeout: float) -> float:
+    """
+    Blocks until the optimizer has finished building the HNSW graph
+    (status green, or grey = nothing scheduled). Returns the seconds waited.
+    """
+    started = time.perf_counter()
+
+    while time.perf_counter() - started < timeout:
+        status = getattr(client.get_collection(collection_name).status, "value", None)
+        if status in (None, "green", "grey"):
+            break
+        time.sleep(0.2)
+
+    return time.perf_counter() - started
+
+
+def _upload(client, cfg: QdrantConfig, vectors: np.ndarray, batch_size: int) -> None:
+    from qdrant_client.models import PointStruct
+
+    for start in range(0, len(vectors), batch_size):
+        chunk = vectors[start : start + batch_size]
+        client.upsert(
+            collection_name=cfg.collection_name,
+            points=[
+                PointStruct(id=start + i, vector={cfg.vector_name: v.tolist()})
+                for i, v in enumerate(chunk)
+            ],
+            wait=True,
+        )
+
+
+def _timed_search(client, cfg: QdrantConfig, queries: np.ndarray, top_k: int, params) -> Dict[str, Any]:
+    ids: List[List[int]] = []
+    seconds: List[float] = []
+
+    for q in queries:
+        t0 = time.perf_counter()
+        resp = client.query_points(
+            collection_name=cfg.collection_name,
+            query=q.tolist(),
+            using=cfg.vector_name,
+            limit=top_k,
+            search_params=params,
+            with_payload=False,
+        )
+        seconds.append(time.perf_counter() - t0)
+        ids.append([int(p.id) for p in resp.points])
+
+    return {
+        "ids": ids,
+        "p50_ms": _percentile_ms(seconds, 50),
+        "p99_ms": _percentile_ms(seconds, 99),
+        "mean_ms": round(float(np.mean(seconds)) * 1000.0, 3) if seconds else 0.0,
+    }
+
+
+def _recall_at_k(found: List[List[int]], truth: np.ndarray) -> float:
+    if not found:
+        return 0.0
+
+    total = 0.0
+    for got, exact in zip(found, truth):
+        exact = {int(j) for j in exact if j >= 0}
+        if exact:
+            total += len(exact.intersection(got)) / len(exact)
+        else:
+            total += 1.0
+
+    return round(total / len(found), 4)
+
+
+def sweep_hnsw_vectors(
+    target_vectors: np.ndarray,
+    query_vectors: np.ndarray,
+    qdrant_cfg: QdrantConfig,
+    hnsw_grid: Optional[Sequence[HnswConfig]] = None,
+    hnsw_ef_values: Iterable[int] = DEFAULT_HNSW_EF,
+    top_k: int = 10,
+    batch_size: int = 512,
+    warmup: int = 10,
+    index_timeout: float = 600.0,
+    keep_collections: bool = False,
+) -> Dict[str, Any]:
+    """
+    Recall / latency sweep over HNSW build (m, ef_construct,
+    full_scan_threshold) and search (hnsw_ef) parameters.
+
+    The target vectors are computed once; every grid point gets its own
+    collection "<collection_name>__hnsw_m<m>_ef<ef_construct>_fst<threshold>"
+    (dropped afterwards unless keep_collections=True). Recall@k is measured against
+    exact NumPy top-k, latency is per query (client round trip).
+
+    Needs a Qdrant server: embedded mode always searches exhaustively.
+
+    Output:
+      {
+        "method": "hnsw_sweep",
+        "points": N, "queries": Q, "top_k": k,
+        "exact": {"p50_ms": ..., "p99_ms": ..., "mean_ms": ...},
+        "results": [
+          {"m": 16, "ef_construct": 128, "full_scan_threshold": None,
+           "hnsw_ef": 64, "recall_at_k": 0.987,
+           "p50_ms": 1.2, "p99_ms": 3.4, "mean_ms": 1.4,
+           "index_seconds": 2.1},
+          ...
+        ]
+      }
+    """
+    from qdrant_client.models import OptimizersConfigDiff, SearchParams
+
+    targets = normalize_rows(target_vectors)
+    queries = normalize_rows(query_vectors)
+
+    if not len(targets) or not len(queries):
+        raise ValueError("Sweep needs at least one target and one query vector")
+
+    hnsw_grid = list(hnsw_grid) if hnsw_grid is not None else DEFAULT_HNSW_GRID
+    hnsw_ef_values = list(hnsw_ef_values)
+    top_k = min(top_k, len(targets))
+
+    truth, _ = topk_cosine(queries, targets, top_k)
+
+    client = get_qdrant_client(qdrant_cfg)
+    results: List[Dict[str, Any]] = []
+    exact: Optional[Dict[str, Any]] = None
+
+    for hnsw in hnsw_grid:
+        cfg = replace(
+            qdrant_cfg,
+            collection_name=(
+                f"{qdrant_cfg.collection_name}__hnsw_m{hnsw.m}_ef{hnsw.ef_construct}"
+                f"_fst{hnsw.full_scan_threshold}"
+            ),
+            vector_size=int(targets.shape[1]),
+            hnsw_config=hnsw,
+        )
+
+        recreate_vector_collection(client, cfg)
+
+        # ✅ build the graph even for small targets (default threshold skips it)
+        client.update_collection(
+            collection_name=cfg.collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=1),
+        )
+
+        t0 = time.perf_counter()
+        _upload(client, cfg, targets, batch_size)
+        _wait_until_indexed(client, cfg.collection_name, index_timeout)
+        index_seconds = round(time.perf_counter() - t0, 3)
+
+        try:
+            _timed_search(client, cfg, queries[:warmup], top_k, None)
+
+            if exact is None:
+                exact = _timed_search(client, cfg, queries, top_k, SearchParams(exact=True))
+                exact.pop("ids")
+
+            for ef in hnsw_ef_values:
+                run = _timed_search(client, cfg, queries, top_k, SearchParams(hnsw_ef=ef))
+
+                results.append(
+                    {
+                        "m": hnsw.m,
+                        "ef_construct": hnsw.ef_construct,
+                        "full_scan_threshold": hnsw.full_scan_threshold,
+                        "hnsw_ef": ef,
+                        "recall_at_k": _recall_at_k(run["ids"], truth),
+                        "p50_ms": run["p50_ms"],
+                        "p99_ms": run["p99_ms"],
+                        "mean_ms": run["mean_ms"],
+                        "index_seconds": index_seconds,
+                    }
+                )
+        finally:
+            if not keep_collections:
+                try:
+                    client.delete_collection(collection_name=cfg.collection_name)
+                except Exception:
+                    pass
+
+    return {
+        "method": "hnsw_sweep",
+        "points": int(len(targets)),
+        "queries": int(len(queries)),
+        "top_k": top_k,
+        "exact": exact,
+        "results": results,
+    }
+
+
+@traced()
+def sweep_hnsw_params(
+    target_schema: Dict[str, Any],
+    source_schema: Dict[str, Any],
+    qdrant_cfg: QdrantConfig,
+    model_key: str = "minilm",
+    hnsw_grid: Optional[Sequence[HnswConfig]] = None,
+    hnsw_ef_values: Iterable[int] = DEFAULT_HNSW_EF,
+    top_k: int = 10,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    sweep_hnsw_vectors() on real schemas: target columns and source
+    columns (the queries) are embedded ONCE with MiniLM / MPNet, the
+    same texts the indexers / matchers use.
+
+    Input:
+      target_schema, source_schema = extract_schema(...) outputs
+      qdrant_cfg = QdrantConfig(host=..., collection_name="hnsw_sweep")
+
+    Output:
+      same as sweep_hnsw_vectors() (+ "model")
+    """
+    from schema_matching_toolkit.common.embedding_service import embed_texts
+    from schema_matching_toolkit.common.models import get_sentence_model
+
+    if model_key == "minilm":
+        from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+    elif model_key == "mpnet":
+        from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME
+    else:
+        raise ValueError("model_key must be one of: minilm, mpnet")
+
+    model = get_sentence_model(MODEL_NAME)
+
+    target_texts = [c["text"] for c in flatten_columns_with_desc(target_schema, text_mode=text_mode)]
+    source_texts = [c["text"] for c in flatten_columns_with_desc(source_schema, text_mode=text_mode)]
+
+    target_vectors, _ = embed_texts(model, target_texts, encoding)
+    query_vectors, _ = embed_texts(model, source_texts, encoding)
+
+    out = sweep_hnsw_vectors(
+        target_vectors,
+        query_vectors,
+        qdrant_cfg,
+        hnsw_grid=hnsw_grid,
+        hnsw_ef_values=hnsw_ef_values,
+        top_k=top_k,
+        **kwargs,
+    )
+    out["model"] = MODEL_NAME
+    return out
+
+
+def pick_hnsw_params(
+    sweep: Dict[str, Any],
+    min_recall: float = 0.95,
+    latency: str = "p99_ms",
+) -> Optional[Dict[str, Any]]:
+    """
+    Fastest grid point (by `latency`) with recall_at_k >= min_recall,
+    or None if no point reaches it.
+
+    Output:
+      {"hnsw_config": HnswConfig(...), "hnsw_ef": 64, "row": {...}}
+      -> copy into QdrantConfig(hnsw_config=..., hnsw_ef=...)
+    """
+    ok = [r for r in sweep.get("results", []) if r["recall_at_k"] >= min_recall]
+    if not ok:
+        return None
+
+    best = min(ok, key=lambda r: (r[latency], -r["recall_at_k"]))
+
+    return {
+        "hnsw_config": HnswConfig(
+            m=best["m"],
+            ef_construct=best["ef_construct"],
+            full_scan_threshold=best["full_scan_threshold"],
+        ),
+        "hnsw_ef": best["hnsw_ef"],
+        "row": best,
+    }
@@ -1,12 +1,14 @@
 from typing import Dict, Any, List, Tuple, Optional
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 from schema_matching_toolkit.common.db_config import DBConfig
+from schema_matching_toolkit.common.engines import get_engine
+from schema_matching_toolkit.telemetry import traced
 
 
 def _get_engine(cfg: DBConfig) -> Engine:
-    return create_engine(cfg.sqlalchemy_url())
+    return get_engine(cfg)
 
 
 def _normalize_col(col: str) -> str:
@@ -176,6 +178,7 @@ def _heuristic_relationships(schema_data: Dict[str, Any]) -> List[Dict[str, Any]
     return rels
 
 
+@traced()
 def detect_relationships(cfg: DBConfig, schema_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main entry:
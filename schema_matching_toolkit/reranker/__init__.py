@@ -0,0 +1,3 @@
+from .cross_encoder_reranker import rerank_column_matches, select_rerank_pairs
+
+__all__ = ["rerank_column_matches", "select_rerank_pairs"]
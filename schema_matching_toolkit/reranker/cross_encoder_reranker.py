@@ -0,0 +1,148 @@
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from schema_matching_toolkit.common.db_config import RerankConfig
+from schema_matching_toolkit.telemetry import span, traced
+
+
+def _margin(match: Dict[str, Any]) -> float:
+    cands = match.get("candidates", [])
+    if not cands:
+        return float("inf")
+    top1 = float(cands[0].get("final_score", 0.0))
+    top2 = float(cands[1].get("final_score", 0.0)) if len(cands) > 1 else 0.0
+    return top1 - top2
+
+
+def select_rerank_pairs(
+    column_matches: List[Dict[str, Any]],
+    top_k: int = 5,
+    max_pairs: int = 2000,
+) -> Tuple[List[Tuple[int, int]], Dict[str, Any]]:
+    """
+    Chooses which (column match, candidate) pairs get rescored.
+
+    Columns are visited by ascending top-1 / top-2 fused margin (most
+    ambiguous first); a column is taken with ALL its top_k candidates or
+    not at all, until max_pairs is reached. Single-candidate columns are
+    skipped (nothing to reorder).
+
+    Output:
+      ([(match_index, candidate_index), ...],
+       {"pairs": N, "max_pairs": ..., "columns_reranked": ..., "columns_skipped": ...})
+    """
+    order = sorted(
+        (i for i, m in enumerate(column_matches) if len(m.get("candidates", [])) > 1),
+        key=lambda i: _margin(column_matches[i]),
+    )
+
+    pairs: List[Tuple[int, int]] = []
+    reranked = 0
+
+    for i in order:
+        n = min(top_k, len(column_matches[i]["candidates"]))
+        if len(pairs) + n > max_pairs:
+            continue
+        pairs.extend((i, j) for j in range(n))
+        reranked += 1
+
+    stats = {
+        "pairs": len(pairs),
+        "max_pairs": max_pairs,
+        "columns_reranked": reranked,
+        "columns_skipped": len(column_matches) - reranked,
+    }
+    return pairs, stats
+
+
+@traced()
+def rerank_column_matches(
+    column_matches: List[Dict[str, Any]],
+    source_texts: Dict[str, str],
+    target_texts: Dict[str, str],
+    cfg: Optional[RerankConfig] = None,
+    model=None,
+) -> Dict[str, Any]:
+    """
+    Cross-encoder rerank of fused ensemble matches (updated IN PLACE).
+
+    Input:
+      column_matches = [{"source", "best_match", "confidence", "candidates": [
+                          {"candidate", "final_score", ...}, ...]}, ...]
+      source_texts / target_texts = {"table.col": "table col dtype desc"}
+      cfg   = RerankConfig(...)
+      model = CrossEncoder (default: get_cross_encoder(cfg.model_name, cfg.backend))
+
+    All selected pairs (see select_rerank_pairs) are scored in ONE batched
+    predict() call. For every rescored candidate:
+      rerank_score = cross-encoder score (0..1 with the default sigmoid
+                     activation of single-label CrossEncoders)
+      final_score  = (1 - weight) * fused final_score + weight * rerank_score
+    Rescored candidates are re-sorted and ranked before the unscored tail;
+    best_match / confidence follow the new top-1 and "reranked": True is set.
+
+    Output:
+      {"pairs": N, "max_pairs": ..., "columns_reranked": ..., "columns_skipped": ...,
+       "changed_best_match": ..., "seconds": ...}
+    """
+    cfg = cfg or RerankConfig()
+
+    pairs, stats = select_rerank_pairs(column_matches, cfg.top_k, cfg.max_pairs)
+    stats["changed_best_match"] = 0
+    stats["seconds"] = 0.0
+
+    if not pairs:
+        return stats
+
+    if model is None:
+        from schema_matching_toolkit.common.models import get_cross_encoder
+
+        model = get_cross_encoder(cfg.model_name, cfg.backend, cfg.max_length)
+
+    texts = [
+        (
+            source_texts.get(column_matches[i]["source"], column_matches[i]["source"]),
+            target_texts.get(
+                column_matches[i]["candidates"][j]["candidate"],
+                column_matches[i]["candidates"][j]["candidate"],
+            ),
+        )
+        for i, j in pairs
+    ]
+
+    t0 = time.perf_counter()
+    with span("cross_encoder.predict", pairs=len(texts), batch_size=cfg.batch_size):
+        scores = model.predict(texts, batch_size=cfg.batch_size, show_progress_bar=False)
+    stats["seconds"] = round(time.perf_counter() - t0, 4)
+
+    by_match: Dict[int, Dict[int, float]] = {}
+    for (i, j), score in zip(pairs, scores):
+        by_match.setdefault(i, {})[j] = float(score)
+
+    w = cfg.weight
+
+    for i, rescored in by_match.items():
+        m = column_matches[i]
+        cands = m["candidates"]
+        previous_best = m.get("best_match")
+
+        head = []
+        for j, rerank_score in rescored.items():
+            c = cands[j]
+            c["fused_score"] = c.get("final_score", 0.0)
+            c["rerank_score"] = round(rerank_score, 4)
+            c["final_score"] = round((1.0 - w) * c["fused_score"] + w * rerank_score, 4)
+            head.append(c)
+
+        head.sort(key=lambda c: c["final_score"], reverse=True)
+        tail = [c for j, c in enumerate(cands) if j not in rescored]
+
+        m["candidates"] = head + tail
+        m["best_match"] = head[0]["candidate"]
+        m["confidence"] = head[0]["final_score"]
+        m["reranked"] = True
+
+        if m["best_match"] != previous_best:
+            stats["changed_best_match"] += 1
+
+    return stats
@@ -1,3 +1,3 @@
-from .extractor import extract_schema
+from .extractor import extract_schema, extract_schema_async
 
-__all__ = ["extract_schema"]
+__all__ = ["extract_schema", "extract_schema_async"]
@@ -1,14 +1,17 @@
-from typing import Dict, Any, List
-from sqlalchemy import create_engine, text
+from typing import Any, Callable, Dict, List
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 from schema_matching_toolkit.common.db_config import DBConfig
+from schema_matching_toolkit.common.engines import get_engine
+from schema_matching_toolkit.telemetry import traced
 
 
 def _get_engine(cfg: DBConfig) -> Engine:
-    return create_engine(cfg.sqlalchemy_url())
+    return get_engine(cfg)
 
 
+@traced()
 def extract_schema(cfg: DBConfig) -> Dict[str, Any]:
     """
     Extract schema from DB.
@@ -33,6 +36,25 @@ def extract_schema(cfg: DBConfig) -> Dict[str, Any]:
     }
     """
     engine = _get_engine(cfg)
+    return _extract_schema(cfg, engine.connect)
+
+
+@traced()
+async def extract_schema_async(cfg: DBConfig) -> Dict[str, Any]:
+    """
+    extract_schema() on an async SQLAlchemy engine (asyncpg / aiomysql /
+    aiosqlite ..., see DBConfig.sqlalchemy_async_url). Same output.
+    """
+    from schema_matching_toolkit.common.async_utils import run_with_async_connection
+
+    return await run_with_async_connection(cfg, lambda connect: _extract_schema(cfg, connect))
+
+
+def _extract_schema(cfg: DBConfig, connect: Callable[[], Any]) -> Dict[str, Any]:
+    """
+    connect() -> context manager yielding a sync Connection
+    (engine.connect, or the wrapped connection of an AsyncConnection.run_sync).
+    """
     db_type = (cfg.db_type or "").lower().strip()
 
     # default schema
@@ -44,7 +66,7 @@ def extract_schema(cfg: DBConfig) -> Dict[str, Any]:
     if db_type == "sqlite":
         tables: List[Dict[str, Any]] = []
 
-        with engine.connect() as conn:
+        with connect() as conn:
             table_rows = conn.execute(
                 text("""
                     SELECT name
@@ -102,7 +124,7 @@ def extract_schema(cfg: DBConfig) -> Dict[str, Any]:
 
     tables: List[Dict[str, Any]] = []
 
-    with engine.connect() as conn:
+    with connect() as conn:
         table_rows = conn.execute(query_tables, {"schema": schema}).fetchall()
         col_rows = conn.execute(query_columns, {"schema": schema}).fetchall()
 
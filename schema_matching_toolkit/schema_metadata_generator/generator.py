@@ -3,11 +3,13 @@ from __future__ import annotations
 from typing import Dict, Any, Optional, List, Set
 from datetime import datetime, timezone
 
+from schema_matching_toolkit.checkpoint.store import RunCheckpoint, checkpointed
 from schema_matching_toolkit.common.db_config import DBConfig, GroqConfig
 from schema_matching_toolkit.schema_extractor import extract_schema
 from schema_matching_toolkit.profiling import profile_schema
 from schema_matching_toolkit.relationship_detector import detect_relationships
 from schema_matching_toolkit.llm_description import describe_schema_with_groq
+from schema_matching_toolkit.telemetry import traced
 
 from .exporter import save_metadata_output
 
@@ -120,6 +122,7 @@ def _is_primary_key(
 # Main
 # ---------------------------------------------------------
 
+@traced()
 def generate_schema_metadata(
     db_cfg: DBConfig,
     groq_cfg: Optional[GroqConfig] = None,
@@ -127,22 +130,47 @@ def generate_schema_metadata(
     profile_top_k: int = 3,
     output_format: str = "csv",
     output_path: Optional[str] = None,
+    run_dir: Optional[str] = None,
+    resume: bool = False,
 ) -> Dict[str, Any]:
-
-    schema = extract_schema(db_cfg)
-
-    profiling = profile_schema(
-        cfg=db_cfg,
-        schema_data=schema,
-        sample_size=profile_sample_size,
-        top_k=profile_top_k,
+    """
+    Extract -> profile -> relationships -> (Groq descriptions) -> metadata file.
+
+    run_dir given -> each stage output is stored there (RunCheckpoint);
+    resume=True reuses stages whose inputs are unchanged, so a failed Groq
+    call does not repeat extraction and profiling.
+    """
+    checkpoint = RunCheckpoint(run_dir, resume=resume) if run_dir else None
+
+    schema = checkpointed(checkpoint, "schema", {"db": db_cfg}, lambda: extract_schema(db_cfg))
+
+    profiling = checkpointed(
+        checkpoint,
+        "profile",
+        {"db": db_cfg, "schema": schema, "sample_size": profile_sample_size, "top_k": profile_top_k},
+        lambda: profile_schema(
+            cfg=db_cfg,
+            schema_data=schema,
+            sample_size=profile_sample_size,
+            top_k=profile_top_k,
+        ),
     )
 
-    relationships = detect_relationships(db_cfg, schema)
+    relationships = checkpointed(
+        checkpoint,
+        "relationships",
+        {"db": db_cfg, "schema": schema},
+        lambda: detect_relationships(db_cfg, schema),
+    )
     relationship_items = _build_relationship_items(relationships)
 
     descriptions = (
-        describe_schema_with_groq(schema, groq_cfg)
+        checkpointed(
+            checkpoint,
+            "descriptions",
+            {"schema": schema, "model": groq_cfg.model},
+            lambda: describe_schema_with_groq(schema, groq_cfg),
+        )
         if groq_cfg else None
     )
 
@@ -226,4 +254,7 @@ def generate_schema_metadata(
         metadata, output_format, output_path
     )
 
+    if checkpoint is not None:
+        metadata["checkpoint"] = checkpoint.stats()
+
     return metadata
@@ -0,0 +1,4 @@
+from .jobs import Job, MappingService, QueueFullError
+from .server import make_server, serve_mapping_service
+
+__all__ = ["Job", "MappingService", "QueueFullError", "make_server", "serve_mapping_service"]
@@ -0,0 +1,44 @@
+import argparse
+
+from schema_matching_toolkit.common.db_config import ServiceConfig, TelemetryConfig
+from schema_matching_toolkit.service.server import serve_mapping_service
+
+
+def main():
+    defaults = ServiceConfig()
+
+    ap = argparse.ArgumentParser(description="Long-running schema mapping service")
+    ap.add_argument("--host", default=defaults.host)
+    ap.add_argument("--port", type=int, default=defaults.port)
+    ap.add_argument("--unix-socket", default=None)
+    ap.add_argument("--workers", type=int, default=defaults.workers)
+    ap.add_argument("--max-queue", type=int, default=defaults.max_queue)
+    ap.add_argument("--warm", default=",".join(defaults.warm_models),
+                    help="models loaded at startup: minilm,mpnet,rerank (empty = none)")
+    ap.add_argument("--output-dir", default=defaults.output_dir,
+                    help="default directory for mapping job output files")
+    ap.add_argument("--telemetry-jsonl", default=None,
+                    help="enable spans + metrics, appended to this JSON-lines file")
+    ap.add_argument("--otel", action="store_true", help="also export spans + metrics to OpenTelemetry")
+    args = ap.parse_args()
+
+    if args.telemetry_jsonl or args.otel:
+        from schema_matching_toolkit.telemetry import configure_telemetry
+
+        configure_telemetry(TelemetryConfig(jsonl_path=args.telemetry_jsonl, opentelemetry=args.otel))
+
+    serve_mapping_service(
+        ServiceConfig(
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+            workers=args.workers,
+            max_queue=args.max_queue,
+            warm_models=tuple(m for m in args.warm.split(",") if m),
+            output_dir=args.output_dir,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import itertools
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from schema_matching_toolkit.common.db_config import (
+    DBConfig,
+    GroqConfig,
+    RerankConfig,
+    ServiceConfig,
+)
+from schema_matching_toolkit.telemetry import histogram, span, telemetry_enabled, telemetry_snapshot
+
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class QueueFullError(ValueError):
+    """
+    Raised by MappingService.submit() when the job queue is at capacity.
+    """
+
+
+@dataclass
+class Job:
+    job_id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    output_file: Optional[str] = None  # service-owned default output (removed on eviction)
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_status(self) -> Dict[str, Any]:
+        out = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queue_seconds": None,
+            "run_seconds": None,
+            "error": self.error,
+        }
+        if self.started_at is not None:
+            out["queue_seconds"] = round(self.started_at - self.submitted_at, 4)
+        if self.started_at is not None and self.finished_at is not None:
+            out["run_seconds"] = round(self.finished_at - self.started_at, 4)
+        return out
+
+
+# -------------------------
+# Job handlers: JSON params -> JSON-able result
+# -------------------------
+def _db_cfg(params: Dict[str, Any], key: str) -> DBConfig:
+    if not isinstance(params.get(key), dict):
+        raise ValueError(f"'{key}' (DBConfig fields) is required")
+    return DBConfig(**params[key])
+
+
+def _groq_cfg(params: Dict[str, Any]) -> Optional[GroqConfig]:
+    return GroqConfig(**params["groq"]) if params.get("groq") else None
+
+
+def _run_extract(params: Dict[str, Any]) -> Dict[str, Any]:
+    from schema_matching_toolkit.schema_extractor import extract_schema
+
+    return extract_schema(_db_cfg(params, "db"))
+
+
+def _run_profile(params: Dict[str, Any]) -> Dict[str, Any]:
+    from schema_matching_toolkit.profiling import profile_schema
+    from schema_matching_toolkit.schema_extractor import extract_schema
+
+    cfg = _db_cfg(params, "db")
+    return profile_schema(
+        cfg=cfg,
+        schema_data=params.get("schema") or extract_schema(cfg),
+        sample_size=int(params.get("sample_size", 50)),
+        top_k=int(params.get("top_k", 3)),
+    )
+
+
+def _run_metadata(params: Dict[str, Any]) -> Dict[str, Any]:
+    from schema_matching_toolkit.schema_metadata_generator import generate_schema_metadata
+
+    kwargs = {k: v for k, v in params.items() if k not in {"db", "groq"}}
+    return generate_schema_metadata(_db_cfg(params, "db"), groq_cfg=_groq_cfg(params), **kwargs)
+
+
+def _run_mapping(params: Dict[str, Any]) -> Dict[str, Any]:
+    from schema_matching_toolkit.hybrid_ensemble_matcher.compact import CompactMappingResult, compact_to_dict
+    from schema_matching_toolkit.hybrid_ensemble_matcher.runner import mapping_options_from_json, run_hybrid_mapping
+
+    kwargs = mapping_options_from_json({k: v for k, v in params.items() if k not in {"source", "target", "groq"}})
+
+    out = run_hybrid_mapping(
+        _db_cfg(params, "source"),
+        _db_cfg(params, "target"),
+        groq_cfg=_groq_cfg(params),
+        **kwargs,
+    )
+
+    if isinstance(out.get("result"), CompactMappingResult):
+        out["result"] = compact_to_dict(out["result"])
+    return out
+
+
+DEFAULT_JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "extract": _run_extract,
+    "profile": _run_profile,
+    "metadata": _run_metadata,
+    "mapping": _run_mapping,
+}
+
+
+def warm_up(models) -> List[str]:
+    """
+    Loads the requested models once so the first job does not pay for it.
+    """
+    from schema_matching_toolkit.common.models import get_cross_encoder, get_sentence_model
+
+    loaded = []
+    for key in models:
+        if key == "minilm":
+            from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+
+            get_sentence_model(MODEL_NAME)
+        elif key == "mpnet":
+            from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME
+
+            get_sentence_model(MODEL_NAME)
+        elif key == "rerank":
+            cfg = RerankConfig()
+            get_cross_encoder(cfg.model_name, cfg.backend, cfg.max_length)
+        else:
+            raise ValueError("warm_models entries must be: minilm, mpnet, rerank")
+        loaded.append(key)
+    return loaded
+
+
+# -------------------------
+# Service
+# -------------------------
+class MappingService:
+    """
+    In-process job runner behind the HTTP service.
+
+      - bounded FIFO queue (cfg.max_queue); submit() raises QueueFullError
+        when full -> callers back off instead of piling up work
+      - cfg.workers threads share the warm models, engines and Qdrant clients
+      - finished jobs (status + result) kept for the last cfg.max_finished
+    """
+
+    def __init__(
+        self,
+        cfg: Optional[ServiceConfig] = None,
+        handlers: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+    ):
+        self.cfg = cfg or ServiceConfig()
+        self.handlers = {**DEFAULT_JOB_HANDLERS, **(handlers or {})}
+
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max(1, self.cfg.max_queue))
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._counter = itertools.count()
+        self._stats = {"submitted": 0, "rejected": 0, "done": 0, "failed": 0, "cancelled": 0}
+        self._run_seconds: List[float] = []
+        self._started_at: Optional[float] = None
+        self.warm_models: List[str] = []
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def start(self, warm: bool = True) -> "MappingService":
+        if self._workers:
+            return self
+
+        if warm:
+            self.warm_models = warm_up(self.cfg.warm_models)
+
+        self._started_at = time.time()
+        for i in range(max(1, self.cfg.workers)):
+            t = threading.Thread(target=self._run, name=f"mapping-worker-{i}", daemon=True)
+            t.start()
+            self._workers.append(t)
+        return self
+
+    def close(self, timeout: float = 5.0) -> None:
+        for _ in self._workers:
+            self._queue.put(None)
+        for t in self._workers:
+            t.join(timeout=timeout)
+        self._workers = []
+
+    # -------------------------
+    # Jobs
+    # -------------------------
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Job:
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind '{kind}' (use: {', '.join(sorted(self.handlers))})")
+
+        job = Job(job_id=f"{next(self._counter):06d}-{uuid.uuid4().hex[:8]}", kind=kind, params=dict(params or {}))
+
+        if kind == "mapping" and not job.params.get("output_file"):
+            # ✅ one file per job (concurrent jobs never share a timestamped default name)
+            os.makedirs(self.cfg.output_dir, exist_ok=True)
+            fmt = (job.params.get("output_format") or "csv").lower().strip()
+            job.output_file = job.params["output_file"] = os.path.join(self.cfg.output_dir, f"{job.job_id}.{fmt}")
+
+        with self._lock:
+            try:
+                # ✅ admission control: never block the HTTP thread on a full queue
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._stats["rejected"] += 1
+                raise QueueFullError(f"Job queue is full ({self.cfg.max_queue} queued)")
+
+            self._jobs[job.job_id] = job
+            self._stats["submitted"] += 1
+
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancels a queued job (running jobs are not interrupted).
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != "queued":
+                return False
+            self._finish(job, "cancelled")
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["running"] = sum(1 for j in self._jobs.values() if j.status == "running")
+            runs = sorted(self._run_seconds)
+
+        out["queued"] = self._queue.qsize()
+        out["workers"] = len(self._workers)
+        out["max_queue"] = self.cfg.max_queue
+        out["warm_models"] = self.warm_models
+        out["uptime_seconds"] = round(time.time() - self._started_at, 1) if self._started_at else 0.0
+
+        if runs:
+            out["run_seconds_p50"] = round(runs[int(0.50 * (len(runs) - 1))], 4)
+            out["run_seconds_p99"] = round(runs[int(0.99 * (len(runs) - 1))], 4)
+        if telemetry_enabled():
+            out["telemetry"] = telemetry_snapshot()
+        return out
+
+    # -------------------------
+    # Worker
+    # -------------------------
+    def _finish(self, job: Job, status: str) -> None:
+        # caller holds self._lock
+        job.status = status
+        job.finished_at = time.time()
+        self._stats[status] += 1
+
+        if job.started_at is not None:
+            self._run_seconds.append(job.finished_at - job.started_at)
+            del self._run_seconds[:-1000]
+
+        # keep the last max_finished finished jobs (evicted before waiters wake up)
+        finished = [jid for jid, j in self._jobs.items() if j is job or j.done.is_set()]
+        for jid in finished[: max(0, len(finished) - self.cfg.max_finished)]:
+            evicted = self._jobs.pop(jid)
+            if evicted.output_file and os.path.exists(evicted.output_file):
+                os.remove(evicted.output_file)
+
+        job.done.set()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+
+            with self._lock:
+                if job.status != "queued":
+                    continue
+                job.status = "running"
+                job.started_at = time.time()
+
+            histogram("service.queue_wait_seconds", job.started_at - job.submitted_at, kind=job.kind)
+
+            try:
+                with span("service.job", kind=job.kind, job_id=job.job_id):
+                    result = self.handlers[job.kind](job.params)
+            except Exception as e:
+                with self._lock:
+                    job.error = f"{type(e).__name__}: {e}"
+                    self._finish(job, "failed")
+                continue
+
+            with self._lock:
+                job.result = result
+                self._finish(job, "done")
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from schema_matching_toolkit.common.db_config import ServiceConfig
+
+from .jobs import MappingService, QueueFullError
+
+
+MAX_BODY_BYTES = 32 * 1024 * 1024
+MAX_WAIT_SECONDS = 60.0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    JSON API:
+
+      POST   /jobs                 {"kind": "mapping", "params": {...}}
+                                   -> 202 {"job_id": ..., "status": "queued"}
+                                   -> 429 queue full (Retry-After: 1)
+      GET    /jobs/<id>[?wait=s]   status (optionally long-polls until finished)
+      GET    /jobs/<id>/result     200 result | 409 not finished | 500 failed
+      DELETE /jobs/<id>            cancel a queued job
+      GET    /health, /stats       queue depth, workers, counters
+    """
+
+    service: MappingService  # set by make_server()
+    protocol_version = "HTTP/1.1"
+
+    # -------------------------
+    # Plumbing
+    # -------------------------
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port)
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # per-request access logs would dominate the load test
+        pass
+
+    def _send(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self) -> Tuple[list, Dict[str, list]]:
+        url = urlparse(self.path)
+        return [p for p in url.path.split("/") if p], parse_qs(url.query)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"Request body too large ({length} bytes)")
+        data = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    # -------------------------
+    # Routes
+    # -------------------------
+    def do_GET(self) -> None:
+        parts, query = self._route()
+
+        if parts in (["health"], ["stats"]):
+            self._send(200, {"status": "ok", **self.service.stats()})
+            return
+
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.service.get(parts[1])
+            if job is None:
+                self._send(404, {"error": f"Unknown job {parts[1]}"})
+                return
+
+            if len(parts) == 2:
+                wait = min(float(query.get("wait", ["0"])[0] or 0), MAX_WAIT_SECONDS)
+                if wait > 0:
+                    job.done.wait(wait)
+                self._send(200, job.to_status())
+                return
+
+            if parts[2] == "result":
+                if job.status == "done":
+                    self._send(200, {"job_id": job.job_id, "result": job.result})
+                elif job.status == "failed":
+                    self._send(500, job.to_status())
+                else:
+                    self._send(409, job.to_status())
+                return
+
+        self._send(404, {"error": f"No route for GET {self.path}"})
+
+    def do_POST(self) -> None:
+        parts, _ = self._route()
+        if parts != ["jobs"]:
+            self._send(404, {"error": f"No route for POST {self.path}"})
+            return
+
+        try:
+            body = self._read_json()
+            job = self.service.submit(body.get("kind", ""), body.get("params") or {})
+        except QueueFullError as e:
+            self._send(429, {"error": str(e)}, headers={"Retry-After": "1"})
+            return
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+
+        self._send(202, {"job_id": job.job_id, "status": job.status})
+
+    def do_DELETE(self) -> None:
+        parts, _ = self._route()
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send(404, {"error": f"No route for DELETE {self.path}"})
+            return
+
+        if self.service.cancel(parts[1]):
+            self._send(200, {"job_id": parts[1], "status": "cancelled"})
+        else:
+            self._send(409, {"error": f"Job {parts[1]} is not queued"})
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        # BaseHTTPRequestHandler expects these
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def make_server(service: MappingService, cfg: Optional[ServiceConfig] = None):
+    """
+    HTTP server bound to cfg.unix_socket or (cfg.host, cfg.port);
+    requests are handled on their own threads, jobs on the service workers.
+    """
+    cfg = cfg or service.cfg
+    handler = type("MappingServiceHandler", (_Handler,), {"service": service})
+
+    if cfg.unix_socket:
+        return _UnixHTTPServer(cfg.unix_socket, handler)
+
+    server = ThreadingHTTPServer((cfg.host, cfg.port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_mapping_service(cfg: Optional[ServiceConfig] = None) -> None:
+    """
+    Runs the service until interrupted: warm models, start workers, serve.
+
+    Input:
+      cfg = ServiceConfig(port=8765, workers=2, max_queue=32)
+
+    Usage:
+      python -m schema_matching_toolkit.service --port 8765 --workers 4
+      curl -X POST localhost:8765/jobs -d '{"kind": "extract", "params": {"db": {...}}}'
+    """
+    from schema_matching_toolkit.common.engines import dispose_engines
+    from schema_matching_toolkit.common.qdrant_utils import close_qdrant_clients
+    from schema_matching_toolkit.telemetry import flush_telemetry
+
+    cfg = cfg or ServiceConfig()
+    service = MappingService(cfg).start()
+    server = make_server(service, cfg)
+
+    where = cfg.unix_socket or f"http://{cfg.host}:{cfg.port}"
+    print(f"✅ Mapping service on {where} ({cfg.workers} workers, queue {cfg.max_queue}, warm: {service.warm_models})")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        close_qdrant_clients()
+        dispose_engines()
+        flush_telemetry()
@@ -1,5 +1,13 @@
-from typing import Dict, Any, List
-from rank_bm25 import BM25Okapi
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from schema_matching_toolkit.utils.identifier_tokenizer import get_identifier_tokenizer
+from schema_matching_toolkit.utils.type_family import family_masks
+from schema_matching_toolkit.telemetry import counter, span, traced
+
+
+BM25_TOKENIZERS = ("identifier", "whitespace")
 
 
 def _flatten_columns(schema: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -19,34 +27,82 @@ def _flatten_columns(schema: Dict[str, Any]) -> List[Dict[str, str]]:
 
             col_id = f"{table_name}.{col_name}"
             text = f"{table_name} {col_name} {dtype}".lower()
-            cols.append({"id": col_id, "text": text})
+            cols.append(
+                {"id": col_id, "table": table_name, "column": col_name, "text": text, "data_type": dtype}
+            )
 
     return cols
 
 
+def bm25_tokens(
+    col: Dict[str, Any],
+    tokenizer: str = "identifier",
+    abbreviations: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """
+    BM25 terms of one flattened column.
+
+    tokenizer = "identifier" -> snake / camel / digit split + abbreviation
+                                expansion on the RAW names
+                                ('tbl_cust CustAmt numeric' ->
+                                 ['tbl', 'customer', 'customer', 'amount', 'numeric'])
+                "whitespace" -> the lowercased "table column dtype" words
+    """
+    if tokenizer == "whitespace":
+        return col["text"].split()
+    if tokenizer != "identifier":
+        raise ValueError(f"tokenizer must be one of: {', '.join(BM25_TOKENIZERS)}")
+
+    tok = get_identifier_tokenizer(abbreviations)
+    return [
+        *tok.tokenize(col["table"]),
+        *tok.tokenize(col["column"]),
+        *tok.tokenize_text(col["data_type"]),
+    ]
+
+
+@traced()
 def bm25_match(
     source_schema: Dict[str, Any],
     target_schema: Dict[str, Any],
     top_k: int = 5,   # ✅ keep it so old test will work
+    type_filter: bool = False,
+    tokenizer: str = "identifier",
+    abbreviations: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Returns only Top-1 match per source column (even if top_k is given)
+
+    type_filter = True -> targets with an incompatible type family are
+                         masked out (score 0) before ranking
+
+    tokenizer / abbreviations -> see bm25_tokens() ("identifier" lets
+                                 'CustAmt' meet 'customer_amount')
     """
+    from rank_bm25 import BM25Okapi
+
     source_cols = _flatten_columns(source_schema)
     target_cols = _flatten_columns(target_schema)
 
     if not source_cols or not target_cols:
         return {"method": "bm25", "top_k": 1, "matches": []}
 
-    corpus = [t["text"].split() for t in target_cols]
-    bm25 = BM25Okapi(corpus)
+    with span("bm25.build_index", documents=len(target_cols)):
+        corpus = [bm25_tokens(t, tokenizer, abbreviations) for t in target_cols]
+        bm25 = BM25Okapi(corpus)
+    # one mask per source family, target families classified once
+    masks = family_masks([t["data_type"] for t in target_cols]) if type_filter else None
 
     results = []
+    counter("bm25.queries", len(source_cols))
 
     for src in source_cols:
-        query = src["text"].split()
+        query = bm25_tokens(src, tokenizer, abbreviations)
         scores = bm25.get_scores(query)
 
+        if type_filter:
+            scores = np.where(masks(src["data_type"]), scores, 0.0)
+
         # normalize 0..1
         max_score = max(scores) if len(scores) > 0 else 0
         if max_score > 0:
@@ -60,7 +116,8 @@ def bm25_match(
             reverse=True
         )
 
-        if not ranked:
+        # no overlap (or only type-incompatible overlap) -> no BM25 vote
+        if not ranked or ranked[0][1] <= 0:
             results.append(
                 {"source": src["id"], "best_match": None, "score": 0.0}
             )
@@ -0,0 +1,19 @@
+from .table import (
+    StaticEmbeddingTable,
+    build_static_vocabulary,
+    distill_static_table,
+    encode_static,
+    load_static_table,
+    save_static_table,
+)
+from .matcher import static_dense_match
+
+__all__ = [
+    "StaticEmbeddingTable",
+    "build_static_vocabulary",
+    "distill_static_table",
+    "encode_static",
+    "load_static_table",
+    "save_static_table",
+    "static_dense_match",
+]
@@ -0,0 +1,91 @@
+from typing import Dict, Any, List
+
+import numpy as np
+
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.utils.vector_search import topk_cosine
+from schema_matching_toolkit.telemetry import traced
+
+from .table import StaticEmbeddingTable, encode_static
+
+
+@traced()
+def static_dense_match(
+    source_schema: Dict[str, Any],
+    target_schema: Dict[str, Any],
+    table: StaticEmbeddingTable,
+    source_descriptions: Dict[str, Any] | None = None,
+    target_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 5,
+    type_filter: bool = False,
+) -> Dict[str, Any]:
+    """
+    "Turbo" dense matching with static token embeddings (NumPy only,
+    no transformer forward pass, no Qdrant).
+
+    Input:
+      table = distill_static_table(...) / load_static_table(...)
+
+    Output (same shape as match_source_to_target_dense):
+      {
+        "method": "static_dense",
+        "match_count": N,
+        "matches": [
+          {"source": "...", "source_type": "...", "best_match": "...",
+           "confidence": 0.81, "candidates": [{"target": "...", "score": ...}]}
+        ]
+      }
+    """
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions)
+    target_cols = flatten_columns_with_desc(target_schema, target_descriptions)
+
+    if not source_cols or not target_cols:
+        return {"method": "static_dense", "match_count": 0, "matches": []}
+
+    src_vecs = encode_static([c["text"] for c in source_cols], table)
+    tgt_vecs = encode_static([c["text"] for c in target_cols], table)
+
+    if type_filter:
+        idx, scores = topk_cosine(
+            src_vecs,
+            tgt_vecs,
+            top_k,
+            query_families=[type_family(c["data_type"]) for c in source_cols],
+            target_families=[type_family(c["data_type"]) for c in target_cols],
+        )
+    else:
+        idx, scores = topk_cosine(src_vecs, tgt_vecs, top_k)
+
+    matches: List[Dict[str, Any]] = []
+
+    for i, src in enumerate(source_cols):
+        candidates = []
+        for j, score in zip(idx[i], scores[i]):
+            if j < 0 or not np.isfinite(score):
+                continue
+            tgt = target_cols[int(j)]
+            candidates.append(
+                {
+                    "target": tgt["column_id"],
+                    "score": float(score),
+                    "data_type": tgt["data_type"],
+                    "description": tgt["description"],
+                }
+            )
+
+        matches.append(
+            {
+                "source": src["column_id"],
+                "source_type": src["data_type"],
+                "best_match": candidates[0]["target"] if candidates else None,
+                "confidence": candidates[0]["score"] if candidates else 0.0,
+                "candidates": candidates,
+            }
+        )
+
+    return {
+        "method": "static_dense",
+        "match_count": len(matches),
+        "matches": matches,
+    }
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from schema_matching_toolkit.utils.identifier_tokenizer import split_identifier
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+from schema_matching_toolkit.utils.vector_search import normalize_rows
+
+
+DEFAULT_TEACHER = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@dataclass
+class StaticEmbeddingTable:
+    """
+    Distilled static token embeddings.
+
+    vocab          : sub-token -> row in `vectors`
+    vectors        : (V, dim) float32, one teacher embedding per sub-token
+    ngram_vectors  : (buckets, dim) float32, hashed char-trigram vectors used
+                     for out-of-vocabulary sub-tokens
+    """
+    vocab: Dict[str, int]
+    vectors: np.ndarray
+    ngram_vectors: np.ndarray
+    teacher_model: str = DEFAULT_TEACHER
+    oov_weight: float = 0.5
+
+    # lazily built by encode_static()
+    _combined: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _rows_for_text: Any = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+
+def text_tokens(text: str) -> List[str]:
+    """
+    'tbl_orders CustID integer' -> ['tbl', 'orders', 'cust', 'id', 'integer']
+    """
+    tokens: List[str] = []
+    for word in (text or "").split():
+        tokens.extend(split_identifier(word))
+    return tokens
+
+
+def _trigram_buckets(token: str, n_buckets: int) -> List[int]:
+    padded = f"<{token}>"
+    grams = [padded[i : i + 3] for i in range(max(1, len(padded) - 2))]
+    return [zlib.crc32(g.encode("utf-8")) % n_buckets for g in grams]
+
+
+def build_static_vocabulary(
+    schemas: Iterable[Dict[str, Any]],
+    descriptions: Optional[Iterable[Optional[Dict[str, Any]]]] = None,
+) -> List[str]:
+    """
+    Collects every identifier sub-token (and description word) in the schemas.
+    """
+    desc_list = list(descriptions) if descriptions is not None else []
+    vocab = set()
+
+    for i, schema in enumerate(schemas):
+        desc = desc_list[i] if i < len(desc_list) else None
+        for c in flatten_columns_with_desc(schema, desc):
+            vocab.update(text_tokens(c["text"]))
+
+    return sorted(vocab)
+
+
+def distill_static_table(
+    vocabulary: Iterable[str],
+    teacher_model: str = DEFAULT_TEACHER,
+    dim: Optional[int] = None,
+    n_buckets: int = 4096,
+    seed: int = 13,
+    batch_size: int = 512,
+) -> StaticEmbeddingTable:
+    """
+    Builds a static lookup table by running the teacher model ONCE per
+    sub-token (not per column). Matching afterwards is NumPy only.
+
+    dim < teacher dim -> PCA projection of the token vectors (faster matmul).
+    """
+    from schema_matching_toolkit.common.models import get_sentence_model
+
+    tokens = sorted({t.lower() for t in vocabulary if t})
+    teacher = get_sentence_model(teacher_model)
+
+    vectors = np.asarray(
+        teacher.encode(tokens, batch_size=batch_size, normalize_embeddings=True),
+        dtype=np.float32,
+    ).reshape(len(tokens), -1)
+
+    if dim is not None and dim < vectors.shape[1] and len(tokens) > dim:
+        centered = vectors - vectors.mean(axis=0, keepdims=True)
+        _, _, vt = np.linalg.svd(centered, full_matrices=False)
+        vectors = centered @ vt[:dim].T
+
+    vectors = normalize_rows(vectors)
+
+    rng = np.random.default_rng(seed)
+    ngram_vectors = rng.standard_normal((n_buckets, vectors.shape[1])).astype(np.float32)
+    ngram_vectors = normalize_rows(ngram_vectors)
+
+    return StaticEmbeddingTable(
+        vocab={t: i for i, t in enumerate(tokens)},
+        vectors=vectors,
+        ngram_vectors=ngram_vectors,
+        teacher_model=teacher_model,
+    )
+
+
+def save_static_table(table: StaticEmbeddingTable, path: str) -> str:
+    tokens = sorted(table.vocab, key=table.vocab.get)
+    np.savez(
+        path,
+        tokens=np.asarray(tokens, dtype=str),
+        vectors=table.vectors,
+        ngram_vectors=table.ngram_vectors,
+        teacher_model=np.asarray(table.teacher_model),
+        oov_weight=np.asarray(table.oov_weight, dtype=np.float32),
+    )
+    return path if path.endswith(".npz") else f"{path}.npz"
+
+
+def load_static_table(path: str) -> StaticEmbeddingTable:
+    with np.load(path, allow_pickle=False) as data:
+        tokens = [str(t) for t in data["tokens"]]
+        return StaticEmbeddingTable(
+            vocab={t: i for i, t in enumerate(tokens)},
+            vectors=np.asarray(data["vectors"], dtype=np.float32),
+            ngram_vectors=np.asarray(data["ngram_vectors"], dtype=np.float32),
+            teacher_model=str(data["teacher_model"]),
+            oov_weight=float(data["oov_weight"]),
+        )
+
+
+def _make_row_lookup(table: StaticEmbeddingTable):
+    n_vocab = len(table.vocab)
+    n_buckets = table.ngram_vectors.shape[0]
+
+    @lru_cache(maxsize=1 << 18)
+    def rows_for_text(text: str) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+        rows: List[int] = []
+        weights: List[float] = []
+
+        for tok in text_tokens(text):
+            idx = table.vocab.get(tok)
+            if idx is not None:
+                rows.append(idx)
+                weights.append(1.0)
+                continue
+
+            buckets = _trigram_buckets(tok, n_buckets)
+            w = table.oov_weight / len(buckets)
+            rows.extend(n_vocab + b for b in buckets)
+            weights.extend(w for _ in buckets)
+
+        return tuple(rows), tuple(weights)
+
+    return rows_for_text
+
+
+def encode_static(texts: List[str], table: StaticEmbeddingTable) -> np.ndarray:
+    """
+    Mean-pooled static embeddings, L2-normalized. (N, dim) float32.
+
+    Token -> row lookups are cached per unique text, pooling is one
+    vectorized reduceat over all texts.
+    """
+    if table._rows_for_text is None:
+        table._rows_for_text = _make_row_lookup(table)
+        table._combined = np.vstack([table.vectors, table.ngram_vectors])
+
+    lookup = table._rows_for_text
+    combined = table._combined
+    out = np.zeros((len(texts), table.dim), dtype=np.float32)
+
+    all_rows: List[int] = []
+    all_weights: List[float] = []
+    starts: List[int] = []
+    nonempty: List[int] = []
+    totals: List[float] = []
+
+    for i, text in enumerate(texts):
+        rows, weights = lookup(text)
+        if not rows:
+            continue
+        nonempty.append(i)
+        starts.append(len(all_rows))
+        totals.append(sum(weights))
+        all_rows.extend(rows)
+        all_weights.extend(weights)
+
+    if not nonempty:
+        return out
+
+    rows_arr = np.asarray(all_rows, dtype=np.int64)
+    weights_arr = np.asarray(all_weights, dtype=np.float32)
+
+    pooled = np.add.reduceat(combined[rows_arr] * weights_arr[:, None], np.asarray(starts), axis=0)
+    pooled /= np.asarray(totals, dtype=np.float32)[:, None]
+
+    out[np.asarray(nonempty)] = normalize_rows(pooled)
+    return out
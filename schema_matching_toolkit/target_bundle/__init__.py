@@ -0,0 +1,17 @@
+from .bundle import (
+    TargetBundle,
+    load_target_bundle,
+    prepare_target,
+    write_target_bundle,
+)
+from .backends import bundle_bm25_match, bundle_dense_match, import_bundle_to_qdrant
+
+__all__ = [
+    "TargetBundle",
+    "load_target_bundle",
+    "prepare_target",
+    "write_target_bundle",
+    "bundle_bm25_match",
+    "bundle_dense_match",
+    "import_bundle_to_qdrant",
+]
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import uuid
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import EncodingConfig, QdrantConfig
+from schema_matching_toolkit.sparse_bm25.bm25_matcher import bm25_tokens
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc, flatten_schema_columns
+from schema_matching_toolkit.utils.type_family import family_masks, type_family
+from schema_matching_toolkit.utils.vector_search import topk_cosine
+from schema_matching_toolkit.telemetry import traced
+
+from .bundle import TargetBundle
+
+
+# -------------------------
+# BM25 (in-process, from stored postings)
+# -------------------------
+@traced()
+def bundle_bm25_match(
+    source_schema: Dict[str, Any],
+    bundle: TargetBundle,
+    type_filter: bool = False,
+) -> Dict[str, Any]:
+    """
+    bm25_match() against the bundle's stored term statistics
+    (no corpus re-tokenization, no BM25Okapi rebuild). Queries use the
+    tokenizer recorded in the bundle (older bundles: whitespace).
+
+    Output: same shape as bm25_match() (Top-1 per source column)
+    """
+    source_cols = flatten_schema_columns(source_schema)
+    target_cols = bundle.columns
+
+    if not source_cols or not target_cols:
+        return {"method": "bm25", "top_k": 1, "matches": []}
+
+    bm25 = bundle.header["bm25"]
+    k1, b, avgdl = bm25["k1"], bm25["b"], bm25["avgdl"] or 1.0
+    tokenizer = bm25.get("tokenizer", "whitespace")
+    abbreviations = bm25.get("abbreviations")
+    term_index = {t: i for i, t in enumerate(bm25["vocab"])}
+
+    indptr = bundle.arrays["bm25_indptr"]
+    doc_ids = bundle.arrays["bm25_doc_ids"]
+    tf = bundle.arrays["bm25_tf"]
+    idf = bundle.arrays["bm25_idf"]
+    norm = k1 * (1.0 - b + b * np.asarray(bundle.arrays["bm25_doc_len"], dtype=np.float64) / avgdl)
+
+    # stored families -> no type classification of the target per query
+    masks = family_masks(families=[c["type_family"] for c in target_cols]) if type_filter else None
+    ids = [c["column_id"] for c in target_cols]
+
+    results = []
+
+    for src in source_cols:
+        scores = np.zeros(len(target_cols), dtype=np.float64)
+
+        for tok in bm25_tokens(src, tokenizer, abbreviations):
+            t = term_index.get(tok)
+            if t is None:
+                continue
+            lo, hi = indptr[t], indptr[t + 1]
+            docs = doc_ids[lo:hi]
+            f = tf[lo:hi]
+            scores[docs] += idf[t] * (f * (k1 + 1)) / (f + norm[docs])
+
+        if type_filter:
+            scores[~masks(src["data_type"])] = 0.0
+
+        # normalized 0..1 like bm25_match -> the top-1 is 1.0 (no match if nothing compatible overlaps)
+        best = int(np.argmax(scores))
+
+        results.append(
+            {
+                "source": src["id"],
+                "best_match": ids[best] if scores[best] > 0 else None,
+                "score": 1.0 if scores[best] > 0 else 0.0,
+            }
+        )
+
+    return {"method": "bm25", "top_k": 1, "matches": results}
+
+
+# -------------------------
+# Dense (in-process, from stored matrices)
+# -------------------------
+@traced()
+def bundle_dense_match(
+    source_schema: Dict[str, Any],
+    bundle: TargetBundle,
+    model_key: str = "minilm",
+    source_descriptions: Dict[str, Any] | None = None,
+    top_k: int = 5,
+    type_filter: bool = False,
+    encoding: Optional[EncodingConfig] = None,
+) -> Dict[str, Any]:
+    """
+    MiniLM / MPNet dense matching against the bundle's embedding matrix
+    (exact NumPy top-k, no Qdrant). Only the source side is encoded.
+
+    Output: same shape as match_source_to_target_dense(),
+            method = "<model_key>_dense_bundle"
+    """
+    from schema_matching_toolkit.common.embedding_service import embed_texts
+    from schema_matching_toolkit.common.models import get_sentence_model
+
+    if model_key == "minilm":
+        from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+    elif model_key == "mpnet":
+        from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME
+    else:
+        raise ValueError("model_key must be one of: minilm, mpnet")
+
+    method = f"{model_key}_dense_bundle"
+    target_vecs = bundle.vectors(model_key)
+    target_cols = bundle.columns
+
+    source_cols = flatten_columns_with_desc(source_schema, source_descriptions, text_mode=bundle.text_mode)
+    if not source_cols or not target_cols:
+        return {"method": method, "match_count": 0, "matches": []}
+
+    qvecs, encode_stats = embed_texts(get_sentence_model(MODEL_NAME), [c["text"] for c in source_cols], encoding)
+
+    if type_filter:
+        idx, scores = topk_cosine(
+            qvecs,
+            target_vecs,
+            top_k,
+            query_families=[type_family(c["data_type"]) for c in source_cols],
+            target_families=[c["type_family"] for c in target_cols],
+        )
+    else:
+        idx, scores = topk_cosine(qvecs, target_vecs, top_k)
+
+    matches: List[Dict[str, Any]] = []
+
+    for i, src in enumerate(source_cols):
+        candidates = []
+        for j, score in zip(idx[i], scores[i]):
+            if j < 0 or not np.isfinite(score):
+                continue
+            tgt = target_cols[int(j)]
+            candidates.append(
+                {
+                    "target": tgt["column_id"],
+                    "score": float(score),
+                    "data_type": tgt["data_type"],
+                    "description": tgt["description"],
+                }
+            )
+
+        matches.append(
+            {
+                "source": src["column_id"],
+                "source_type": src["data_type"],
+                "best_match": candidates[0]["target"] if candidates else None,
+                "confidence": candidates[0]["score"] if candidates else 0.0,
+                "candidates": candidates,
+            }
+        )
+
+    return {
+        "method": method,
+        "match_count": len(matches),
+        "encode_stats": encode_stats,
+        "matches": matches,
+    }
+
+
+# -------------------------
+# Qdrant re-import
+# -------------------------
+@traced()
+def import_bundle_to_qdrant(
+    bundle: TargetBundle,
+    qdrant_cfgs: Dict[str, QdrantConfig],
+    recreate: bool = True,
+    batch_size: int = 512,
+) -> Dict[str, Any]:
+    """
+    Loads the bundle's vectors into Qdrant without re-embedding.
+
+    Input:
+      qdrant_cfgs = {"minilm": QdrantConfig(...), "mpnet": QdrantConfig(...)}
+                    or {"hybrid": QdrantConfig(...)} -> one multi-vector collection
+
+    Output:
+      {"minilm": {"collection": "...", "indexed_points": N}, ...}
+    """
+    from qdrant_client.models import PointStruct
+
+    from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, recreate_vector_collection
+
+    cols = bundle.columns
+    out: Dict[str, Any] = {}
+
+    for key, cfg in qdrant_cfgs.items():
+        client = get_qdrant_client(cfg)
+
+        if key == "hybrid":
+            from schema_matching_toolkit.multivector_matcher.indexer import (
+                MINILM_VECTOR,
+                MPNET_VECTOR,
+                recreate_multivector_collection,
+            )
+
+            sources = {MINILM_VECTOR: bundle.vectors("minilm"), MPNET_VECTOR: bundle.vectors("mpnet")}
+            if recreate:
+                recreate_multivector_collection(client, cfg)
+        else:
+            sources = {cfg.vector_name: bundle.vectors(key)}
+            if recreate:
+                recreate_vector_collection(client, cfg)
+
+        for start in range(0, len(cols), batch_size):
+            end = min(start + batch_size, len(cols))
+            chunk = {name: np.asarray(vecs[start:end], dtype=np.float32) for name, vecs in sources.items()}
+
+            points = [
+                PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector={name: vecs[i - start].tolist() for name, vecs in chunk.items()},
+                    payload={
+                        "column_id": c["column_id"],
+                        "column_name": c["column_id"],
+                        "data_type": c["data_type"],
+                        "type_family": c["type_family"],
+                        "description": c["description"],
+                        "text": c["text"],
+                    },
+                )
+                for i, c in enumerate(cols[start:end], start=start)
+            ]
+
+            client.upsert(collection_name=cfg.collection_name, points=points)
+
+        out[key] = {"collection": cfg.collection_name, "indexed_points": len(cols)}
+
+    return out
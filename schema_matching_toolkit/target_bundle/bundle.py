@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import DBConfig, EncodingConfig, GroqConfig
+from schema_matching_toolkit.sparse_bm25.bm25_matcher import bm25_tokens
+from schema_matching_toolkit.utils.fingerprint import schema_fingerprint
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc, flatten_schema_columns
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.telemetry import traced
+
+
+BUNDLE_MAGIC = b"SMTBNDL1"
+BUNDLE_VERSION = 1
+BUNDLE_MODELS = ("minilm", "mpnet")
+
+_ALIGN = 64
+_PREFIX = struct.Struct("<8sQ")  # magic, header length
+
+# rank_bm25.BM25Okapi defaults (bm25_match uses them)
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_EPSILON = 0.25
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+@dataclass
+class TargetBundle:
+    """
+    Memory-mapped target catalog (see load_target_bundle).
+
+    header : JSON part (columns, descriptions, schema, bm25 vocabulary, ...)
+    arrays : name -> read-only np.memmap ("minilm", "mpnet", "bm25_*")
+    """
+    path: str
+    header: Dict[str, Any]
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @property
+    def fingerprint(self) -> str:
+        return self.header["fingerprint"]
+
+    @property
+    def text_mode(self) -> str:
+        return self.header.get("text_mode", "table")
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        return self.header["schema"]
+
+    @property
+    def descriptions(self) -> Optional[Dict[str, Any]]:
+        return self.header.get("descriptions")
+
+    @property
+    def columns(self) -> List[Dict[str, Any]]:
+        return self.header["columns"]
+
+    @property
+    def models(self) -> Dict[str, str]:
+        return self.header.get("models", {})
+
+    def vectors(self, key: str) -> np.ndarray:
+        if key not in self.arrays:
+            raise ValueError(f"Bundle has no '{key}' embeddings (has: {', '.join(self.models)})")
+        return self.arrays[key]
+
+
+# -------------------------
+# BM25 term statistics
+# -------------------------
+def _bm25_postings(corpus: List[List[str]]) -> Dict[str, Any]:
+    """
+    CSR postings + per-term idf, identical to rank_bm25.BM25Okapi.
+    """
+    n_docs = len(corpus)
+    postings: Dict[str, Dict[int, int]] = {}
+
+    for doc_id, tokens in enumerate(corpus):
+        for tok in tokens:
+            docs = postings.setdefault(tok, {})
+            docs[doc_id] = docs.get(doc_id, 0) + 1
+
+    vocab = sorted(postings)
+    indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+    doc_ids: List[int] = []
+    tfs: List[float] = []
+    idf = np.zeros(len(vocab), dtype=np.float64)
+
+    for i, term in enumerate(vocab):
+        docs = postings[term]
+        doc_ids.extend(docs.keys())
+        tfs.extend(docs.values())
+        indptr[i + 1] = len(doc_ids)
+
+        df = len(docs)
+        idf[i] = math.log(n_docs - df + 0.5) - math.log(df + 0.5)
+
+    if len(vocab):
+        eps = BM25_EPSILON * float(idf.mean())
+        idf[idf < 0] = eps
+
+    doc_len = np.asarray([len(d) for d in corpus], dtype=np.float32)
+
+    return {
+        "vocab": vocab,
+        "avgdl": float(doc_len.mean()) if n_docs else 0.0,
+        "arrays": {
+            "bm25_indptr": indptr,
+            "bm25_doc_ids": np.asarray(doc_ids, dtype=np.int32),
+            "bm25_tf": np.asarray(tfs, dtype=np.float32),
+            "bm25_idf": idf.astype(np.float32),
+            "bm25_doc_len": doc_len,
+        },
+    }
+
+
+# -------------------------
+# Write / load
+# -------------------------
+@traced()
+def write_target_bundle(
+    target_schema: Dict[str, Any],
+    bundle_path: str,
+    descriptions: Optional[Dict[str, Any]] = None,
+    models: Iterable[str] = BUNDLE_MODELS,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+    embed_descriptions: bool = False,
+    bm25_tokenizer: str = "identifier",
+    abbreviations: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Writes ONE versioned bundle file for a target:
+
+      [magic + header length][JSON header][pad][64-byte aligned float32/int arrays]
+
+      - column catalog (+ type family) and descriptions
+      - BM25 postings / idf / doc lengths (same tokens as bm25_match)
+      - MiniLM and/or MPNet embedding matrices (rows aligned with columns)
+
+    embed_descriptions = False -> vectors are built like the Qdrant indexers
+                                  (no descriptions in the embedded text)
+    bm25_tokenizer / abbreviations -> stored in the header so bundle_bm25_match()
+                                      tokenizes queries the same way
+
+    Output:
+      {"bundle": path, "fingerprint": "...", "columns": N, "bytes": ...}
+    """
+    from schema_matching_toolkit.common.embedding_service import embed_texts
+    from schema_matching_toolkit.common.models import get_sentence_model
+
+    models = list(models)
+    unknown = [m for m in models if m not in BUNDLE_MODELS]
+    if unknown:
+        raise ValueError(f"Unsupported bundle models: {unknown} (use {BUNDLE_MODELS})")
+
+    cols = flatten_columns_with_desc(
+        target_schema,
+        descriptions if embed_descriptions else None,
+        text_mode=text_mode,
+    )
+    desc_cols = {c["column_id"]: c["description"] for c in flatten_columns_with_desc(target_schema, descriptions)}
+
+    # BM25 corpus must line up with the dense rows
+    bm25_cols = flatten_schema_columns(target_schema)
+    if [c["id"] for c in bm25_cols] != [c["column_id"] for c in cols]:
+        raise ValueError("Target schema flattening mismatch between BM25 and dense catalogs")
+
+    bm25 = _bm25_postings([bm25_tokens(c, bm25_tokenizer, abbreviations) for c in bm25_cols])
+
+    arrays: Dict[str, np.ndarray] = dict(bm25["arrays"])
+    model_names: Dict[str, str] = {}
+    encode_stats: Dict[str, Any] = {}
+    texts = [c["text"] for c in cols]
+
+    if "minilm" in models:
+        from schema_matching_toolkit.minilm_dense_matcher.indexer import MODEL_NAME
+
+        arrays["minilm"], encode_stats["minilm"] = embed_texts(get_sentence_model(MODEL_NAME), texts, encoding)
+        model_names["minilm"] = MODEL_NAME
+
+    if "mpnet" in models:
+        from schema_matching_toolkit.mpnet_embedding_matcher.indexer import MODEL_NAME
+
+        arrays["mpnet"], encode_stats["mpnet"] = embed_texts(get_sentence_model(MODEL_NAME), texts, encoding)
+        model_names["mpnet"] = MODEL_NAME
+
+    fingerprint = schema_fingerprint(target_schema)
+
+    # array layout (offsets relative to the aligned data section)
+    layout: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        arrays[name] = arr
+        layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset = _aligned(offset + arr.nbytes)
+
+    header = {
+        "version": BUNDLE_VERSION,
+        "created_at": _now_utc_iso(),
+        "fingerprint": fingerprint,
+        "text_mode": text_mode,
+        "embed_descriptions": embed_descriptions,
+        "models": model_names,
+        "schema": target_schema,
+        "descriptions": descriptions,
+        "columns": [
+            {
+                "column_id": c["column_id"],
+                "data_type": c["data_type"],
+                "type_family": type_family(c["data_type"]),
+                "description": desc_cols.get(c["column_id"], ""),
+                "text": c["text"],
+            }
+            for c in cols
+        ],
+        "bm25": {
+            "k1": BM25_K1,
+            "b": BM25_B,
+            "avgdl": bm25["avgdl"],
+            "tokenizer": bm25_tokenizer,
+            "abbreviations": abbreviations,
+            "vocab": bm25["vocab"],
+        },
+        "arrays": layout,
+    }
+
+    header_bytes = json.dumps(header, ensure_ascii=False, default=str).encode("utf-8")
+    data_start = _aligned(_PREFIX.size + len(header_bytes))
+
+    tmp_path = f"{bundle_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(BUNDLE_MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - _PREFIX.size - len(header_bytes)))
+
+        for name, arr in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(arr.tobytes(order="C"))
+
+        f.truncate(data_start + offset)
+
+    # ✅ readers never see a half-written bundle
+    os.replace(tmp_path, bundle_path)
+
+    return {
+        "bundle": bundle_path,
+        "version": BUNDLE_VERSION,
+        "fingerprint": fingerprint,
+        "columns": len(cols),
+        "models": model_names,
+        "bytes": os.path.getsize(bundle_path),
+        "encode_stats": encode_stats,
+    }
+
+
+def load_target_bundle(bundle_path: str) -> TargetBundle:
+    """
+    Opens a bundle without recomputation: parses the JSON header and
+    memory-maps every array (read-only, paged in on first access).
+    """
+    with open(bundle_path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError(f"Not a target bundle: {bundle_path}")
+
+        magic, header_len = _PREFIX.unpack(prefix)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a target bundle: {bundle_path}")
+
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    if header.get("version") != BUNDLE_VERSION:
+        raise ValueError(
+            f"Unsupported bundle version {header.get('version')} (expected {BUNDLE_VERSION})"
+        )
+
+    data_start = _aligned(_PREFIX.size + header_len)
+    arrays: Dict[str, np.ndarray] = {}
+
+    for name, spec in header.get("arrays", {}).items():
+        shape = tuple(spec["shape"])
+        dtype = np.dtype(spec["dtype"])
+
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+            continue
+
+        arrays[name] = np.memmap(
+            bundle_path,
+            dtype=dtype,
+            mode="r",
+            offset=data_start + spec["offset"],
+            shape=shape,
+        )
+
+    return TargetBundle(path=bundle_path, header=header, arrays=arrays)
+
+
+@traced()
+def prepare_target(
+    tgt_cfg: DBConfig,
+    bundle_path: str,
+    groq_cfg: Optional[GroqConfig] = None,
+    models: Iterable[str] = BUNDLE_MODELS,
+    encoding: Optional[EncodingConfig] = None,
+    text_mode: str = "table",
+) -> Dict[str, Any]:
+    """
+    One-off target preparation: extract -> (Groq descriptions) -> BM25 stats
+    -> embeddings -> single bundle file.
+
+    Input:
+      tgt_cfg = DBConfig(...)
+      bundle_path = "./targets/gpc_public.smtb"
+      groq_cfg = GroqConfig(...) (optional, descriptions stored in the bundle)
+
+    Output:
+      same as write_target_bundle()
+    """
+    from schema_matching_toolkit.schema_extractor import extract_schema
+
+    target_schema = extract_schema(tgt_cfg)
+
+    descriptions = None
+    if groq_cfg is not None:
+        from schema_matching_toolkit.llm_description import describe_schema_with_groq
+
+        descriptions = describe_schema_with_groq(target_schema, groq_cfg)
+
+    return write_target_bundle(
+        target_schema=target_schema,
+        bundle_path=bundle_path,
+        descriptions=descriptions,
+        models=models,
+        encoding=encoding,
+        text_mode=text_mode,
+    )
@@ -0,0 +1,13 @@
+from .snapshot import (
+    export_target_snapshot,
+    load_snapshot_manifest,
+    restore_target_snapshot,
+    snapshot_matches,
+)
+
+__all__ = [
+    "export_target_snapshot",
+    "restore_target_snapshot",
+    "load_snapshot_manifest",
+    "snapshot_matches",
+]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+
+import numpy as np
+
+from schema_matching_toolkit.common.db_config import QdrantConfig
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, recreate_vector_collection
+from schema_matching_toolkit.telemetry import traced
+
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def load_snapshot_manifest(snapshot_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the snapshot manifest or None if the directory has no snapshot.
+    """
+    path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def snapshot_matches(
+    manifest: Optional[Dict[str, Any]],
+    fingerprint: str,
+    model_names: Dict[str, str],
+) -> bool:
+    """
+    True if a snapshot was built from the same target content and models.
+    """
+    if not manifest or manifest.get("version") != SNAPSHOT_VERSION:
+        return False
+
+    if manifest.get("fingerprint") != fingerprint:
+        return False
+
+    collections = manifest.get("collections", {})
+    for key, model in model_names.items():
+        if key not in collections or collections[key].get("model_name") != model:
+            return False
+
+    return True
+
+
+@traced()
+def export_target_snapshot(
+    snapshot_dir: str,
+    qdrant_cfgs: Dict[str, QdrantConfig],
+    fingerprint: str,
+    model_names: Dict[str, str],
+    batch_size: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Dumps prepared target collections (vectors + payloads) to local files.
+
+    Input:
+      snapshot_dir = folder to write into
+      qdrant_cfgs  = {"minilm": QdrantConfig(...), "mpnet": QdrantConfig(...)}
+      fingerprint  = schema_fingerprint(target_schema, target_descriptions)
+      model_names  = {"minilm": "sentence-transformers/...", "mpnet": "..."}
+
+    Files:
+      manifest.json
+      <key>.vectors.npy       float32 (N x dim)
+      <key>.points.jsonl      {"id": ..., "payload": {...}} per line
+
+    Output:
+      manifest dict
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    collections: Dict[str, Any] = {}
+
+    for key, cfg in qdrant_cfgs.items():
+        client = get_qdrant_client(cfg)
+
+        ids: List[Any] = []
+        payloads: List[Dict[str, Any]] = []
+        vectors: List[List[float]] = []
+
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=cfg.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=[cfg.vector_name],
+            )
+
+            for p in points:
+                vec = p.vector.get(cfg.vector_name) if isinstance(p.vector, dict) else p.vector
+                ids.append(p.id)
+                payloads.append(p.payload or {})
+                vectors.append(vec)
+
+            if offset is None:
+                break
+
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), cfg.vector_size)
+
+        vectors_file = f"{key}.vectors.npy"
+        points_file = f"{key}.points.jsonl"
+
+        np.save(os.path.join(snapshot_dir, vectors_file), matrix)
+        with open(os.path.join(snapshot_dir, points_file), "w", encoding="utf-8") as f:
+            for pid, payload in zip(ids, payloads):
+                f.write(json.dumps({"id": pid, "payload": payload}, ensure_ascii=False) + "\n")
+
+        collections[key] = {
+            "model_name": model_names.get(key),
+            "collection_name": cfg.collection_name,
+            "vector_name": cfg.vector_name,
+            "vector_size": cfg.vector_size,
+            "point_count": len(ids),
+            "vectors_file": vectors_file,
+            "points_file": points_file,
+        }
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": _now_utc_iso(),
+        "fingerprint": fingerprint,
+        "collections": collections,
+    }
+
+    with open(os.path.join(snapshot_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest
+
+
+@traced()
+def restore_target_snapshot(
+    snapshot_dir: str,
+    qdrant_cfgs: Dict[str, QdrantConfig],
+    fingerprint: Optional[str] = None,
+    batch_size: int = 512,
+    recreate: bool = True,
+) -> Dict[str, Any]:
+    """
+    Recreates collections from a snapshot (no model inference).
+
+    Works against any Qdrant server or embedded mode, collection names are
+    taken from qdrant_cfgs (not from the snapshot), so a snapshot can be
+    restored under different names.
+
+    fingerprint given -> ValueError if the snapshot was built from a different target.
+    recreate=False   -> upsert into already created (empty) collections.
+
+    Output:
+      {"fingerprint": "...", "collections": {"minilm": {"collection": "...", "indexed_points": N}}}
+    """
+    from qdrant_client.models import PointStruct
+
+    manifest = load_snapshot_manifest(snapshot_dir)
+    if manifest is None:
+        raise ValueError(f"No snapshot found in: {snapshot_dir}")
+
+    if fingerprint is not None and manifest.get("fingerprint") != fingerprint:
+        raise ValueError("Snapshot fingerprint does not match target schema")
+
+    restored: Dict[str, Any] = {}
+
+    for key, cfg in qdrant_cfgs.items():
+        meta = manifest.get("collections", {}).get(key)
+        if meta is None:
+            raise ValueError(f"Snapshot has no collection for: {key}")
+
+        if int(meta["vector_size"]) != int(cfg.vector_size):
+            raise ValueError(
+                f"Vector size mismatch for {key}: snapshot={meta['vector_size']} cfg={cfg.vector_size}"
+            )
+
+        matrix = np.load(os.path.join(snapshot_dir, meta["vectors_file"]), mmap_mode="r")
+
+        with open(os.path.join(snapshot_dir, meta["points_file"]), "r", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+        client = get_qdrant_client(cfg)
+        if recreate:
+            recreate_vector_collection(client, cfg)
+
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start : start + batch_size]
+            points = [
+                PointStruct(
+                    id=r["id"],
+                    vector={cfg.vector_name: matrix[start + i].tolist()},
+                    payload=r["payload"],
+                )
+                for i, r in enumerate(chunk)
+            ]
+            client.upsert(collection_name=cfg.collection_name, points=points)
+
+        restored[key] = {"collection": cfg.collection_name, "indexed_points": len(rows)}
+
+    return {"fingerprint": manifest.get("fingerprint"), "collections": restored}
@@ -0,0 +1,38 @@
+from .exporters import InMemoryExporter, JsonlExporter, OpenTelemetryExporter, TelemetryExporter
+from .tracer import (
+    configure_telemetry,
+    counter,
+    current_span,
+    disable_telemetry,
+    flush_telemetry,
+    get_exporters,
+    histogram,
+    record_span,
+    reset_telemetry,
+    span,
+    telemetry_enabled,
+    telemetry_snapshot,
+    timer,
+    traced,
+)
+
+__all__ = [
+    "TelemetryExporter",
+    "InMemoryExporter",
+    "JsonlExporter",
+    "OpenTelemetryExporter",
+    "configure_telemetry",
+    "disable_telemetry",
+    "telemetry_enabled",
+    "get_exporters",
+    "span",
+    "current_span",
+    "record_span",
+    "traced",
+    "timer",
+    "counter",
+    "histogram",
+    "telemetry_snapshot",
+    "flush_telemetry",
+    "reset_telemetry",
+]
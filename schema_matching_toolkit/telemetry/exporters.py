@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class TelemetryExporter:
+    """
+    Exporter hooks (all optional). Called synchronously from the
+    instrumented thread, so implementations must be cheap + thread-safe.
+    """
+
+    def on_span_start(self, span) -> None:
+        pass
+
+    def on_span_end(self, span) -> None:
+        pass
+
+    def on_metric(self, kind: str, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def on_flush(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# -------------------------
+# In-memory
+# -------------------------
+class InMemoryExporter(TelemetryExporter):
+    """
+    Keeps finished span records (bounded) + the last flushed metric snapshot.
+    """
+
+    def __init__(self, max_spans: int = 100_000):
+        self._spans: deque = deque(maxlen=max_spans)
+        self.metrics: Optional[Dict[str, Any]] = None
+
+    def on_span_end(self, span) -> None:
+        self._spans.append(span.to_record())
+
+    def on_flush(self, snapshot: Dict[str, Any]) -> None:
+        self.metrics = snapshot
+
+    def spans(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        records = list(self._spans)
+        return records if name is None else [r for r in records if r["name"] == name]
+
+    def span_summary(self) -> List[Dict[str, Any]]:
+        """
+        Where did the time go?
+
+        Output (sorted by total time):
+          [{"name": "profile_schema.table", "count": 40, "errors": 0,
+            "total_seconds": 812.4, "max_seconds": 95.1}, ...]
+        """
+        agg: Dict[str, Dict[str, Any]] = {}
+        for r in list(self._spans):
+            a = agg.setdefault(
+                r["name"],
+                {"name": r["name"], "count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+            )
+            a["count"] += 1
+            a["errors"] += r["status"] == "error"
+            a["total_seconds"] += r["duration_seconds"]
+            a["max_seconds"] = max(a["max_seconds"], r["duration_seconds"])
+
+        out = sorted(agg.values(), key=lambda a: -a["total_seconds"])
+        for a in out:
+            a["total_seconds"] = round(a["total_seconds"], 6)
+        return out
+
+    def clear(self) -> None:
+        self._spans.clear()
+        self.metrics = None
+
+
+# -------------------------
+# JSON lines
+# -------------------------
+class JsonlExporter(TelemetryExporter):
+    """
+    Appends one JSON object per finished span, plus one
+    {"type": "metrics", ...} line per flush (individual metric events are
+    aggregated, not written).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def on_span_end(self, span) -> None:
+        self._write(span.to_record())
+
+    def on_flush(self, snapshot: Dict[str, Any]) -> None:
+        self._write({"type": "metrics", **snapshot})
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+# -------------------------
+# OpenTelemetry bridge
+# -------------------------
+def _otel_value(v: Any) -> Any:
+    return v if isinstance(v, (str, bool, int, float)) else str(v)
+
+
+class OpenTelemetryExporter(TelemetryExporter):
+    """
+    Mirrors spans and metrics into OpenTelemetry (opentelemetry-api,
+    imported lazily). Uses the global tracer / meter providers unless
+    explicit ones are passed; configure the SDK + exporter (OTLP, ...) in
+    the application.
+    """
+
+    def __init__(
+        self,
+        service_name: str = "schema_matching_toolkit",
+        tracer_provider=None,
+        meter_provider=None,
+    ):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ValueError(
+                "OpenTelemetry export needs the 'opentelemetry-api' package "
+                "(pip install opentelemetry-api opentelemetry-sdk)"
+            ) from e
+
+        self._trace = trace
+        self._tracer = (tracer_provider or trace.get_tracer_provider()).get_tracer(service_name)
+        self._meter = (meter_provider or metrics.get_meter_provider()).get_meter(service_name)
+
+        self._lock = threading.Lock()
+        self._live: Dict[str, Any] = {}
+        self._instruments: Dict[Any, Any] = {}
+
+    def on_span_start(self, span) -> None:
+        with self._lock:
+            parent = self._live.get(span.parent_id) if span.parent_id else None
+
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=span.start_ns,
+            attributes={k: _otel_value(v) for k, v in span.attributes.items()},
+        )
+
+        with self._lock:
+            self._live[span.span_id] = otel_span
+
+    def on_span_end(self, span) -> None:
+        from opentelemetry.trace import Status, StatusCode
+
+        with self._lock:
+            otel_span = self._live.pop(span.span_id, None)
+        if otel_span is None:
+            return
+
+        for k, v in span.attributes.items():
+            otel_span.set_attribute(k, _otel_value(v))
+        if span.status == "error":
+            otel_span.set_status(Status(StatusCode.ERROR, span.error))
+
+        otel_span.end(end_time=span.end_ns)
+
+    def on_metric(self, kind: str, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        key = (kind, name)
+        instrument = self._instruments.get(key)
+
+        if instrument is None:
+            with self._lock:
+                instrument = self._instruments.get(key)
+                if instrument is None:
+                    create = self._meter.create_counter if kind == "counter" else self._meter.create_histogram
+                    instrument = self._instruments[key] = create(name)
+
+        attrs = {k: _otel_value(v) for k, v in attributes.items()}
+        if kind == "counter":
+            instrument.add(value, attrs)
+        else:
+            instrument.record(value, attrs)
@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from schema_matching_toolkit.common.db_config import TelemetryConfig
+
+
+# upper bounds (seconds / sizes); the last bucket is +inf
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0, 300.0)
+
+# -------------------------
+# Global state (read without locks on the hot path)
+# -------------------------
+_ENABLED = False
+_EXPORTERS: Tuple[Any, ...] = ()
+_STATE_LOCK = threading.Lock()
+_CURRENT: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("smt_span", default=None)
+
+
+def _attrs_key(attributes: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in attributes.items()))
+
+
+# -------------------------
+# Spans
+# -------------------------
+class Span:
+    """
+    One timed unit of work. Use via span(...) as a context manager:
+
+      with span("profile_schema.table", table="orders") as sp:
+          ...
+          sp.set_attribute("columns", 12)
+
+    Nesting follows contextvars (threads started through StageGraph and
+    asyncio tasks inherit the current span as parent).
+    """
+
+    __slots__ = (
+        "name", "attributes", "trace_id", "span_id", "parent_id",
+        "start_ns", "end_ns", "status", "error", "thread", "_t0", "_token",
+    )
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.end_ns: Optional[int] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    @property
+    def duration_seconds(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def _open(self, start_ns: Optional[int] = None) -> None:
+        parent = _CURRENT.get()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.thread = f"{os.getpid()}/{threading.current_thread().name}"
+
+        for exp in _EXPORTERS:
+            exp.on_span_start(self)
+
+    def _close(self) -> None:
+        histogram("span.seconds", self.duration_seconds, span=self.name)
+        for exp in _EXPORTERS:
+            exp.on_span_end(self)
+
+    def __enter__(self) -> "Span":
+        self._open()
+        self._t0 = time.perf_counter()
+        self._token = _CURRENT.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # monotonic duration, wall-clock start
+        self.end_ns = self.start_ns + int((time.perf_counter() - self._t0) * 1e9)
+        if exc_type is not None:
+            self.status = "error"
+            self.error = f"{exc_type.__name__}: {exc}"
+
+        try:
+            _CURRENT.reset(self._token)
+        except ValueError:
+            # exited in another context (e.g. generator closed elsewhere)
+            _CURRENT.set(None)
+
+        self._close()
+        return False
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "type": "span",
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_ns / 1e9,
+            "duration_seconds": round(self.duration_seconds, 6),
+            "status": self.status,
+            "error": self.error,
+            "thread": self.thread,
+            "attributes": dict(self.attributes),
+        }
+
+
+class _NoopSpan:
+    """Shared do-nothing span returned while telemetry is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attributes: Any):
+    """
+    Context manager timing a block. Disabled -> a shared no-op object
+    (one global check, no allocation).
+    """
+    if not _ENABLED:
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+
+def current_span():
+    return _CURRENT.get() or _NOOP_SPAN
+
+
+def record_span(name: str, start_time: float, end_time: float, **attributes: Any) -> None:
+    """
+    Emits an already finished span (wall-clock seconds) under the current
+    span, e.g. work timed inside a process pool.
+    """
+    if not _ENABLED:
+        return
+
+    sp = Span(name, attributes)
+    sp._open(start_ns=int(start_time * 1e9))
+    sp.end_ns = int(end_time * 1e9)
+    sp._close()
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator: runs the function (sync or async) inside span(name or __name__).
+    Disabled -> one flag check per call.
+    """
+
+    def decorator(fn: Callable):
+        span_name = name or fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _ENABLED:
+                    return await fn(*args, **kwargs)
+                with Span(span_name, {}):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return fn(*args, **kwargs)
+            with Span(span_name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# -------------------------
+# Metrics
+# -------------------------
+class _Metrics:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.counters: Dict[Tuple, float] = {}
+        self.histograms: Dict[Tuple, List[float]] = {}
+
+    def add(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        key = (name, _attrs_key(attributes))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, attributes: Dict[str, Any]) -> None:
+        key = (name, _attrs_key(attributes))
+        slot = next((i for i, b in enumerate(self.buckets) if value <= b), len(self.buckets))
+
+        with self.lock:
+            h = self.histograms.get(key)
+            if h is None:
+                # [count, sum, min, max, *bucket_counts]
+                h = self.histograms[key] = [0, 0.0, value, value] + [0] * (len(self.buckets) + 1)
+            h[0] += 1
+            h[1] += value
+            h[2] = min(h[2], value)
+            h[3] = max(h[3], value)
+            h[4 + slot] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {k: list(v) for k, v in self.histograms.items()}
+
+        bounds = [str(b) for b in self.buckets] + ["inf"]
+        return {
+            "counters": [
+                {"name": name, "attributes": dict(attrs), "value": value}
+                for (name, attrs), value in sorted(counters.items())
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "attributes": dict(attrs),
+                    "count": h[0],
+                    "sum": round(h[1], 6),
+                    "min": round(h[2], 6),
+                    "max": round(h[3], 6),
+                    "mean": round(h[1] / h[0], 6),
+                    "buckets": dict(zip(bounds, h[4:])),
+                }
+                for (name, attrs), h in sorted(histograms.items())
+            ],
+        }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+_METRICS = _Metrics()
+
+
+def counter(name: str, value: float = 1, **attributes: Any) -> None:
+    """Adds `value` to a monotonically increasing counter (no-op when disabled)."""
+    if not _ENABLED:
+        return
+    _METRICS.add(name, value, attributes)
+    for exp in _EXPORTERS:
+        exp.on_metric("counter", name, value, attributes)
+
+
+def histogram(name: str, value: float, **attributes: Any) -> None:
+    """Records one observation (seconds, sizes, ...) (no-op when disabled)."""
+    if not _ENABLED:
+        return
+    _METRICS.observe(name, value, attributes)
+    for exp in _EXPORTERS:
+        exp.on_metric("histogram", name, value, attributes)
+
+
+class _Timer:
+    __slots__ = ("name", "attributes", "_t0")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> "_Timer":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        histogram(self.name, time.perf_counter() - self._t0, **self.attributes)
+        return False
+
+
+def timer(name: str, **attributes: Any):
+    """
+    Context manager recording the block's seconds into histogram `name`.
+    Cheaper than a span for per-item inner loops (no span record emitted).
+    """
+    if not _ENABLED:
+        return _NOOP_SPAN
+    return _Timer(name, attributes)
+
+
+# -------------------------
+# Configuration
+# -------------------------
+def configure_telemetry(
+    cfg: Optional[TelemetryConfig] = None,
+    exporters: Optional[List[Any]] = None,
+) -> List[Any]:
+    """
+    Enables (or disables) instrumentation process-wide.
+
+    Input:
+      cfg       = TelemetryConfig(...) (default: enabled, in-memory only)
+      exporters = extra TelemetryExporter instances
+
+    Output:
+      the active exporters (e.g. [InMemoryExporter, JsonlExporter])
+
+    Previously configured exporters are flushed and closed; metrics keep
+    accumulating until reset_telemetry().
+    """
+    global _ENABLED, _EXPORTERS
+    from .exporters import InMemoryExporter, JsonlExporter, OpenTelemetryExporter
+
+    cfg = cfg or TelemetryConfig()
+
+    active: List[Any] = []
+    if cfg.enabled:
+        if cfg.in_memory:
+            active.append(InMemoryExporter(max_spans=cfg.max_spans))
+        if cfg.jsonl_path:
+            active.append(JsonlExporter(cfg.jsonl_path))
+        if cfg.opentelemetry:
+            active.append(OpenTelemetryExporter(service_name=cfg.service_name))
+        active.extend(exporters or [])
+
+    with _STATE_LOCK:
+        previous = _EXPORTERS
+        _ENABLED = False
+        _EXPORTERS = tuple(active)
+        _ENABLED = cfg.enabled
+
+    _flush_and_close(previous)
+    return active
+
+
+def disable_telemetry() -> None:
+    configure_telemetry(TelemetryConfig(enabled=False))
+
+
+def telemetry_enabled() -> bool:
+    return _ENABLED
+
+
+def get_exporters() -> List[Any]:
+    return list(_EXPORTERS)
+
+
+def telemetry_snapshot() -> Dict[str, Any]:
+    """
+    Output:
+      {
+        "enabled": True,
+        "counters":   [{"name": "encode.texts", "attributes": {...}, "value": 1200}, ...],
+        "histograms": [{"name": "span.seconds", "attributes": {"span": "profile_schema.table"},
+                        "count": 40, "sum": 812.4, "min": ..., "max": ..., "mean": ...,
+                        "buckets": {"0.001": 0, ..., "inf": 2}}, ...]
+      }
+    """
+    return {"enabled": _ENABLED, **_METRICS.snapshot()}
+
+
+def flush_telemetry() -> Dict[str, Any]:
+    """Pushes the current metric snapshot to every exporter (and returns it)."""
+    snapshot = telemetry_snapshot()
+    for exp in _EXPORTERS:
+        exp.on_flush(snapshot)
+    return snapshot
+
+
+def reset_telemetry() -> None:
+    _METRICS.reset()
+
+
+def _flush_and_close(exporters: Tuple[Any, ...]) -> None:
+    if not exporters:
+        return
+    snapshot = telemetry_snapshot()
+    for exp in exporters:
+        exp.on_flush(snapshot)
+        exp.close()
+
+
+def _disable_in_child() -> None:
+    # forked workers (process-pool stages) must not write to the parent's exporters
+    global _ENABLED, _EXPORTERS
+    _ENABLED = False
+    _EXPORTERS = ()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_disable_in_child)
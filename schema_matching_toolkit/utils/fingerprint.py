@@ -0,0 +1,51 @@
+import hashlib
+import json
+from typing import Dict, Any, Optional
+
+
+def schema_fingerprint(
+    schema: Dict[str, Any],
+    descriptions: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Stable content hash of a schema (+ optional descriptions).
+
+    Only what ends up in the embedded text matters:
+      table name, column name, data type, column description.
+    Table / column order does not change the fingerprint.
+    """
+    desc_map = {}
+    for c in (descriptions or {}).get("columns", []) or []:
+        if isinstance(c, dict) and c.get("column_id"):
+            desc_map[c["column_id"]] = c.get("description") or ""
+
+    rows = []
+    for t in schema.get("tables", []):
+        table_name = t.get("table_name") or t.get("table") or t.get("name")
+        if not table_name:
+            continue
+
+        for c in t.get("columns", []):
+            col_name = c.get("column_name") or c.get("column") or c.get("name")
+            if not col_name:
+                continue
+
+            col_id = f"{table_name}.{col_name}"
+            dtype = c.get("data_type") or c.get("type") or ""
+            rows.append([col_id, str(dtype), desc_map.get(col_id, "")])
+
+    rows.sort()
+    raw = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def column_signature(column_id: str, data_type: str = "") -> str:
+    """
+    Stable id of a source column across runs: "table.column" (case-insensitive)
+    + type family, so varchar(50) -> varchar(100) keeps the same signature.
+    """
+    from schema_matching_toolkit.utils.type_family import type_family
+
+    raw = f"{column_id.strip().lower()}|{type_family(data_type or '')}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
@@ -0,0 +1,183 @@
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_ABBREVIATIONS: Dict[str, str] = {
+    "cust": "customer",
+    "emp": "employee",
+    "dept": "department",
+    "addr": "address",
+    "amt": "amount",
+    "qty": "quantity",
+    "num": "number",
+    "no": "number",
+    "nbr": "number",
+    "dt": "date",
+    "desc": "description",
+    "cd": "code",
+    "ts": "timestamp",
+    "pct": "percent",
+    "org": "organization",
+    "acct": "account",
+    "txn": "transaction",
+    "identifier": "id",
+}
+
+# camelCase / PascalCase / acronym boundaries: "CustID" -> "Cust ID", "HTTPCode" -> "HTTP Code"
+_CAMEL_1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_2 = re.compile(r"([a-z0-9])([A-Z])")
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+_ALPHA_DIGIT = re.compile(r"[a-z]+|[0-9]+")
+
+_END = ""  # trie terminal marker
+
+
+def split_identifier(name: str) -> List[str]:
+    """
+    'CustID'      -> ['cust', 'id']
+    'cust_id'     -> ['cust', 'id']
+    'order-Date2' -> ['order', 'date2']
+    """
+    s = _CAMEL_1.sub(r"\1 \2", name or "")
+    s = _CAMEL_2.sub(r"\1 \2", s)
+    return [p.lower() for p in _NON_ALNUM.split(s) if p]
+
+
+def _compile_trie(words: Iterable[str]) -> Dict[str, dict]:
+    root: Dict[str, dict] = {}
+    for w in words:
+        node = root
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[_END] = {}
+    return root
+
+
+class IdentifierTokenizer:
+    """
+    Identifier -> normalized token stream (shared by BM25 and exact-name keys).
+
+      1) snake_case / kebab / camelCase / PascalCase splitting
+      2) letters and digits split apart: "evt01" -> "evt", "01"
+      3) abbreviation expansion: "amt" -> "amount"
+      4) run-together tokens ("custnm") are segmented with a trie compiled
+         from the dictionary (abbreviations + their expansions + vocabulary)
+         and expanded piece by piece, only if the WHOLE token is covered
+
+    Results are cached per unique identifier (lru_cache), so schemas with
+    many repeated names (id, created_at, ...) tokenize each name once.
+    """
+
+    def __init__(
+        self,
+        abbreviations: Optional[Dict[str, str]] = None,
+        vocabulary: Iterable[str] = (),
+        min_piece: int = 2,
+        cache_size: int = 1 << 18,
+    ):
+        abbr = DEFAULT_ABBREVIATIONS if abbreviations is None else abbreviations
+        self.abbreviations = {k.lower(): v.lower() for k, v in abbr.items()}
+        self.min_piece = min_piece
+
+        words = set(self.abbreviations)
+        for v in self.abbreviations.values():
+            words.update(_ALPHA_DIGIT.findall(v))
+        words.update(w.lower() for w in vocabulary)
+
+        self._known = frozenset(words)
+        self._trie = _compile_trie(w for w in words if len(w) >= min_piece)
+        self._tokenize = lru_cache(maxsize=cache_size)(self._tokenize_uncached)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def tokenize(self, identifier: str) -> Tuple[str, ...]:
+        """
+        'cmp_evt_id' -> ('cmp', 'evt', 'id')
+        'CustAmt2'   -> ('customer', 'amount', '2')
+        'custnm'     -> ('customer', 'nm')        only if 'nm' is known, else ('custnm',)
+        """
+        return self._tokenize(identifier or "")
+
+    def tokenize_text(self, text: str) -> List[str]:
+        """
+        Whitespace-separated identifiers ("table column dtype") -> one token list.
+        """
+        out: List[str] = []
+        for part in (text or "").split():
+            out.extend(self._tokenize(part))
+        return out
+
+    def cache_info(self):
+        return self._tokenize.cache_info()
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _expand(self, piece: str) -> Sequence[str]:
+        full = self.abbreviations.get(piece)
+        return _ALPHA_DIGIT.findall(full) if full else (piece,)
+
+    def _segment(self, token: str) -> Optional[List[str]]:
+        """
+        Fewest-pieces segmentation of `token` into trie words (None if not
+        fully covered). DP over trie matches from each reachable position.
+        """
+        n = len(token)
+        best: List[Optional[List[str]]] = [None] * (n + 1)
+        best[0] = []
+
+        for i in range(n):
+            if best[i] is None:
+                continue
+            node = self._trie
+            for j in range(i, n):
+                node = node.get(token[j])
+                if node is None:
+                    break
+                if _END in node:
+                    cand = best[i] + [token[i : j + 1]]
+                    if best[j + 1] is None or len(cand) < len(best[j + 1]):
+                        best[j + 1] = cand
+
+        return best[n]
+
+    def _tokenize_uncached(self, identifier: str) -> Tuple[str, ...]:
+        tokens: List[str] = []
+        for part in split_identifier(identifier):
+            for piece in _ALPHA_DIGIT.findall(part):
+                if piece in self.abbreviations or piece in self._known or piece.isdigit():
+                    tokens.extend(self._expand(piece))
+                    continue
+
+                pieces = self._segment(piece) if len(piece) > self.min_piece else None
+                if pieces and len(pieces) > 1:
+                    for p in pieces:
+                        tokens.extend(self._expand(p))
+                else:
+                    tokens.append(piece)
+
+        return tuple(tokens)
+
+
+# -------------------------
+# Shared tokenizers
+# -------------------------
+_TOKENIZERS: Dict[Tuple, IdentifierTokenizer] = {}
+_TOKENIZERS_LOCK = threading.Lock()
+
+
+def get_identifier_tokenizer(abbreviations: Optional[Dict[str, str]] = None) -> IdentifierTokenizer:
+    """
+    One compiled tokenizer (and cache) per abbreviation dictionary.
+    """
+    key = None if abbreviations is None else tuple(sorted(abbreviations.items()))
+
+    with _TOKENIZERS_LOCK:
+        tok = _TOKENIZERS.get(key)
+        if tok is None:
+            tok = IdentifierTokenizer(abbreviations)
+            _TOKENIZERS[key] = tok
+        return tok
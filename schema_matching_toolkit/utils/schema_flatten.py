@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 
 
 def flatten_schema_columns(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -42,3 +42,99 @@ def flatten_schema_columns(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
             )
 
     return cols
+
+
+def drop_schema_columns(schema: Dict[str, Any], column_ids: Set[str]) -> Dict[str, Any]:
+    """
+    Returns a shallow copy of schema without the given "table.column" ids.
+    Tables left with no columns are removed.
+    """
+    if not column_ids:
+        return schema
+
+    tables_out = []
+    for t in schema.get("tables", []):
+        table_name = t.get("table_name") or t.get("table") or t.get("name")
+
+        cols = [
+            c
+            for c in t.get("columns", [])
+            if f"{table_name}.{c.get('column_name') or c.get('column') or c.get('name')}" not in column_ids
+        ]
+
+        if cols:
+            tables_out.append({**t, "columns": cols})
+
+    out = dict(schema)
+    out["tables"] = tables_out
+    out["table_count"] = len(tables_out)
+    return out
+
+
+TEXT_MODES = ("table", "column")
+
+
+def flatten_columns_with_desc(
+    schema: Dict[str, Any],
+    descriptions: Dict[str, Any] | None = None,
+    text_mode: str = "table",
+) -> List[Dict[str, Any]]:
+    """
+    Same rows as the dense matchers embed:
+    [
+      {
+        "column_id": "table.col",
+        "data_type": "integer",
+        "description": "...",
+        "text": "table col datatype description"
+      }
+    ]
+    Descriptions are looked up through a dict (one pass over descriptions).
+
+    text_mode = "table"  -> "table col datatype description" (default)
+    text_mode = "column" -> "col datatype description"; repeated columns like
+                            created_at / tenant_id in many tables then share one
+                            text (and one embedding, see embed_texts dedupe)
+    """
+    if text_mode not in TEXT_MODES:
+        raise ValueError(f"text_mode must be one of: {', '.join(TEXT_MODES)}")
+
+    desc_map: Dict[str, str] = {}
+    desc_cols = (descriptions or {}).get("columns", [])
+    if isinstance(desc_cols, list):
+        for c in desc_cols:
+            if isinstance(c, dict) and c.get("column_id") and c["column_id"] not in desc_map:
+                desc_map[c["column_id"]] = c.get("description") or ""
+
+    cols: List[Dict[str, Any]] = []
+
+    for t in schema.get("tables", []):
+        table_name = t.get("table_name") or t.get("table") or t.get("name")
+        if not table_name:
+            continue
+
+        for c in t.get("columns", []):
+            col_name = c.get("column_name") or c.get("column") or c.get("name")
+            dtype = c.get("data_type") or ""
+
+            if not col_name:
+                continue
+
+            col_id = f"{table_name}.{col_name}"
+            desc = desc_map.get(col_id, "")
+
+            if text_mode == "column":
+                text = f"{col_name} {dtype} {desc}".strip()
+            else:
+                text = f"{table_name} {col_name} {dtype} {desc}".strip()
+
+            cols.append(
+                {
+                    "column_id": col_id,
+                    "data_type": dtype,
+                    "description": desc,
+                    "text": text,
+                }
+            )
+
+    return cols
@@ -0,0 +1,144 @@
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# canonical families shared by all matchers
+NUMERIC = "numeric"
+TEXT = "text"
+DATETIME = "datetime"
+BOOLEAN = "boolean"
+BINARY = "binary"
+UNKNOWN = "unknown"
+
+TYPE_FAMILIES = [NUMERIC, TEXT, DATETIME, BOOLEAN, BINARY]
+
+
+# order matters: first match wins
+# (e.g. "timestamp" must be checked before anything containing "time",
+#  "bit" before numeric so mssql BIT becomes boolean)
+_FAMILY_PATTERNS: List[tuple] = [
+    (BOOLEAN, re.compile(r"^(bool|boolean|bit)$")),
+    (BINARY, re.compile(r"^(bytea|blob|tinyblob|mediumblob|longblob|binary|varbinary|raw|long raw|image|bfile)$")),
+    (DATETIME, re.compile(r"^(date|datetime|datetime2|smalldatetime|datetimeoffset|time|timetz|timestamp|timestamptz|interval|year)\b")),
+    (NUMERIC, re.compile(
+        r"^(int|integer|int2|int4|int8|tinyint|smallint|mediumint|bigint|serial|bigserial|smallserial"
+        r"|numeric|decimal|number|dec|float|float4|float8|double|double precision|real"
+        r"|money|smallmoney|binary_float|binary_double)\b"
+    )),
+    (TEXT, re.compile(
+        r"^(char|character|varchar|character varying|nchar|nvarchar|varchar2|nvarchar2|text|tinytext"
+        r"|mediumtext|longtext|ntext|clob|nclob|string|citext|uuid|uniqueidentifier|json|jsonb|xml"
+        r"|enum|set|name|long|inet|cidr|macaddr|tsvector|hstore|point|line|lseg|box|path|polygon|circle"
+        r"|geometry|geography|hierarchyid|sql_variant|rowid|urowid|xmltype)\b"
+    )),
+]
+
+
+def normalize_type_name(dtype: str) -> str:
+    """
+    'TIMESTAMP(6) WITHOUT TIME ZONE' -> 'timestamp'
+    'character varying(255)' -> 'character varying'
+    'NUMBER(10,2)' -> 'number'
+    """
+    t = (dtype or "").lower().strip()
+    t = re.sub(r"\(.*?\)", "", t)
+    t = t.replace("unsigned", "").replace("[]", "")
+    t = re.sub(r"\s+(with|without)\s+(local\s+)?time\s+zone", "", t)
+    return re.sub(r"\s+", " ", t).strip()
+
+
+def type_family(dtype: str) -> str:
+    """
+    Maps a dialect data type (postgres / mysql / mssql / oracle / sqlite)
+    to one canonical family:
+      numeric | text | datetime | boolean | binary | unknown
+    """
+    t = normalize_type_name(dtype)
+    if not t or t == "unknown":
+        return UNKNOWN
+
+    for family, pattern in _FAMILY_PATTERNS:
+        if pattern.search(t):
+            return family
+
+    # sqlite type affinity rules as a last resort
+    if "int" in t:
+        return NUMERIC
+    if any(x in t for x in ["char", "clob", "text"]):
+        return TEXT
+    if any(x in t for x in ["real", "floa", "doub"]):
+        return NUMERIC
+
+    return UNKNOWN
+
+
+# which target families a source family may be matched against
+COMPATIBLE_FAMILIES: Dict[str, Set[str]] = {
+    NUMERIC: {NUMERIC},
+    TEXT: {TEXT},
+    DATETIME: {DATETIME},
+    BOOLEAN: {BOOLEAN},
+    BINARY: {BINARY},
+}
+
+
+def compatible_families(family: str) -> List[str]:
+    """
+    Families a source column of `family` can match.
+    Unknown types are compatible with everything -> returns all families + unknown.
+    """
+    if family not in COMPATIBLE_FAMILIES:
+        return TYPE_FAMILIES + [UNKNOWN]
+
+    return sorted(COMPATIBLE_FAMILIES[family] | {UNKNOWN})
+
+
+def types_compatible(source_dtype: str, target_dtype: str) -> bool:
+    src_family = type_family(source_dtype)
+    tgt_family = type_family(target_dtype)
+
+    if src_family == UNKNOWN or tgt_family == UNKNOWN:
+        return True
+
+    return tgt_family in COMPATIBLE_FAMILIES.get(src_family, {src_family})
+
+
+def type_family_mask(source_dtype: str, target_dtypes: List[str]) -> List[bool]:
+    """
+    In-process equivalent of the Qdrant type_family payload filter.
+    mask[i] = True -> target i may be scored for this source column.
+    """
+    allowed = set(compatible_families(type_family(source_dtype)))
+    return [type_family(t) in allowed for t in target_dtypes]
+
+
+def family_masks(
+    target_dtypes: Optional[List[str]] = None,
+    families: Optional[List[str]] = None,
+) -> "Callable[[str], np.ndarray]":
+    """
+    type_family_mask() for many source columns against one target list.
+
+    Target families are classified once (or passed in precomputed as
+    `families`); the returned function maps a source dtype to a boolean
+    mask over the targets, cached per source family.
+    """
+    import numpy as np
+
+    if families is None:
+        families = [type_family(t) for t in target_dtypes or []]
+    target_families = np.asarray(families, dtype=object)
+
+    cache: Dict[str, "np.ndarray"] = {}
+
+    def mask_for(source_dtype: str) -> "np.ndarray":
+        fam = type_family(source_dtype)
+        mask = cache.get(fam)
+        if mask is None:
+            mask = cache[fam] = np.isin(target_families, compatible_families(fam))
+        return mask
+
+    return mask_for
@@ -0,0 +1,105 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from schema_matching_toolkit.utils.type_family import (
+    TYPE_FAMILIES,
+    UNKNOWN,
+    compatible_families,
+)
+
+
+_FAMILY_INDEX = {f: i for i, f in enumerate(TYPE_FAMILIES + [UNKNOWN])}
+
+
+def _family_compat_matrix() -> np.ndarray:
+    """
+    compat[i, j] = True -> source family i may match target family j
+    """
+    n = len(_FAMILY_INDEX)
+    compat = np.zeros((n, n), dtype=bool)
+    for fam, i in _FAMILY_INDEX.items():
+        for allowed in compatible_families(fam):
+            compat[i, _FAMILY_INDEX[allowed]] = True
+    return compat
+
+
+_COMPAT = _family_compat_matrix()
+
+
+def family_codes(families: List[str]) -> np.ndarray:
+    return np.asarray(
+        [_FAMILY_INDEX.get(f, _FAMILY_INDEX[UNKNOWN]) for f in families],
+        dtype=np.int8,
+    )
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def topk_cosine(
+    queries: np.ndarray,
+    targets: np.ndarray,
+    k: int,
+    query_families: Optional[List[str]] = None,
+    target_families: Optional[List[str]] = None,
+    chunk_size: int = 1024,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact in-process top-k search (rows are expected to be L2-normalized,
+    so dot product == cosine).
+
+    query_families / target_families given -> incompatible type families are
+    masked out (same rule as the Qdrant type_family payload filter).
+
+    Output:
+      (indices int32 [n_queries, k], scores float32 [n_queries, k])
+      missing slots (fewer than k allowed targets) -> index -1, score -inf
+    """
+    queries = np.asarray(queries, dtype=np.float32)
+    targets = np.asarray(targets, dtype=np.float32)
+
+    n_q = queries.shape[0]
+    n_t = targets.shape[0]
+    k = max(0, min(int(k), n_t))
+
+    out_idx = np.full((n_q, k), -1, dtype=np.int32)
+    out_scores = np.full((n_q, k), -np.inf, dtype=np.float32)
+
+    if n_q == 0 or k == 0:
+        return out_idx, out_scores
+
+    use_mask = query_families is not None and target_families is not None
+    if use_mask:
+        q_codes = family_codes(query_families)
+        t_codes = family_codes(target_families)
+
+    for start in range(0, n_q, chunk_size):
+        end = min(start + chunk_size, n_q)
+        scores = queries[start:end] @ targets.T
+
+        if use_mask:
+            mask = _COMPAT[q_codes[start:end]][:, t_codes]
+            scores = np.where(mask, scores, -np.inf)
+
+        if k < n_t:
+            part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            part = np.tile(np.arange(n_t), (end - start, 1))
+
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+
+        idx = np.take_along_axis(part, order, axis=1)
+        top = np.take_along_axis(part_scores, order, axis=1)
+
+        idx = np.where(np.isfinite(top), idx, -1)
+
+        out_idx[start:end] = idx
+        out_scores[start:end] = top
+
+    return out_idx, out_scores
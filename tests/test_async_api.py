@@ -0,0 +1,48 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+
+from schema_matching_toolkit import DBConfig, extract_schema, extract_schema_async
+from schema_matching_toolkit.common.embedding_service import embed_texts, embed_texts_async
+from schema_matching_toolkit.minilm_dense_matcher.indexer import EMBEDDER
+
+
+def _make_db(path: str, tables: int) -> None:
+    conn = sqlite3.connect(path)
+    for i in range(tables):
+        conn.execute(f"CREATE TABLE t{i} (id INTEGER NOT NULL, name TEXT, amount NUMERIC)")
+    conn.commit()
+    conn.close()
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    paths = [os.path.join(tmp, f"db{i}.sqlite") for i in range(4)]
+    for i, p in enumerate(paths):
+        _make_db(p, tables=i + 1)
+
+    cfgs = [DBConfig(db_type="sqlite", sqlite_path=p) for p in paths]
+
+    # 4 extraction jobs in one event loop (needs aiosqlite)
+    async def _extract_all():
+        return await asyncio.gather(*(extract_schema_async(c) for c in cfgs))
+
+    schemas = asyncio.run(_extract_all())
+    print("✅ Async extracted:", [s["table_count"] for s in schemas])
+
+    for cfg, schema in zip(cfgs, schemas):
+        assert schema == extract_schema(cfg)
+
+    # async embedding matches the sync path (dedupe included)
+    texts = ["t0 id integer", "t0 name text", "t0 id integer"]
+    expected, _ = embed_texts(EMBEDDER, texts)
+    vectors, stats = asyncio.run(embed_texts_async(EMBEDDER, texts))
+
+    print("✅ Async embed:", stats["unique_texts"], "/", stats["total_texts"], "unique")
+    assert vectors.shape == expected.shape
+    assert abs(float(vectors[2] @ expected[0]) - 1.0) < 1e-4
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+from schema_matching_toolkit import run_mapping_batch
+
+
+def main():
+    fetch_calls = []
+    lock = threading.Lock()
+    attempts = {}
+
+    def fetch(db_cfg, groq_cfg):
+        with lock:
+            fetch_calls.append(db_cfg.database)
+        time.sleep(0.05)
+        return {"schema": {"database": db_cfg.database, "tables": []}, "desc": {}}
+
+    def run(src_cfg, tgt_cfg, groq_cfg=None, _prefetched=None, **options):
+        key = (src_cfg.database, tgt_cfg.database)
+        with lock:
+            attempts[key] = attempts.get(key, 0) + 1
+            n = attempts[key]
+
+        assert _prefetched["target_schema"]["database"] == tgt_cfg.database
+        time.sleep(0.05)
+
+        if src_cfg.database == "flaky" and n == 1:
+            raise RuntimeError("transient")
+        if src_cfg.database == "broken":
+            raise RuntimeError("always fails")
+
+        with open(options["output_file"], "w") as f:
+            f.write("ok")
+        return {"saved_file": options["output_file"], "column_match_count": 3}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = lambda name: {"db_type": "sqlite", "sqlite_path": f"{name}.db", "database": name}
+        manifest = {
+            "output_dir": tmp,
+            "groq": {"api_key": "x"},
+            "defaults": {"output_format": "csv"},
+            "databases": {name: db(name) for name in ["crm", "erp", "flaky", "broken", "gpc", "dwh"]},
+            "pairs": [
+                {"id": "crm_gpc", "source": "crm", "target": "gpc"},
+                {"id": "erp_gpc", "source": "erp", "target": "gpc"},
+                {"id": "flaky_gpc", "source": "flaky", "target": "gpc"},
+                {"id": "crm_dwh", "source": "crm", "target": "dwh", "options": {"output_format": "json"}},
+                {"id": "broken_dwh", "source": "broken", "target": "dwh"},
+            ],
+        }
+
+        summary = run_mapping_batch(manifest, max_workers=4, max_retries=1, retry_backoff_seconds=0.01,
+                                    run_fn=run, fetch_fn=fetch)
+        print("✅ Batch:", {k: summary[k] for k in ["done", "failed", "distinct_databases", "wall_seconds"]})
+
+        rows = {r["id"]: r for r in summary["pairs"]}
+
+        # every database prepared once, even when shared by several pairs
+        assert sorted(fetch_calls) == sorted(set(fetch_calls)) and len(fetch_calls) == 6
+        assert summary["target_index_groups"] == 2
+
+        # retried pair recovers, permanently failing pair does not stop the batch
+        assert rows["flaky_gpc"]["status"] == "done" and rows["flaky_gpc"]["attempts"] == 2
+        assert rows["broken_dwh"]["status"] == "failed" and rows["broken_dwh"]["attempts"] == 2
+        assert "always fails" in rows["broken_dwh"]["error"]
+        assert summary["done"] == 4 and summary["failed"] == 1
+
+        # per-pair outputs + consolidated summary
+        assert rows["crm_dwh"]["saved_file"] == os.path.join(tmp, "crm_dwh.json")
+        assert os.path.exists(os.path.join(tmp, "crm_gpc.csv"))
+        with open(summary["summary_file"]) as f:
+            assert json.load(f)["pair_count"] == 5
+
+        # missing groq block -> rejected before any pair runs
+        fetch_calls.clear()
+        for groq in (None, {}, {"model": "llama-3.1-8b-instant"}):
+            bad = {**manifest, "groq": groq}
+            try:
+                run_mapping_batch(bad, run_fn=run, fetch_fn=fetch)
+                raise AssertionError("expected ValueError for missing groq")
+            except ValueError as e:
+                assert "groq" in str(e)
+        assert fetch_calls == []
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from schema_matching_toolkit import QdrantConfig, catalog_search, index_catalog_schemas
+
+
+def _schema(tables):
+    return {
+        "tables": [
+            {"table_name": t, "columns": [{"column_name": c, "data_type": d} for c, d in cols]}
+            for t, cols in tables.items()
+        ]
+    }
+
+
+CATALOG = {
+    "hr": _schema(
+        {
+            "employee": [("employee_id", "integer"), ("full_name", "text"), ("hired_on", "date")],
+            "department": [("department_id", "integer"), ("department_name", "text")],
+        }
+    ),
+    "sales": _schema(
+        {
+            "orders": [("order_id", "integer"), ("order_date", "date"), ("total_amount", "numeric")],
+            "customer": [("customer_id", "integer"), ("email", "text")],
+        }
+    ),
+    "inventory": _schema(
+        {
+            "product": [("sku", "varchar"), ("product_name", "text"), ("unit_price", "numeric")],
+            "warehouse": [("warehouse_id", "integer"), ("city", "text")],
+        }
+    ),
+}
+
+SOURCE = _schema(
+    {
+        "tbl_emp": [("emp_id", "integer"), ("emp_nm", "varchar"), ("hire_dt", "date")],
+        "tbl_dept": [("dept_id", "integer"), ("dept_nm", "varchar")],
+    }
+)
+
+
+def main():
+    cfg = QdrantConfig(location=":memory:", collection_name="catalog_columns")
+
+    info = index_catalog_schemas(CATALOG, cfg, recreate=True)
+    print("✅ Indexed:", info["schemas"])
+    assert info["indexed_points"] == 15
+
+    # re-indexing one schema replaces its points (stable ids, no duplicates)
+    index_catalog_schemas({"hr": CATALOG["hr"]}, cfg)
+
+    res = catalog_search(SOURCE, cfg, top_k=10, top_schemas=3)
+    for s in res["schemas"]:
+        print(s["schema_id"], s["score"], s["coverage"], [t["best_match_table"] for t in s["table_matches"]])
+
+    best = res["schemas"][0]
+    assert best["schema_id"] == "hr"
+    assert {t["source_table"]: t["best_match_table"] for t in best["table_matches"]}["tbl_emp"] == "employee"
+    assert all(len({c["target"] for c in m["candidates"]}) == len(m["candidates"]) for m in best["column_matches"])
+
+    # tenant filter
+    only_sales = catalog_search(SOURCE, cfg, schema_ids=["sales"])
+    assert [s["schema_id"] for s in only_sales["schemas"]] == ["sales"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+from schema_matching_toolkit import DBConfig, RunCheckpoint
+from schema_matching_toolkit.checkpoint import content_hash
+
+
+SCHEMA = {
+    "tables": [
+        {"table_name": "orders", "columns": [{"column_name": "id", "data_type": "integer"}]},
+    ]
+}
+
+
+def main():
+    calls = []
+
+    def extract():
+        calls.append("extract")
+        return SCHEMA
+
+    cfg = DBConfig(db_type="sqlite", sqlite_path="./demo.db")
+
+    # key order / dataclass configs hash stably
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"db": cfg}) != content_hash({"db": DBConfig(db_type="sqlite", sqlite_path="./other.db")})
+
+    with tempfile.TemporaryDirectory() as run_dir:
+        first = RunCheckpoint(run_dir, resume=True)
+        assert first.cached("schema", {"db": cfg}, extract) == SCHEMA
+        assert first.stats()["computed"] == ["schema"]
+
+        # resumed run: same inputs -> artifact reused, extract() not called
+        resumed = RunCheckpoint(run_dir, resume=True)
+        assert resumed.cached("schema", {"db": cfg}, extract) == SCHEMA
+        assert calls == ["extract"]
+        assert resumed.stats()["reused"] == ["schema"]
+        print("✅ Resumed stage from", os.listdir(run_dir))
+
+        # changed inputs -> recomputed
+        resumed.cached("schema", {"db": cfg, "schema_name": "sales"}, extract)
+        assert calls == ["extract", "extract"]
+
+        # resume=False -> always recomputed (and overwritten)
+        RunCheckpoint(run_dir, resume=False).cached("schema", {"db": cfg, "schema_name": "sales"}, extract)
+        assert len(calls) == 3
+
+        # corrupted artifact -> output hash mismatch -> recomputed
+        ckpt = RunCheckpoint(run_dir, resume=True)
+        entry = ckpt._manifest["stages"]["schema"]
+        with open(os.path.join(run_dir, entry["file"]), "ab") as f:
+            f.write(b"garbage")
+
+        ckpt.cached("schema", {"db": cfg, "schema_name": "sales"}, extract)
+        assert len(calls) == 4
+        print("✅ Artifact format:", entry["format"], "| stages:", sorted(ckpt._manifest["stages"]))
+
+
+if __name__ == "__main__":
+    main()
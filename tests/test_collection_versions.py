@@ -0,0 +1,111 @@
+import time
+from dataclasses import replace
+
+from qdrant_client.models import PointStruct
+
+from schema_matching_toolkit import QdrantConfig, gc_unreferenced_versions
+from schema_matching_toolkit.common.collection_versions import (
+    ensure_versioned_collection,
+    target_alias_name,
+    versioned_collection_name,
+)
+from schema_matching_toolkit.common.qdrant_utils import create_vector_collection, get_qdrant_client
+
+
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _builder(points: int, calls: list):
+    def build(version_cfg: QdrantConfig):
+        calls.append(version_cfg.collection_name)
+        get_qdrant_client(version_cfg).upsert(
+            collection_name=version_cfg.collection_name,
+            points=[
+                PointStruct(id=i, vector={version_cfg.vector_name: [1.0, float(i), 0.5, 0.25]}, payload={"i": i})
+                for i in range(points)
+            ],
+        )
+    return build
+
+
+def _collections(client):
+    return {c.name for c in client.get_collections().collections}
+
+
+def main():
+    cfg = QdrantConfig(location=":memory:", collection_name="cv_columns", vector_size=4)
+    client = get_qdrant_client(cfg)
+    alias = target_alias_name(cfg.collection_name, "gpc.public")
+
+    fp_v1 = "a" * 64
+    fp_v2 = "b" * 64
+    v1 = versioned_collection_name(cfg.collection_name, MODEL, fp_v1)
+    v2 = versioned_collection_name(cfg.collection_name, MODEL, fp_v2)
+
+    # ----------------------------
+    # build v1 -> alias points to it
+    # ----------------------------
+    calls = []
+    info = ensure_versioned_collection(cfg, alias, MODEL, fp_v1, 3, _builder(3, calls))
+    assert info == {"alias": alias, "collection": v1, "status": "built", "previous": None}, info
+    assert calls == [v1]
+    assert client.count(collection_name=alias).count == 3
+
+    # ----------------------------
+    # same version again -> shared, no rebuild
+    # ----------------------------
+    calls = []
+    info = ensure_versioned_collection(cfg, alias, MODEL, fp_v1, 3, _builder(3, calls))
+    assert info["status"] == "shared" and info["collection"] == v1 and info["previous"] is None
+    assert calls == []
+
+    # ----------------------------
+    # new target content -> v2 built, alias swapped, v1 kept for pinned readers
+    # ----------------------------
+    pinned = info["collection"]
+    calls = []
+    info = ensure_versioned_collection(cfg, alias, MODEL, fp_v2, 5, _builder(5, calls))
+    assert info == {"alias": alias, "collection": v2, "status": "built", "previous": v1}, info
+    assert calls == [v2]
+    assert client.count(collection_name=alias).count == 5
+
+    # a job that resolved v1 before the swap still reads v1
+    assert v1 in _collections(client)
+    assert client.count(collection_name=pinned).count == 3
+
+    # ----------------------------
+    # GC: retired v1 is inside its grace period -> kept
+    # ----------------------------
+    assert gc_unreferenced_versions(cfg) == []
+    assert v1 in _collections(client)
+
+    # a version still being built (unaliased, just created) is kept as well
+    building = versioned_collection_name(cfg.collection_name, MODEL, "c" * 64)
+    create_vector_collection(client, replace(cfg, collection_name=building))
+    client.update_collection(collection_name=building, metadata={"created_at": time.time()})
+
+    # ----------------------------
+    # grace period over -> only unaliased versions under the prefix go
+    # ----------------------------
+    client.update_collection(collection_name=v1, metadata={"retired_at": time.time() - 7200})
+
+    other = QdrantConfig(location=":memory:", collection_name="cv_other", vector_size=4)
+    ensure_versioned_collection(other, target_alias_name("cv_other", "x"), MODEL, fp_v1, 1, _builder(1, []))
+
+    dropped = gc_unreferenced_versions(cfg)
+    assert dropped == [v1], dropped
+
+    names = _collections(client)
+    assert v1 not in names and v2 in names and building in names
+    assert versioned_collection_name("cv_other", MODEL, fp_v1) in names
+    assert client.count(collection_name=alias).count == 5
+
+    # grace_seconds=0 -> every unaliased version
+    assert gc_unreferenced_versions(cfg, grace_seconds=0) == [building]
+    assert gc_unreferenced_versions(cfg, grace_seconds=0) == []
+
+    print("✅ Versioned collections: share / build / swap / GC")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+
+from schema_matching_toolkit.hybrid_ensemble_matcher import (
+    compact_from_dict,
+    compact_to_dict,
+    compact_to_verbose,
+    load_compact_npz,
+)
+from schema_matching_toolkit.hybrid_ensemble_matcher.compact import build_compact_result
+from schema_matching_toolkit.hybrid_ensemble_matcher.compact import compact_to_rows
+from schema_matching_toolkit.hybrid_ensemble_matcher.exporter import _flatten_mapping_for_csv, save_mapping_output
+from schema_matching_toolkit.hybrid_ensemble_matcher.table_mapper import (
+    build_table_matches,
+    build_table_matches_from_column_matches,
+)
+
+
+COLUMN_MATCHES = [
+    {
+        "source": "tbl_emp.emp_id",
+        "best_match": "employee.employee_id",
+        "confidence": 1.0,
+        "match_source": "exact_name",
+        "candidates": [{"candidate": "employee.employee_id", "final_score": 1.0}],
+    },
+    {
+        "source": "tbl_emp.emp_nm",
+        "best_match": "employee.full_name",
+        "confidence": 0.8123,
+        "match_source": "ensemble",
+        "candidates": [
+            {"candidate": "employee.full_name", "bm25_score": 0.0, "minilm_score": 0.91,
+             "mpnet_score": 0.88, "final_score": 0.8123},
+            {"candidate": "department.department_name", "bm25_score": 1.0, "minilm_score": 0.52,
+             "mpnet_score": 0.49, "final_score": 0.627},
+            {"candidate": "employee.employee_id", "bm25_score": 0.0, "minilm_score": 0.31,
+             "mpnet_score": 0.22, "final_score": 0.1965},
+        ],
+    },
+]
+
+
+def main():
+    tables = build_table_matches_from_column_matches({"matches": COLUMN_MATCHES})["table_matches"]
+    meta = {"column_match_count": 2, "exact_match_count": 1, "include_table_matches": True}
+
+    compact = build_compact_result(COLUMN_MATCHES, tables, top_k=2, meta=meta)
+    print("✅ Compact:", compact.nbytes, "bytes,", len(compact.ids), "ids,", compact.score_fields)
+
+    assert compact.cand_ids.shape == (2, 2)
+    assert compact.score_fields[0] == "final"
+
+    verbose = compact_to_verbose(compact)
+    cols = verbose["tables"][0]["column_matches"]
+
+    assert verbose["table_match_count"] == 1 and verbose["exact_match_count"] == 1
+    assert cols[0]["candidates"] == [{"candidate": "employee.employee_id", "final_score": 1.0}]
+    assert cols[1]["candidates"][0] == COLUMN_MATCHES[1]["candidates"][0]
+    assert len(cols[1]["candidates"]) == 2  # truncated to top_k
+
+    # JSON round trip
+    again = compact_to_verbose(compact_from_dict(json.loads(json.dumps(compact_to_dict(compact)))))
+    assert again == verbose
+
+    # exporters write the compact form directly
+    tmp = tempfile.mkdtemp()
+    npz = save_mapping_output(compact, "npz", os.path.join(tmp, "out.npz"))
+    assert compact_to_verbose(load_compact_npz(npz)) == verbose
+
+    csv_path = save_mapping_output(compact, "csv", os.path.join(tmp, "out.csv"))
+    with open(csv_path, encoding="utf-8") as f:
+        assert len(f.read().strip().splitlines()) == 3
+
+    check_table_candidates(tmp)
+    check_rows_match_verbose()
+
+
+def check_table_candidates(tmp: str):
+    # score-matrix table matches keep their ranked target tables
+    tables = build_table_matches(COLUMN_MATCHES, "mean_row_max", "top_k", 2)["table_matches"]
+    meta = {"column_match_count": 2, "include_table_matches": True}
+
+    compact = build_compact_result(COLUMN_MATCHES, tables, meta=meta)
+    assert compact.table_cand_ids.shape == (1, 2)
+
+    verbose = compact_to_verbose(compact)
+    t = verbose["tables"][0]
+    assert t["best_match_table"] == "employee"
+    assert t["table_candidates"] == tables[0]["candidates"], (t["table_candidates"], tables[0]["candidates"])
+
+    again = compact_to_verbose(compact_from_dict(json.loads(json.dumps(compact_to_dict(compact)))))
+    assert again == verbose
+
+    npz = save_mapping_output(compact, "npz", os.path.join(tmp, "tables.npz"))
+    assert compact_to_verbose(load_compact_npz(npz)) == verbose
+
+    # payloads written before table candidates were stored still load
+    old = compact_to_dict(compact)
+    del old["table_cand_ids"], old["table_cand_scores"]
+    assert compact_to_verbose(compact_from_dict(old))["tables"][0]["table_candidates"] == []
+
+
+def check_rows_match_verbose():
+    # a source table without a table match: verbose CSV skips its columns
+    matches = COLUMN_MATCHES + [
+        {
+            "source": "tbl_misc.note",
+            "best_match": None,
+            "confidence": 0.0,
+            "match_source": "ensemble",
+            "candidates": [],
+        }
+    ]
+    tables = build_table_matches_from_column_matches({"matches": COLUMN_MATCHES})["table_matches"]
+
+    for include_tables in (True, False):
+        meta = {"column_match_count": 3, "include_table_matches": include_tables}
+        compact = build_compact_result(matches, tables if include_tables else [], meta=meta)
+
+        rows = compact_to_rows(compact)
+        assert rows == _flatten_mapping_for_csv(compact_to_verbose(compact)), include_tables
+        assert len(rows) == (2 if include_tables else 3)
+
+    print("✅ Compact rows == verbose CSV rows (with and without table matches)")
+
+
+if __name__ == "__main__":
+    main()
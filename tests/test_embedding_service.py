@@ -0,0 +1,61 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from schema_matching_toolkit import EmbeddingServiceConfig, configure_embedding_service
+from schema_matching_toolkit.common.embedding_service import embed_texts, get_embedding_service
+from schema_matching_toolkit.common.encoding import encode_texts
+from schema_matching_toolkit.minilm_dense_matcher.indexer import EMBEDDER
+
+
+TEXTS = [
+    "customers customer_id integer",
+    "customers full_name text",
+    "orders order_date date",
+    "orders amount numeric",
+    "orders status varchar",
+    "payments paid_at timestamp",
+    "payments is_refunded boolean",
+    "products sku varchar",
+]
+
+
+def main():
+    configure_embedding_service(EmbeddingServiceConfig(max_batch_texts=64, max_wait_ms=20))
+
+    expected, _ = encode_texts(EMBEDDER, TEXTS)
+
+    # 8 concurrent callers, one column each
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda t: embed_texts(EMBEDDER, [t]), TEXTS))
+
+    for i, (vec, stats) in enumerate(results):
+        assert vec.shape == (1, expected.shape[1])
+        assert abs(float(vec[0] @ expected[i]) - 1.0) < 1e-4
+
+    svc = get_embedding_service(EMBEDDER)
+    print("✅ Thread callers:", svc.stats())
+    assert svc.stats()["batches"] < len(TEXTS)
+
+    # asyncio callers
+    async def _run():
+        return await asyncio.gather(*(svc.encode_async([t]) for t in TEXTS))
+
+    async_results = asyncio.run(_run())
+    print("✅ Async callers coalesced:", max(s["coalesced_requests"] for _, s in async_results))
+
+    for i, (vec, _) in enumerate(async_results):
+        assert abs(float(vec[0] @ expected[i]) - 1.0) < 1e-4
+
+    # duplicate texts (created_at in every table) are encoded once
+    dup_texts = ["created_at timestamp"] * 50 + TEXTS
+    vectors, stats = embed_texts(EMBEDDER, dup_texts)
+    print("✅ Dedupe:", stats["unique_texts"], "/", stats["total_texts"], "unique")
+
+    assert vectors.shape[0] == len(dup_texts)
+    assert stats["unique_texts"] == len(TEXTS) + 1
+    assert abs(float(vectors[0] @ vectors[49]) - 1.0) < 1e-6
+    assert abs(float(vectors[50] @ expected[0]) - 1.0) < 1e-4
+
+
+if __name__ == "__main__":
+    main()
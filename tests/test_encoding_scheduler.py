@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from schema_matching_toolkit import EncodingConfig
+from schema_matching_toolkit.common.encoding import encode_texts, plan_batches
+from schema_matching_toolkit.minilm_dense_matcher.indexer import EMBEDDER
+
+
+def main():
+    # 3-token column names mixed with long description texts
+    lengths = [3, 120, 4, 118, 3, 64, 5, 3]
+
+    batches = plan_batches(lengths, token_budget=256, max_batch_size=4)
+    print("Batches:", batches)
+
+    # every index exactly once
+    assert sorted(i for b in batches for i in b) == list(range(len(lengths)))
+
+    # batches respect the token budget and the item cap
+    for b in batches:
+        assert len(b) <= 4
+        assert len(b) == 1 or len(b) * max(lengths[i] for i in b) <= 256
+
+    # long texts are not padded together with short ones
+    assert {1, 3} == set(batches[0])
+
+    texts = [
+        "t c int",
+        "orders customer_id integer identifier of the customer who placed the order, "
+        "references customers.id and is required for every order row",
+        "orders amt numeric",
+    ]
+    vectors, stats = encode_texts(EMBEDDER, texts, EncodingConfig(token_budget=64, max_seq_length=32))
+
+    print("✅ Encoded", stats["texts"], "texts in", stats["batches"], "batches")
+    print("Padding waste:", stats["padding_waste"], "| tokens/s:", stats["tokens_per_second"])
+
+    # original order is restored
+    single, _ = encode_texts(EMBEDDER, [texts[2]])
+    assert abs(float(vectors[2] @ single[0]) - 1.0) < 1e-4
+    assert EMBEDDER.max_seq_length != 32
+
+    # truncation is per call: concurrent callers with different
+    # max_seq_length do not truncate each other's texts
+    short_cfg = EncodingConfig(max_seq_length=8)
+    truncated, _ = encode_texts(EMBEDDER, [texts[1]], short_cfg)
+    full, _ = encode_texts(EMBEDDER, [texts[1]])
+    assert float(truncated[0] @ full[0]) < 0.999
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(
+            lambda i: (i, encode_texts(EMBEDDER, [texts[1]], short_cfg if i % 2 else None)[0][0]),
+            range(32),
+        ))
+
+    for i, vec in results:
+        expected = truncated[0] if i % 2 else full[0]
+        assert abs(float(vec @ expected) - 1.0) < 1e-4, i
+
+    print("✅ Concurrent encodes keep their own max_seq_length")
+
+
+if __name__ == "__main__":
+    main()
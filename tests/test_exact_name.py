@@ -0,0 +1,49 @@
+from schema_matching_toolkit.exact_name_matcher import exact_name_match, normalize_identifier
+
+
+def main():
+    source_schema = {
+        "tables": [
+            {
+                "table_name": "tbl_orders",
+                "columns": [
+                    {"column_name": "CustID", "data_type": "integer"},
+                    {"column_name": "OrderDt", "data_type": "timestamp without time zone"},
+                    {"column_name": "status", "data_type": "character varying"},
+                    {"column_name": "amt", "data_type": "numeric(10,2)"},
+                ],
+            }
+        ]
+    }
+
+    target_schema = {
+        "tables": [
+            {
+                "table_name": "orders",
+                "columns": [
+                    {"column_name": "customer_id", "data_type": "bigint"},
+                    {"column_name": "order_date", "data_type": "date"},
+                    {"column_name": "status", "data_type": "integer"},
+                    {"column_name": "amount", "data_type": "decimal"},
+                ],
+            }
+        ]
+    }
+
+    print("CustID ->", normalize_identifier("CustID"))
+    print("tbl_customer_id ->", normalize_identifier("tbl_customer_id"))
+
+    result = exact_name_match(source_schema, target_schema)
+
+    print("✅ Exact-name matching done")
+    print("Matches:", result["match_count"])
+    for m in result["matches"]:
+        print(m["source"], "->", m["best_match"], f"({m['match_level']})")
+
+    # status is text in source, integer in target -> filtered out by type check
+    assert "tbl_orders.status" not in {m["source"] for m in result["matches"]}
+    assert result["match_count"] == 3
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from schema_matching_toolkit import HnswConfig, QdrantConfig
+from schema_matching_toolkit.qdrant_tuning import pick_hnsw_params
+from schema_matching_toolkit.qdrant_tuning.sweep import _recall_at_k
+
+
+def main():
+    cfg = QdrantConfig(hnsw_config=HnswConfig(m=16, ef_construct=128), hnsw_ef=64)
+    assert cfg.hnsw_config.m == 16 and cfg.exact is False
+    assert QdrantConfig().hnsw_config is None and QdrantConfig().hnsw_ef is None
+
+    # recall@k: overlap with the exact top-k, averaged over queries
+    truth = [[0, 1, 2], [3, 4, 5]]
+    assert _recall_at_k([[0, 1, 2], [3, 9, 8]], truth) == round((1.0 + 1 / 3) / 2, 4)
+
+    sweep = {
+        "results": [
+            {"m": 8, "ef_construct": 64, "full_scan_threshold": None, "hnsw_ef": 16, "recall_at_k": 0.81, "p99_ms": 0.9},
+            {"m": 16, "ef_construct": 128, "full_scan_threshold": None, "hnsw_ef": 64, "recall_at_k": 0.97, "p99_ms": 2.1},
+            {"m": 32, "ef_construct": 256, "full_scan_threshold": None, "hnsw_ef": 128, "recall_at_k": 0.99, "p99_ms": 4.8},
+        ]
+    }
+
+    best = pick_hnsw_params(sweep, min_recall=0.95)
+    print("✅ Picked:", best["hnsw_config"], "hnsw_ef =", best["hnsw_ef"])
+    assert best["hnsw_config"] == HnswConfig(m=16, ef_construct=128)
+    assert best["hnsw_ef"] == 64
+
+    assert pick_hnsw_params(sweep, min_recall=0.999) is None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import time
+
+from schema_matching_toolkit import bm25_match
+from schema_matching_toolkit.exact_name_matcher import normalize_identifier
+from schema_matching_toolkit.utils.identifier_tokenizer import IdentifierTokenizer, get_identifier_tokenizer
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tbl_ord",
+            "columns": [
+                {"column_name": "CustAmt", "data_type": "numeric"},
+                {"column_name": "txndt", "data_type": "date"},
+            ],
+        }
+    ]
+}
+
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "orders",
+            "columns": [
+                {"column_name": "customer_amount", "data_type": "numeric"},
+                {"column_name": "transaction_date", "data_type": "date"},
+                {"column_name": "status", "data_type": "text"},
+            ],
+        }
+    ]
+}
+
+
+def main():
+    tok = IdentifierTokenizer()
+
+    # snake / camel / digits / abbreviations
+    assert tok.tokenize("cust_id") == ("customer", "id")
+    assert tok.tokenize("CustAmt2") == ("customer", "amount", "2")
+    assert tok.tokenize("HTTPCode") == ("http", "code")
+
+    # run-together tokens are segmented only when fully covered
+    assert tok.tokenize("custdept") == ("customer", "department")
+    assert tok.tokenize("notes") == ("notes",)
+    assert tok.tokenize("status") == ("status",)
+
+    # user dictionary
+    custom = IdentifierTokenizer({"ord": "order", "ln": "line"})
+    assert custom.tokenize("ordln_no") == ("order", "line", "no")
+
+    assert normalize_identifier("custid") == normalize_identifier("tbl_customer_id") == "customer_id"
+    assert get_identifier_tokenizer() is get_identifier_tokenizer()
+
+    print("✅ Tokenizer rules ok")
+
+    # BM25 on identifier tokens: 'CustAmt' meets 'customer_amount'
+    result = bm25_match(SOURCE_SCHEMA, TARGET_SCHEMA)
+    best = {m["source"]: m["best_match"] for m in result["matches"]}
+    print("BM25:", best)
+    assert best["tbl_ord.CustAmt"] == "orders.customer_amount"
+    assert best["tbl_ord.txndt"] == "orders.transaction_date"
+
+    # 100k identifiers, heavy repetition -> cached per unique name
+    names = [f"tbl{i % 400}_cust_amt_{i % 2500}" for i in range(100_000)]
+    tok = IdentifierTokenizer()
+    t0 = time.perf_counter()
+    for n in names:
+        tok.tokenize(n)
+    elapsed = time.perf_counter() - t0
+
+    info = tok.cache_info()
+    print(f"✅ 100k identifiers in {elapsed * 1000:.1f} ms ({info.currsize} unique)")
+    assert info.currsize == len(set(names))
+
+
+if __name__ == "__main__":
+    main()
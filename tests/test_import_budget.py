@@ -0,0 +1,72 @@
+import json
+import subprocess
+import sys
+
+
+# must never be imported by the lightweight entry points
+HEAVY_MODULES = ["torch", "sentence_transformers", "qdrant_client", "groq", "rank_bm25"]
+
+# generous for cold CI boxes; the heavy stack alone takes several seconds
+IMPORT_BUDGET_SECONDS = 1.5
+
+
+def _measure(statement: str) -> dict:
+    """
+    Runs the import in a fresh interpreter and reports wall time + heavy modules loaded.
+    """
+    code = f"""
+import json, sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"elapsed": elapsed, "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _check(statement: str) -> None:
+    res = _measure(statement)
+    print(f"{statement!r}: {res['elapsed'] * 1000:.0f} ms, heavy={res['heavy']}")
+
+    assert res["heavy"] == [], f"{statement} imported {res['heavy']}"
+    assert res["elapsed"] < IMPORT_BUDGET_SECONDS, f"{statement} took {res['elapsed']:.2f}s"
+
+
+def test_package_import():
+    _check("import schema_matching_toolkit")
+
+
+def test_configs_import():
+    _check("from schema_matching_toolkit import DBConfig, QdrantConfig, GroqConfig")
+
+
+def test_extract_schema_import():
+    _check("from schema_matching_toolkit import extract_schema")
+
+
+def test_profile_schema_import():
+    _check("from schema_matching_toolkit import profile_schema")
+
+
+def test_exact_name_import():
+    _check("from schema_matching_toolkit import exact_name_match")
+
+
+def test_dense_matchers_import_without_models():
+    # importing a matcher must not load the model / connect to qdrant
+    _check("from schema_matching_toolkit import match_source_to_target_dense, mpnet_dense_match, bm25_match")
+
+
+def main():
+    test_package_import()
+    test_configs_import()
+    test_extract_schema_import()
+    test_profile_schema_import()
+    test_exact_name_import()
+    test_dense_matchers_import_without_models()
+    print("✅ Import budget OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from schema_matching_toolkit import MappingMemory
+from schema_matching_toolkit.mapping_memory import apply_mapping_memory
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tbl_emp",
+            "columns": [
+                {"column_name": "emp_id", "data_type": "integer"},
+                {"column_name": "emp_nm", "data_type": "varchar(50)"},
+                {"column_name": "hire_dt", "data_type": "date"},
+            ],
+        }
+    ]
+}
+
+TARGET_FP = "fp-target-1"
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "memory.sqlite")
+    memory = MappingMemory(path)
+
+    n = memory.record_decisions(
+        [
+            {"source": "tbl_emp.emp_id", "target": "employee.employee_id", "status": "accepted"},
+            {"source": "tbl_emp.emp_nm", "target": "department.department_name", "status": "rejected"},
+        ],
+        TARGET_FP,
+        source_schema=SOURCE_SCHEMA,
+    )
+    assert n == 2
+
+    # varchar(50) -> varchar(255): same signature (type family)
+    hit = memory.lookup("tbl_emp.emp_nm", "varchar(255)", TARGET_FP)
+    assert hit["rejected"] == {"department.department_name"} and hit["accepted"] is None
+
+    res = apply_mapping_memory(memory, SOURCE_SCHEMA, TARGET_FP, {"employee.employee_id"})
+    print("✅ Memory:", [m["source"] for m in res["accepted"]], res["rejected"])
+    assert [m["best_match"] for m in res["accepted"]] == ["employee.employee_id"]
+    assert res["accepted"][0]["match_source"] == "memory"
+
+    # accepted target that no longer exists in the target schema is ignored
+    assert apply_mapping_memory(memory, SOURCE_SCHEMA, TARGET_FP, set())["accepted"] == []
+
+    # a new accepted target replaces the old one
+    memory.accept("tbl_emp.emp_id", "integer", TARGET_FP, "employee.id")
+    assert memory.lookup("tbl_emp.emp_id", "integer", TARGET_FP)["accepted"] == "employee.id"
+
+    # concurrent jobs: writers on their own connections, reader sees their commits
+    def _job(i):
+        m = MappingMemory(path)
+        try:
+            m.reject("tbl_emp.hire_dt", "date", TARGET_FP, f"employee.col_{i}")
+        finally:
+            m.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_job, range(16)))
+
+    rejected = memory.lookup("tbl_emp.hire_dt", "date", TARGET_FP)["rejected"]
+    print("✅ Concurrent rejects:", len(rejected))
+    assert len(rejected) == 16
+
+    memory.close()
+
+    # persisted across processes / runs
+    again = MappingMemory(path)
+    assert again.lookup("tbl_emp.emp_id", "integer", TARGET_FP)["accepted"] == "employee.id"
+    again.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from schema_matching_toolkit import ServiceConfig
+from schema_matching_toolkit.service import MappingService, QueueFullError, make_server
+
+
+def _sleep_job(params):
+    time.sleep(params.get("seconds", 0.1))
+    if params.get("fail"):
+        raise RuntimeError("boom")
+    return {"slept": params.get("seconds", 0.1)}
+
+
+def _save_job(params):
+    with open(params["output_file"], "w") as f:
+        f.write("source_column,best_match_column\n")
+    return {"saved_file": params["output_file"]}
+
+
+def _call(base, method, path, body=None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(base + path, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def main():
+    cfg = ServiceConfig(port=0, workers=2, max_queue=2, warm_models=())
+
+    # admission control: 2 running + 2 queued, the 5th submission is rejected
+    service = MappingService(cfg, handlers={"sleep": _sleep_job}).start(warm=False)
+    jobs = [service.submit("sleep", {"seconds": 0.3}) for _ in range(2)]
+    time.sleep(0.05)
+    jobs += [service.submit("sleep", {"seconds": 0.3}) for _ in range(2)]
+    try:
+        service.submit("sleep", {"seconds": 0.3})
+        raise AssertionError("queue bound not enforced")
+    except QueueFullError:
+        pass
+
+    assert service.cancel(jobs[-1].job_id)
+    for j in jobs[:3]:
+        service.wait(j.job_id, timeout=5)
+    assert [j.status for j in jobs] == ["done", "done", "done", "cancelled"]
+    assert service.stats()["rejected"] == 1
+    print("✅ Queue bound + cancel:", service.stats())
+
+    # HTTP API
+    server = make_server(service, cfg)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    status, body = _call(base, "POST", "/jobs", {"kind": "sleep", "params": {"seconds": 0.05}})
+    assert status == 202
+    job_id = body["job_id"]
+
+    status, body = _call(base, "GET", f"/jobs/{job_id}?wait=5")
+    assert status == 200 and body["status"] == "done" and body["run_seconds"] is not None
+
+    status, body = _call(base, "GET", f"/jobs/{job_id}/result")
+    assert status == 200 and body["result"] == {"slept": 0.05}
+
+    status, _ = _call(base, "POST", "/jobs", {"kind": "sleep", "params": {"seconds": 0.01, "fail": True}})
+    assert status == 202
+
+    assert _call(base, "POST", "/jobs", {"kind": "nope"})[0] == 400
+    assert _call(base, "GET", "/jobs/missing")[0] == 404
+
+    status, stats = _call(base, "GET", "/health")
+    print("✅ HTTP API ok:", stats)
+    assert status == 200 and stats["workers"] == 2
+
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+    # mapping jobs: one output file per job, removed once the job is evicted
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = ServiceConfig(workers=2, max_finished=2, warm_models=(), output_dir=tmp)
+        service = MappingService(cfg, handlers={"mapping": _save_job}).start(warm=False)
+
+        jobs = [service.submit("mapping", {"output_format": "json"}) for _ in range(2)]
+        files = [service.wait(j.job_id, timeout=5).result["saved_file"] for j in jobs]
+        assert files == [os.path.join(tmp, f"{j.job_id}.json") for j in jobs]
+        assert all(os.path.exists(f) for f in files)
+
+        for _ in range(2):
+            j = service.submit("mapping", {})
+            service.wait(j.job_id, timeout=5)
+        assert not any(os.path.exists(f) for f in files)
+        print("✅ Per-job outputs:", sorted(os.listdir(tmp)))
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
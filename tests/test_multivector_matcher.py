@@ -0,0 +1,135 @@
+import numpy as np
+
+from schema_matching_toolkit import DBConfig, QdrantConfig
+from schema_matching_toolkit.common.embedding_service import embed_texts
+from schema_matching_toolkit.common.models import get_sentence_model
+from schema_matching_toolkit.hybrid_ensemble_matcher import run_hybrid_mapping
+from schema_matching_toolkit.multivector_matcher import (
+    index_target_columns_multivector,
+    multivector_dense_match,
+)
+from schema_matching_toolkit.multivector_matcher.indexer import (
+    MINILM_MODEL_NAME,
+    MINILM_VECTOR,
+    MPNET_MODEL_NAME,
+    MPNET_VECTOR,
+)
+from schema_matching_toolkit.utils.schema_flatten import flatten_columns_with_desc
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tbl_emp",
+            "columns": [
+                {"column_name": "emp_id", "data_type": "integer"},
+                {"column_name": "emp_nm", "data_type": "character varying"},
+                {"column_name": "hire_dt", "data_type": "date"},
+                {"column_name": "dept_ref", "data_type": "integer"},
+            ],
+        }
+    ]
+}
+
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "employee",
+            "columns": [
+                {"column_name": "employee_id", "data_type": "integer"},
+                {"column_name": "full_name", "data_type": "text"},
+                {"column_name": "hired_on", "data_type": "date"},
+                {"column_name": "department_id", "data_type": "integer"},
+            ],
+        },
+        {
+            "table_name": "department",
+            "columns": [
+                {"column_name": "department_id", "data_type": "integer"},
+                {"column_name": "department_name", "data_type": "text"},
+            ],
+        },
+    ]
+}
+
+TOP_K = 3
+
+
+def _normalized(model_name, texts):
+    vectors, _ = embed_texts(get_sentence_model(model_name), texts)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _expected(model_name):
+    """
+    Brute-force per-method top_k: {source_id: [(target_id, cosine), ...]}
+    """
+    src = flatten_columns_with_desc(SOURCE_SCHEMA)
+    tgt = flatten_columns_with_desc(TARGET_SCHEMA)
+
+    sims = _normalized(model_name, [c["text"] for c in src]) @ _normalized(model_name, [c["text"] for c in tgt]).T
+
+    out = {}
+    for i, s in enumerate(src):
+        order = np.argsort(-sims[i])[:TOP_K]
+        out[s["column_id"]] = [(tgt[j]["column_id"], float(sims[i, j])) for j in order]
+    return out
+
+
+def _check(method_result, expected, label):
+    matches = {m["source"]: m for m in method_result["matches"]}
+    assert set(matches) == set(expected), (label, set(matches))
+
+    for source, exp in expected.items():
+        m = matches[source]
+        got = [(c["target"], c["score"]) for c in m["candidates"]]
+        assert len(got) == TOP_K, (label, source, got)
+
+        for (g_target, g_score), (e_target, e_score) in zip(got, exp):
+            assert abs(g_score - e_score) < 1e-4, (label, source, got, exp)
+            # ties may swap order, the score at each rank may not
+            if abs(g_score - e_score) > 1e-6:
+                assert g_target == e_target, (label, source, got, exp)
+
+        assert m["best_match"] == got[0][0]
+        assert abs(m["confidence"] - got[0][1]) < 1e-6
+
+
+def main():
+    cfg = QdrantConfig(location=":memory:", collection_name="test_hybrid_columns", vector_size=768)
+
+    info = index_target_columns_multivector(TARGET_SCHEMA, cfg, recreate=True)
+    assert info["indexed_points"] == 6
+
+    res = multivector_dense_match(SOURCE_SCHEMA, cfg, top_k=TOP_K)
+    assert res["method"] == "multivector_dense_qdrant"
+    assert res["match_count"] == 4
+
+    # ----------------------------
+    # every source column has per-method results with recomputed scores
+    # ----------------------------
+    _check(res["minilm"], _expected(MINILM_MODEL_NAME), MINILM_VECTOR)
+    _check(res["mpnet"], _expected(MPNET_MODEL_NAME), MPNET_VECTOR)
+
+    # ----------------------------
+    # multivector + snapshot_dir is rejected before any work
+    # ----------------------------
+    dummy = DBConfig(db_type="postgres", host="localhost", port=5432, database="x", username="x", password="x")
+    try:
+        run_hybrid_mapping(
+            dummy,
+            dummy,
+            qdrant_location=":memory:",
+            index_mode="multivector",
+            snapshot_dir="./snapshot_unused",
+        )
+        raise AssertionError("expected ValueError for multivector + snapshot_dir")
+    except ValueError as e:
+        assert "snapshot_dir" in str(e)
+
+    print("✅ Multivector collection returns exact MiniLM / MPNet top-k per source column")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from schema_matching_toolkit import QdrantConfig
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client
+from schema_matching_toolkit.minilm_dense_matcher import (
+    index_target_schema_to_qdrant,
+    match_source_to_target_dense,
+)
+from schema_matching_toolkit.mpnet_embedding_matcher import mpnet_dense_match
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tbl_emp",
+            "columns": [
+                {"column_name": "emp_id", "data_type": "integer"},
+                {"column_name": "emp_nm", "data_type": "character varying"},
+                {"column_name": "hire_dt", "data_type": "date"},
+                {"column_name": "dept_ref", "data_type": "integer"},
+            ],
+        }
+    ]
+}
+
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "employee",
+            "columns": [
+                {"column_name": "employee_id", "data_type": "integer"},
+                {"column_name": "full_name", "data_type": "text"},
+                {"column_name": "hired_on", "data_type": "date"},
+                {"column_name": "department_id", "data_type": "integer"},
+            ],
+        },
+        {
+            "table_name": "department",
+            "columns": [
+                {"column_name": "department_id", "data_type": "integer"},
+                {"column_name": "department_name", "data_type": "text"},
+            ],
+        },
+    ]
+}
+
+
+def _run(minilm_cfg: QdrantConfig, mpnet_cfg: QdrantConfig):
+    index_target_schema_to_qdrant(TARGET_SCHEMA, minilm_cfg, recreate=True)
+    minilm = match_source_to_target_dense(SOURCE_SCHEMA, minilm_cfg, top_k=3)
+
+    mpnet = mpnet_dense_match(
+        SOURCE_SCHEMA, TARGET_SCHEMA, mpnet_cfg, top_k=3, recreate_index=True
+    )
+
+    return minilm, mpnet
+
+
+def _assert_same(a, b, score_key):
+    assert len(a["matches"]) == len(b["matches"])
+
+    for ma, mb in zip(a["matches"], b["matches"]):
+        assert ma["source"] == mb["source"]
+        assert ma["best_match"] == mb["best_match"], (ma, mb)
+        assert abs(ma[score_key] - mb[score_key]) < 1e-4
+
+
+def _server_available(cfg: QdrantConfig) -> bool:
+    try:
+        get_qdrant_client(cfg).get_collections()
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    server = dict(host="localhost", port=6333)
+    embedded = dict(location=":memory:")
+
+    # ----------------------------
+    # embedded mode on its own (no server process)
+    # ----------------------------
+    embedded_res = _run(
+        QdrantConfig(**embedded, collection_name="test_minilm_local", vector_size=384),
+        QdrantConfig(**embedded, collection_name="test_mpnet_local", vector_size=768),
+    )
+
+    for res in embedded_res:
+        assert len(res["matches"]) == 4
+        assert all(m["best_match"] and m["candidates"] for m in res["matches"])
+
+    print("✅ Embedded Qdrant indexes and matches without a server")
+    for m in embedded_res[0]["matches"]:
+        print(m["source"], "->", m["best_match"], round(m["confidence"], 4))
+
+    # ----------------------------
+    # same matches as a server (only when one is reachable)
+    # ----------------------------
+    server_minilm = QdrantConfig(**server, collection_name="test_minilm_server", vector_size=384)
+    if not _server_available(server_minilm):
+        print("⚠️ No Qdrant server on localhost:6333, skipped the server comparison")
+        return
+
+    server_res = _run(
+        server_minilm,
+        QdrantConfig(**server, collection_name="test_mpnet_server", vector_size=768),
+    )
+
+    _assert_same(server_res[0], embedded_res[0], "confidence")
+    _assert_same(server_res[1], embedded_res[1], "best_score")
+
+    print("✅ Embedded Qdrant returns the same matches as the server")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from schema_matching_toolkit import RerankConfig
+from schema_matching_toolkit.reranker import rerank_column_matches, select_rerank_pairs
+
+
+def _match(source, scores):
+    cands = [{"candidate": f"t.c{i}", "final_score": s} for i, s in enumerate(scores)]
+    return {"source": source, "best_match": cands[0]["candidate"], "confidence": scores[0], "candidates": cands}
+
+
+def main():
+    matches = [
+        _match("s.clear", [0.95, 0.30, 0.20]),     # margin 0.65
+        _match("s.tie", [0.61, 0.60, 0.10]),       # margin 0.01 -> first
+        _match("s.close", [0.70, 0.55, 0.50]),     # margin 0.15 -> second
+        _match("s.single", [0.80]),                # nothing to reorder
+    ]
+
+    pairs, stats = select_rerank_pairs(matches, top_k=3, max_pairs=6)
+    print("Selected:", stats)
+
+    # budget of 6 pairs = the two most ambiguous columns with 3 candidates each
+    assert stats["pairs"] == 6
+    assert {i for i, _ in pairs} == {1, 2}
+    assert stats["columns_skipped"] == 2
+
+    # real cross-encoder: customers.email should win over customers.phone
+    matches = [
+        {
+            "source": "clients.mail_addr",
+            "best_match": "customers.phone",
+            "confidence": 0.52,
+            "candidates": [
+                {"candidate": "customers.phone", "final_score": 0.52},
+                {"candidate": "customers.email", "final_score": 0.51},
+            ],
+        }
+    ]
+    stats = rerank_column_matches(
+        matches,
+        source_texts={"clients.mail_addr": "clients mail_addr varchar client email address"},
+        target_texts={
+            "customers.phone": "customers phone varchar customer phone number",
+            "customers.email": "customers email varchar customer email address",
+        },
+        cfg=RerankConfig(weight=0.7),
+    )
+
+    print("✅ Rerank:", stats)
+    print("Best:", matches[0]["best_match"], matches[0]["confidence"])
+
+    assert matches[0]["reranked"]
+    assert matches[0]["best_match"] == "customers.email"
+    assert all("rerank_score" in c for c in matches[0]["candidates"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from schema_matching_toolkit.common.stage_graph import StageGraph
+
+
+def square_sum(inputs):
+    return sum(i * i for i in range(inputs["n"]))
+
+
+def main():
+    calls = {}
+    lock = threading.Lock()
+
+    def stage(name, seconds, value=None):
+        def run(inputs):
+            with lock:
+                calls[name] = calls.get(name, 0) + 1
+            time.sleep(seconds)
+            return value if value is not None else name
+        return run
+
+    # same shape as run_hybrid_mapping: two extractions, two descriptions, two indexers
+    graph = StageGraph()
+    graph.add("source_schema", stage("source_schema", 0.2))
+    graph.add("target_schema", stage("target_schema", 0.2))
+    graph.add("source_desc", stage("source_desc", 0.2), deps=["source_schema"])
+    graph.add("target_desc", stage("target_desc", 0.2), deps=["target_schema"])
+    graph.add("index_minilm", stage("index_minilm", 0.2), deps=["target_schema"])
+    graph.add("index_mpnet", stage("index_mpnet", 0.2), deps=["target_schema"])
+    graph.add(
+        "match",
+        lambda r: sorted(r),
+        deps=["source_desc", "target_desc", "index_minilm", "index_mpnet"],
+    )
+
+    t0 = time.perf_counter()
+    results, timeline = graph.run(max_threads=4)
+    elapsed = time.perf_counter() - t0
+
+    print(f"✅ Graph done in {elapsed:.2f}s (serial would be 1.2s)")
+    for row in timeline:
+        print(f"  {row['stage']:<14} {row['start_s']:>6.2f} -> {row['end_s']:>6.2f}")
+
+    # every stage exactly once, deps passed by name
+    assert all(n == 1 for n in calls.values()) and len(calls) == 6
+    assert results["match"] == ["index_minilm", "index_mpnet", "source_desc", "target_desc"]
+
+    # extractions overlap, then descriptions + indexers overlap
+    assert elapsed < 0.8
+    rows = {r["stage"]: r for r in timeline}
+    assert rows["index_minilm"]["start_s"] < rows["index_mpnet"]["end_s"]
+    assert rows["match"]["start_s"] >= max(rows[d]["end_s"] for d in ["source_desc", "index_mpnet"])
+
+    # process pool stage
+    graph = StageGraph()
+    graph.add("n", lambda _: 1000)
+    graph.add("cpu", square_sum, deps=["n"], pool="process")
+    results, _ = graph.run(max_threads=2, max_processes=1)
+    assert results["cpu"] == square_sum({"n": 1000})
+
+    # cycles / unknown deps are rejected up front
+    graph = StageGraph().add("a", stage("a", 0), deps=["b"]).add("b", stage("b", 0), deps=["a"])
+    try:
+        graph.run()
+        raise AssertionError("cycle not detected")
+    except ValueError as e:
+        print("✅ Rejected:", e)
+
+    # first failure is re-raised, dependents never run
+    def boom(_):
+        raise RuntimeError("extract failed")
+
+    calls.clear()
+    graph = StageGraph().add("extract", boom).add("describe", stage("describe", 0), deps=["extract"])
+    try:
+        graph.run()
+        raise AssertionError("failure not raised")
+    except RuntimeError:
+        pass
+    assert "describe" not in calls
+
+
+if __name__ == "__main__":
+    main()
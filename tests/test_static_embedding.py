@@ -0,0 +1,203 @@
+import zlib
+
+import numpy as np
+
+from schema_matching_toolkit import QdrantConfig
+from schema_matching_toolkit.hybrid_ensemble_matcher.matcher import hybrid_ensemble_match
+from schema_matching_toolkit.minilm_dense_matcher.indexer import index_target_schema_to_qdrant
+from schema_matching_toolkit.mpnet_embedding_matcher.indexer import index_target_columns_mpnet
+from schema_matching_toolkit.static_embedding_matcher import (
+    StaticEmbeddingTable,
+    encode_static,
+    static_dense_match,
+)
+from schema_matching_toolkit.utils.type_family import type_family
+from schema_matching_toolkit.utils.vector_search import normalize_rows, topk_cosine
+
+
+VOCAB = ["src", "tgt", "customer", "id", "integer", "email", "text", "name", "address"]
+N_BUCKETS = 64
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "src",
+            "columns": [
+                {"column_name": "customer_id", "data_type": "integer"},
+                {"column_name": "email", "data_type": "text"},
+            ],
+        }
+    ]
+}
+
+# one-hot token vectors -> cosine = shared tokens / sqrt(len_a * len_b)
+#   src.customer_id -> tgt.customer_id 0.75, tgt.customer_name 0.25
+#   src.email       -> tgt.email 0.6667, tgt.email_address 0.5774 (margin 0.0893)
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tgt",
+            "columns": [
+                {"column_name": "customer_id", "data_type": "integer"},
+                {"column_name": "customer_name", "data_type": "text"},
+                {"column_name": "email", "data_type": "text"},
+                {"column_name": "email_address", "data_type": "text"},
+            ],
+        }
+    ]
+}
+
+
+def _table() -> StaticEmbeddingTable:
+    rng = np.random.default_rng(7)
+    return StaticEmbeddingTable(
+        vocab={t: i for i, t in enumerate(VOCAB)},
+        vectors=np.eye(len(VOCAB), dtype=np.float32),
+        ngram_vectors=normalize_rows(rng.standard_normal((N_BUCKETS, len(VOCAB)))),
+    )
+
+
+def _trigram_mean(table: StaticEmbeddingTable, token: str) -> np.ndarray:
+    padded = f"<{token}>"
+    buckets = [zlib.crc32(padded[i : i + 3].encode("utf-8")) % N_BUCKETS for i in range(len(padded) - 2)]
+    return table.ngram_vectors[buckets].mean(axis=0)
+
+
+def _unit(v: np.ndarray) -> np.ndarray:
+    return v / np.linalg.norm(v)
+
+
+def test_encode_static(table: StaticEmbeddingTable):
+    vecs = encode_static(["customer id", "qqzx", "customer qqzx", ""], table)
+    assert vecs.shape == (4, len(VOCAB)) and vecs.dtype == np.float32
+
+    e = np.eye(len(VOCAB), dtype=np.float32)
+    customer, ident = e[VOCAB.index("customer")], e[VOCAB.index("id")]
+
+    # in-vocab tokens -> mean of their rows
+    assert np.allclose(vecs[0], _unit(customer + ident), atol=1e-6)
+
+    # OOV token -> mean of its hashed char-trigram vectors
+    assert np.allclose(vecs[1], _unit(_trigram_mean(table, "qqzx")), atol=1e-6)
+
+    # mixed -> OOV trigrams weighted by oov_weight in total
+    assert np.allclose(vecs[2], _unit(customer + table.oov_weight * _trigram_mean(table, "qqzx")), atol=1e-6)
+
+    # no tokens -> zero vector
+    assert not vecs[3].any()
+
+    # cached row lookups give identical vectors
+    assert np.array_equal(encode_static(["qqzx"], table)[0], vecs[1])
+
+
+def test_topk_family_mask(table: StaticEmbeddingTable):
+    queries = encode_static(["src customer id integer", "src customer"], table)
+    targets = encode_static(
+        ["tgt customer name text", "tgt customer id integer", "tgt email text"], table
+    )
+    target_families = [type_family(t) for t in ["text", "integer", "text"]]
+
+    # unmasked: text column customer_name is a candidate for the integer source
+    idx, _ = topk_cosine(queries, targets, 3)
+    assert 0 in idx[0]
+
+    idx, scores = topk_cosine(
+        queries,
+        targets,
+        3,
+        query_families=[type_family("integer"), type_family("")],
+        target_families=target_families,
+    )
+
+    # numeric source -> only the numeric target, missing slots are -1 / -inf
+    assert idx[0].tolist() == [1, -1, -1]
+    assert abs(scores[0][0] - 0.75) < 1e-6
+    assert np.isneginf(scores[0][1:]).all()
+
+    # unknown source family -> every target allowed
+    assert sorted(idx[1].tolist()) == [0, 1, 2]
+
+    # same mask through the matcher
+    res = static_dense_match(SOURCE_SCHEMA, TARGET_SCHEMA, table, top_k=4, type_filter=True)
+    by_source = {m["source"]: m for m in res["matches"]}
+    assert [c["target"] for c in by_source["src.customer_id"]["candidates"]] == ["tgt.customer_id"]
+    assert all(c["data_type"] == "text" for c in by_source["src.email"]["candidates"])
+
+
+def test_cascade_all_resolved(table: StaticEmbeddingTable):
+    # every column passes -> BM25 / MiniLM / MPNet never run (no Qdrant configs)
+    out = hybrid_ensemble_match(
+        SOURCE_SCHEMA,
+        TARGET_SCHEMA,
+        qdrant_cfg_minilm=None,
+        qdrant_cfg_mpnet=None,
+        include_table_matches=False,
+        static_table=table,
+        static_cascade_threshold=0.6,
+        static_cascade_margin=0.05,
+    )
+
+    assert out["static_cascade_count"] == 2
+    by_source = {m["source"]: m for m in out["column_matches"]}
+    assert by_source["src.customer_id"]["best_match"] == "tgt.customer_id"
+    assert by_source["src.customer_id"]["confidence"] == 0.75
+    assert by_source["src.email"]["best_match"] == "tgt.email"
+    assert by_source["src.email"]["confidence"] == 0.6667
+    assert all(m["match_source"] == "static_cascade" for m in out["column_matches"])
+
+    # cascaded matches still honour min_confidence
+    out = hybrid_ensemble_match(
+        SOURCE_SCHEMA,
+        TARGET_SCHEMA,
+        qdrant_cfg_minilm=None,
+        qdrant_cfg_mpnet=None,
+        include_table_matches=False,
+        min_confidence=0.7,
+        static_table=table,
+        static_cascade_threshold=0.6,
+    )
+    assert out["static_cascade_count"] == 2
+    assert [m["source"] for m in out["column_matches"]] == ["src.customer_id"]
+
+
+def test_cascade_fall_through(table: StaticEmbeddingTable):
+    minilm_cfg = QdrantConfig(location=":memory:", collection_name="test_static_minilm", vector_size=384)
+    mpnet_cfg = QdrantConfig(location=":memory:", collection_name="test_static_mpnet", vector_size=768)
+    index_target_schema_to_qdrant(TARGET_SCHEMA, minilm_cfg, recreate=True)
+    index_target_columns_mpnet(TARGET_SCHEMA, mpnet_cfg, recreate=True)
+
+    def run(threshold: float, margin: float):
+        out = hybrid_ensemble_match(
+            SOURCE_SCHEMA,
+            TARGET_SCHEMA,
+            qdrant_cfg_minilm=minilm_cfg,
+            qdrant_cfg_mpnet=mpnet_cfg,
+            include_table_matches=False,
+            static_table=table,
+            static_cascade_threshold=threshold,
+            static_cascade_margin=margin,
+        )
+        return out["static_cascade_count"], {m["source"]: m["match_source"] for m in out["column_matches"]}
+
+    expected = {"src.customer_id": "static_cascade", "src.email": "ensemble"}
+
+    # email top-1 0.6667 below threshold -> retrievers
+    assert run(0.7, 0.05) == (1, expected)
+
+    # email margin 0.0893 below required margin -> retrievers
+    assert run(0.6, 0.1) == (1, expected)
+
+
+def main():
+    table = _table()
+
+    test_encode_static(table)
+    test_topk_family_mask(table)
+    test_cascade_all_resolved(table)
+    test_cascade_fall_through(table)
+
+    print("✅ Static embeddings: OOV trigrams, type-family mask, cascade threshold / margin")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from schema_matching_toolkit.hybrid_ensemble_matcher.table_mapper import (
+    build_table_matches,
+    build_table_score_matrix,
+)
+
+
+def _m(source, cands):
+    return {
+        "source": source,
+        "best_match": cands[0][0],
+        "confidence": cands[0][1],
+        "candidates": [{"candidate": t, "final_score": s} for t, s in cands],
+    }
+
+
+COLUMN_MATCHES = [
+    # tbl_emp: best_match votes are split, but employee holds strong
+    # second candidates for every column
+    _m("tbl_emp.emp_id", [("department.department_id", 0.81), ("employee.employee_id", 0.80)]),
+    _m("tbl_emp.emp_nm", [("employee.full_name", 0.75), ("department.department_name", 0.40)]),
+    _m("tbl_emp.hire_dt", [("employee.hired_on", 0.70)]),
+    _m("tbl_dept.dept_id", [("department.department_id", 0.90), ("employee.department_id", 0.60)]),
+    _m("tbl_dept.dept_nm", [("department.department_name", 0.85)]),
+]
+
+
+def main():
+    matrix = build_table_score_matrix(COLUMN_MATCHES, pooling="mean_row_max")
+    dense = matrix.to_dense()
+    print("Tables:", matrix.source_tables, "x", matrix.target_tables)
+    print(dense)
+
+    s = matrix.source_tables.index("tbl_emp")
+    t_emp, t_dept = matrix.target_tables.index("employee"), matrix.target_tables.index("department")
+
+    # (0.80 + 0.75 + 0.70) / 3 vs (0.81 + 0.40) / 3
+    assert abs(dense[s, t_emp] - 0.75) < 1e-4
+    assert dense[s, t_emp] > dense[s, t_dept]
+
+    for pooling in ("max_sum", "mean_row_max", "coverage_weighted"):
+        res = build_table_matches(COLUMN_MATCHES, pooling=pooling)
+        best = {t["source_table"]: t["best_match_table"] for t in res["table_matches"]}
+        print("✅", pooling, best)
+        assert best == {"tbl_emp": "employee", "tbl_dept": "department"}
+
+    # top_k keeps both target tables per source table
+    res = build_table_matches(COLUMN_MATCHES, selection="top_k", k=2)
+    assert all(len(t["candidates"]) == 2 for t in res["table_matches"])
+
+    # one-to-one: each target table used once
+    res = build_table_matches(COLUMN_MATCHES, selection="greedy")
+    targets = [t["best_match_table"] for t in res["table_matches"]]
+    assert len(targets) == len(set(targets)) == 2
+
+    # more source tables than target tables: unassigned ones are kept
+    crowded = [
+        _m("a.id", [("t.id", 0.9)]),
+        _m("b.id", [("t.id", 0.8)]),
+        _m("c.id", [("t.id", 0.7)]),
+    ]
+    for selection in ("greedy", "optimal"):
+        res = build_table_matches(crowded, selection=selection)
+        best = {t["source_table"]: t["best_match_table"] for t in res["table_matches"]}
+        print("✅", selection, best)
+        assert best == {"a": "t", "b": None, "c": None}
+        assert res["table_match_count"] == 3
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import time
+
+from schema_matching_toolkit import bm25_match, load_target_bundle
+from schema_matching_toolkit.hybrid_ensemble_matcher.matcher import hybrid_ensemble_match
+from schema_matching_toolkit.target_bundle import (
+    bundle_bm25_match,
+    bundle_dense_match,
+    write_target_bundle,
+)
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "tbl_cust",
+            "columns": [
+                {"column_name": "cust_id", "data_type": "integer"},
+                {"column_name": "cust_name", "data_type": "varchar"},
+                {"column_name": "created_at", "data_type": "timestamp"},
+            ],
+        }
+    ]
+}
+
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "customer",
+            "columns": [
+                {"column_name": "customer_id", "data_type": "integer"},
+                {"column_name": "customer_name", "data_type": "text"},
+                {"column_name": "created_at", "data_type": "timestamp"},
+            ],
+        },
+        {
+            "table_name": "orders",
+            "columns": [
+                {"column_name": "order_id", "data_type": "integer"},
+                {"column_name": "customer_id", "data_type": "integer"},
+                {"column_name": "created_at", "data_type": "timestamp"},
+            ],
+        },
+    ]
+}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "target.smtb")
+
+        info = write_target_bundle(TARGET_SCHEMA, path, models=("minilm",))
+        print("✅ Bundle written:", info["columns"], "columns,", info["bytes"], "bytes")
+
+        t0 = time.perf_counter()
+        bundle = load_target_bundle(path)
+        print(f"✅ Bundle loaded in {(time.perf_counter() - t0) * 1000:.2f} ms")
+
+        assert bundle.fingerprint == info["fingerprint"]
+        assert bundle.vectors("minilm").shape == (6, 384)
+
+        # BM25 from stored postings == BM25Okapi on the fly
+        expected = bm25_match(SOURCE_SCHEMA, TARGET_SCHEMA, type_filter=True)
+        got = bundle_bm25_match(SOURCE_SCHEMA, bundle, type_filter=True)
+        for a, b in zip(expected["matches"], got["matches"]):
+            print(a["source"], "->", b["best_match"])
+            assert a["best_match"] == b["best_match"]
+
+        dense = bundle_dense_match(SOURCE_SCHEMA, bundle, model_key="minilm", top_k=3)
+        for m in dense["matches"]:
+            print(m["source"], "->", m["best_match"], round(m["confidence"], 3))
+
+        assert dense["matches"][0]["best_match"].endswith("customer_id")
+
+        # MiniLM-only bundle: hybrid fusion uses BM25 + MiniLM (weights rescaled)
+        hybrid = hybrid_ensemble_match(
+            SOURCE_SCHEMA,
+            bundle.schema,
+            qdrant_cfg_minilm=None,
+            qdrant_cfg_mpnet=None,
+            target_bundle=bundle,
+            include_table_matches=False,
+        )
+        assert set(hybrid["encode_stats"]) == {"minilm"}
+        assert hybrid["column_match_count"] == len(dense["matches"])
+        top = hybrid["column_matches"][0]["candidates"][0]
+        assert top["mpnet_score"] == 0.0 and top["final_score"] <= 1.0
+        print("✅ MiniLM-only bundle fused without MPNet")
+
+
+if __name__ == "__main__":
+    main()
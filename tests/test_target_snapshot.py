@@ -0,0 +1,143 @@
+import os
+import tempfile
+
+from qdrant_client.models import PointStruct
+
+from schema_matching_toolkit import QdrantConfig
+from schema_matching_toolkit.common.qdrant_utils import get_qdrant_client, recreate_vector_collection
+from schema_matching_toolkit.target_snapshot import (
+    export_target_snapshot,
+    load_snapshot_manifest,
+    restore_target_snapshot,
+    snapshot_matches,
+)
+from schema_matching_toolkit.utils.fingerprint import schema_fingerprint
+
+
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "employee",
+            "columns": [
+                {"column_name": "employee_id", "data_type": "integer"},
+                {"column_name": "full_name", "data_type": "text"},
+                {"column_name": "hired_on", "data_type": "date"},
+            ],
+        }
+    ]
+}
+
+MODEL_NAMES = {
+    "minilm": "sentence-transformers/all-MiniLM-L6-v2",
+    "mpnet": "sentence-transformers/all-mpnet-base-v2",
+}
+
+
+def _vector(seed: int, size: int):
+    # deterministic, non-zero vectors (no model download needed)
+    return [((seed * 31 + i * 7) % 97 + 1) / 97.0 for i in range(size)]
+
+
+def _fill(cfg: QdrantConfig, count: int):
+    client = get_qdrant_client(cfg)
+    recreate_vector_collection(client, cfg)
+
+    points = [
+        PointStruct(
+            id=i,
+            vector={cfg.vector_name: _vector(i, cfg.vector_size)},
+            payload={"column_id": f"employee.col_{i}", "type_family": "numeric" if i % 2 else "text"},
+        )
+        for i in range(count)
+    ]
+    client.upsert(collection_name=cfg.collection_name, points=points)
+
+
+def _read_points(cfg: QdrantConfig):
+    points, _ = get_qdrant_client(cfg).scroll(
+        collection_name=cfg.collection_name,
+        limit=1000,
+        with_payload=True,
+        with_vectors=False,
+    )
+    return {p.id: p.payload for p in points}
+
+
+def main():
+    mem = dict(location=":memory:")
+    src = {
+        "minilm": QdrantConfig(**mem, collection_name="snap_src_minilm", vector_size=384),
+        "mpnet": QdrantConfig(**mem, collection_name="snap_src_mpnet", vector_size=768),
+    }
+    dst = {
+        "minilm": QdrantConfig(**mem, collection_name="snap_dst_minilm", vector_size=384),
+        "mpnet": QdrantConfig(**mem, collection_name="snap_dst_mpnet", vector_size=768),
+    }
+
+    _fill(src["minilm"], 7)
+    _fill(src["mpnet"], 5)
+
+    fingerprint = schema_fingerprint(TARGET_SCHEMA)
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        # ----------------------------
+        # export -> files + manifest
+        # ----------------------------
+        manifest = export_target_snapshot(snapshot_dir, src, fingerprint, MODEL_NAMES, batch_size=3)
+
+        assert os.path.exists(os.path.join(snapshot_dir, "manifest.json"))
+        assert manifest["collections"]["minilm"]["point_count"] == 7
+        assert manifest["collections"]["mpnet"]["point_count"] == 5
+        assert load_snapshot_manifest(snapshot_dir) == manifest
+
+        # ----------------------------
+        # restore under different names
+        # ----------------------------
+        restored = restore_target_snapshot(snapshot_dir, dst, fingerprint=fingerprint)
+
+        assert restored["fingerprint"] == fingerprint
+        assert restored["collections"]["minilm"] == {"collection": "snap_dst_minilm", "indexed_points": 7}
+        assert restored["collections"]["mpnet"] == {"collection": "snap_dst_mpnet", "indexed_points": 5}
+
+        for key in ("minilm", "mpnet"):
+            client = get_qdrant_client(dst[key])
+            assert client.count(collection_name=dst[key].collection_name).count == \
+                client.count(collection_name=src[key].collection_name).count
+            assert _read_points(dst[key]) == _read_points(src[key])
+
+        # vectors survive the round trip (cosine -> same ranking for a query)
+        query = _vector(3, 384)
+        hits_src = get_qdrant_client(src["minilm"]).query_points(
+            collection_name="snap_src_minilm", query=query, using=src["minilm"].vector_name, limit=3
+        ).points
+        hits_dst = get_qdrant_client(dst["minilm"]).query_points(
+            collection_name="snap_dst_minilm", query=query, using=dst["minilm"].vector_name, limit=3
+        ).points
+        assert [h.id for h in hits_src] == [h.id for h in hits_dst]
+        assert hits_dst[0].id == 3
+
+        # ----------------------------
+        # snapshot_matches
+        # ----------------------------
+        assert snapshot_matches(manifest, fingerprint, MODEL_NAMES)
+
+        other_schema = {"tables": [{"table_name": "dept", "columns": [{"column_name": "id", "data_type": "integer"}]}]}
+        assert not snapshot_matches(manifest, schema_fingerprint(other_schema), MODEL_NAMES)
+        assert not snapshot_matches(manifest, fingerprint, {**MODEL_NAMES, "mpnet": "some/other-model"})
+        assert not snapshot_matches(manifest, fingerprint, {**MODEL_NAMES, "bge": "BAAI/bge-small"})
+        assert not snapshot_matches(None, fingerprint, MODEL_NAMES)
+
+        # ----------------------------
+        # restore refuses a different target
+        # ----------------------------
+        try:
+            restore_target_snapshot(snapshot_dir, dst, fingerprint=schema_fingerprint(other_schema))
+            raise AssertionError("expected ValueError for fingerprint mismatch")
+        except ValueError:
+            pass
+
+    print("✅ Snapshot export/restore round trip keeps points, payloads and vectors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from schema_matching_toolkit import TelemetryConfig, configure_telemetry, telemetry_snapshot
+from schema_matching_toolkit.common.stage_graph import StageGraph
+from schema_matching_toolkit.telemetry import (
+    counter,
+    disable_telemetry,
+    flush_telemetry,
+    histogram,
+    reset_telemetry,
+    span,
+    timer,
+    traced,
+)
+
+
+@traced()
+def profile_like(tables):
+    for t in tables:
+        with span("profile_schema.table", table=t) as sp:
+            with timer("profile_schema.sql_seconds"):
+                time.sleep(0.01)
+            sp.set_attribute("columns", 3)
+            counter("profile_schema.columns", 3)
+
+
+@traced("describe")
+async def describe_like():
+    await asyncio.sleep(0.01)
+    raise RuntimeError("groq down")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = os.path.join(tmp, "telemetry.jsonl")
+        memory, _ = configure_telemetry(TelemetryConfig(jsonl_path=jsonl))
+        reset_telemetry()
+
+        # sync entry point + per-table spans
+        profile_like(["orders", "customers"])
+
+        # async entry point, failure recorded on the span
+        try:
+            asyncio.run(describe_like())
+        except RuntimeError:
+            pass
+
+        # thread-pool stages nest under the caller's span
+        with span("run_hybrid_mapping"):
+            graph = StageGraph()
+            graph.add("a", lambda _: histogram("encode.batch_size", 64) or 1)
+            graph.add("b", lambda r: r["a"] + 1, deps=["a"])
+            graph.run(max_threads=2)
+
+        spans = {s["name"]: s for s in memory.spans()}
+        tables = memory.spans("profile_schema.table")
+        print("✅ Spans:", [(s["name"], s["count"]) for s in memory.span_summary()])
+
+        assert len(tables) == 2 and tables[0]["attributes"] == {"table": "orders", "columns": 3}
+        assert all(t["parent_id"] == spans["profile_like"]["span_id"] for t in tables)
+        assert tables[0]["trace_id"] == spans["profile_like"]["trace_id"]
+
+        assert spans["describe"]["status"] == "error" and "groq down" in spans["describe"]["error"]
+        assert spans["stage.b"]["parent_id"] == spans["run_hybrid_mapping"]["span_id"]
+
+        snap = flush_telemetry()
+        counters = {c["name"]: c["value"] for c in snap["counters"]}
+        hists = {(h["name"], h["attributes"].get("span")): h for h in snap["histograms"]}
+        assert counters["profile_schema.columns"] == 6
+        assert hists[("profile_schema.sql_seconds", None)]["count"] == 2
+        assert hists[("span.seconds", "profile_schema.table")]["min"] >= 0.01
+
+        # JSON lines: one line per span + the metrics snapshot
+        disable_telemetry()
+        with open(jsonl) as f:
+            lines = [json.loads(line) for line in f]
+        assert sum(r["type"] == "span" for r in lines) == len(memory.spans())
+        assert lines[-1]["type"] == "metrics"
+
+    # disabled: nothing recorded, no-op objects only
+    reset_telemetry()
+    n = 200_000
+    t0 = time.perf_counter()
+    for i in range(n):
+        with span("hot", i=i):
+            counter("hot.items")
+    per_call_ns = (time.perf_counter() - t0) / n * 1e9
+    print(f"✅ Disabled overhead: {per_call_ns:.0f} ns per span+counter")
+
+    assert telemetry_snapshot() == {"enabled": False, "counters": [], "histograms": []}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from schema_matching_toolkit import bm25_match
+from schema_matching_toolkit.utils.type_family import (
+    compatible_families,
+    family_masks,
+    type_family,
+    type_family_mask,
+    types_compatible,
+)
+
+
+SOURCE_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "orders",
+            "columns": [
+                {"column_name": "order_date", "data_type": "timestamp without time zone"},
+                {"column_name": "order_status", "data_type": "varchar(20)"},
+            ],
+        }
+    ]
+}
+
+# the only textual overlap for order_status is an integer column
+TARGET_SCHEMA = {
+    "tables": [
+        {
+            "table_name": "sales_order",
+            "columns": [
+                {"column_name": "order_date", "data_type": "date"},
+                {"column_name": "order_status", "data_type": "integer"},
+                {"column_name": "amount", "data_type": "numeric(12,2)"},
+            ],
+        }
+    ]
+}
+
+
+def main():
+    # dialect types -> canonical families
+    assert type_family("TIMESTAMP(6) WITH TIME ZONE") == "datetime"
+    assert type_family("character varying(255)") == "text"
+    assert type_family("NUMBER(10,2)") == "numeric"
+    assert type_family("bit") == "boolean"
+    assert type_family("") == "unknown"
+
+    assert types_compatible("int4", "bigint")
+    assert not types_compatible("varchar", "integer")
+    assert types_compatible("mystery_type", "integer")  # unknown matches anything
+    assert "unknown" in compatible_families("numeric")
+
+    # unrecognised target types stay searchable
+    assert type_family_mask("text", ["varchar", "int", "geometry_ext"]) == [True, False, True]
+
+    # batched masks (targets classified once) agree with type_family_mask
+    targets = ["varchar", "int", "geometry_ext", "date", "bool"]
+    masks = family_masks(targets)
+    precomputed = family_masks(families=[type_family(t) for t in targets])
+    for src in ["text", "bigint", "timestamp", "bit", "mystery_type"]:
+        assert masks(src).tolist() == type_family_mask(src, targets), src
+        assert precomputed(src).tolist() == type_family_mask(src, targets), src
+
+    # BM25: without the filter the integer column wins on names alone
+    plain = {m["source"]: m["best_match"] for m in bm25_match(SOURCE_SCHEMA, TARGET_SCHEMA)["matches"]}
+    assert plain["orders.order_status"] == "sales_order.order_status"
+
+    # with the filter an incompatible target is never returned as best_match
+    res = bm25_match(SOURCE_SCHEMA, TARGET_SCHEMA, type_filter=True)
+    filtered = {m["source"]: m for m in res["matches"]}
+    print("✅ Type-filtered BM25:", filtered)
+
+    assert filtered["orders.order_date"]["best_match"] == "sales_order.order_date"
+    assert filtered["orders.order_status"]["best_match"] is None
+    assert filtered["orders.order_status"]["score"] == 0.0
+
+
+if __name__ == "__main__":
+    main()